@@ -12,7 +12,7 @@ import datetime
 
 
 from grpc import RpcError
-from grpc_client import LoaderClient
+from grpc_client import LoaderClient, NoResultsError
 from filemgmt.filehandler import FileHandler
 from filemgmt.json_hr import JSONHandler
 from filemgmt.csv import CSVHandler
@@ -65,14 +65,16 @@ def media(media_id, media_uri): # type: ignore
 @click.option("-ft", "--file_type", "file_type", type=int, default=-1, help="File type filter (default: all)")
 def medias(file_type): # type: ignore
     """List and filter medias. Use [-tp] to filter results with a specific file type (1 = Images, 2 = Videos, 3 = Audio, 4 = Other)"""
+    # The results are streamed lazily, so the errors are raised while iterating
     try:
-        response_iterator = client.get_medias(file_type)
+        for response in client.get_medias(file_type, not_found=True):
+            click.echo(response)
     except RpcError as e:
         return click.echo(f"Grpc error: {e.details()}")
-    for response in response_iterator:
-        if response.HasField("error"):
-            click.echo(f"\tGrpc error: {response.error.message}")
-        click.echo(response)
+    except NoResultsError:
+        return click.echo("No results were fetched")
+    except Exception as e:
+        return click.echo(f"\tGrpc error: {e}")
 
 
 @get.command()
@@ -130,15 +132,16 @@ def tag(id): # type: ignore
 @click.option("-ts", "--tagset", "tagset_id", type=int, default=-1, help="Tagset filter (default: all)")
 def tags(tagtype_id, tagset_id): # type: ignore
     """List and filter tags. Use [-tp] to filter results with a specific tag type or [-ts] for a specific tagset."""
+    # The results are streamed lazily, so the errors are raised while iterating
     try:
-        response_iterator = client.get_tags(tagtype_id=tagtype_id, tagset_id=tagset_id)
+        for response in client.get_tags(tagtype_id=tagtype_id, tagset_id=tagset_id, not_found=True):
+            click.echo(response)
     except RpcError as e:
         return click.echo(f"Grpc error: {e.details()}")
-    for response in response_iterator:
-        if response.HasField("error"):
-            click.echo(f"\tGrpc error: {response.error.message}")
-        else:
-            click.echo(response)
+    except NoResultsError:
+        return click.echo("No results were fetched")
+    except Exception as e:
+        return click.echo(f"\tGrpc error: {e}")
 
 
 @get.command()
@@ -172,15 +175,16 @@ def tags_of_media(media_id): # type: ignore
 @get.command()
 def taggings():
     """List all taggings."""
+    # The results are streamed lazily, so the errors are raised while iterating
     try:
-        response_iterator = client.get_taggings()
+        for response in client.get_taggings(not_found=True):
+            click.echo(response)
     except RpcError as e:
         return click.echo(f"Grpc error: {e.details()}")
-    for response in response_iterator:
-        if response.HasField("error"):
-            click.echo(f"\tGrpc error: {response.error.message}")
-        else:
-            click.echo(response)
+    except NoResultsError:
+        return click.echo("No results were fetched")
+    except Exception as e:
+        return click.echo(f"\tGrpc error: {e}")
 @get.command()
 @click.argument("id", type=int)
 def hierarchy(id): # type: ignore
@@ -229,15 +233,16 @@ def node(id): # type: ignore
 @click.option("-p", "--parent", "parentnode_id", type=int, default=-1, help="Parent node filter (default: all)")
 def nodes(hierarchy_id, tag_id, parentnode_id):
     """List and filter nodes. Use [-h], [-t] and [-p] to filter on hierarchy, tag or parent node respectively."""
+    # The results are streamed lazily, so the errors are raised while iterating
     try:
-        response_iterator = client.get_nodes(hierarchy_id, tag_id, parentnode_id)
+        for response in client.get_nodes(hierarchy_id, tag_id, parentnode_id, not_found=True):
+            click.echo(response)
     except RpcError as e:
         return click.echo(f"Grpc error: {e.details()}")
-    for response in response_iterator:
-        if response.HasField("error"):
-            click.echo(f"\tGrpc error: {response.error.message}")
-        else:
-            click.echo(response)
+    except NoResultsError:
+        return click.echo("No results were fetched")
+    except Exception as e:
+        return click.echo(f"\tGrpc error: {e}")
 
 #!================ ADD functions ======================================================================
 @cli.group()
@@ -268,17 +273,14 @@ def media(path): # type: ignore
     help="File formats to include (default: jpg, png, bmp, mp3, wav, flac, mp4, avi)",
 )
 def medias(path, formats): # type: ignore
-    """Add a multiple files from a specified directory to the database. Be careful, the same file location cannot be added twice to the database."""
+    """Add a multiple files from a specified directory to the database. The file locations already in the database are skipped."""
     if os.path.isdir(path):
+        # add_dir yields the messages to print, the errors of the batches being warnings
         try:
-            response_iterator = client.add_dir(path, formats)
+            for response in client.add_dir(path, formats):
+                click.echo(response)
         except RpcError as e:
             return click.echo(f"Grpc error: {e.details()}")
-        for response in response_iterator:
-            if response.HasField("error"):
-                click.echo(f"\tGrpc error: {response.error.message}")
-            else:
-                click.echo(response)
     else:
         click.echo("Error: invalid path provided.")
 
@@ -476,10 +478,11 @@ def export_command(format, path):
 
 @cli.command()
 @click.argument("path", type=click.Path(exists=True))
-def import_fast(path):
+@click.option("--bulk-load", "bulk_load", is_flag=True, help="Validate each batch once instead of row by row (needs a superuser connection on the server)")
+def import_fast(path, bulk_load):
     """Add tagsets, objects and tags from a setup file in the selected format."""
     if os.path.isfile(path) & path.lower().endswith('json'):
-        fileHandler = FastJSONHandler()
+        fileHandler = FastJSONHandler(bulk_load)
         fileHandler.importFile(path)
     else:
         click.echo("Error: invalid file path or format.")
@@ -519,5 +522,52 @@ def reset():
             return click.echo(f"Grpc error: {e.details()}")
 
 
+
+@cli.command()
+def refresh():
+    """Refresh the materialisations of the database (nodes_taggings, tagsets_taggings), or create them"""
+    try:
+        response = client.refresh_views()
+        click.echo(f"Refreshed in {response.duration:.3f}s: {response.inserted} rows inserted, {response.deleted} deleted")
+    except RpcError as e:
+        return click.echo(f"Grpc error: {e.details()}")
+
+
+@cli.command()
+def stats():
+    """Show the calls, errors, latencies and rows of each RPC since the server started"""
+    try:
+        response = client.get_server_stats()
+    except RpcError as e:
+        return click.echo(f"Grpc error: {e.details()}")
+    click.echo(f"Uptime: {response.uptime:.0f}s")
+    click.echo(f"{'RPC':<24}{'calls':>8}{'errors':>8}{'active':>8}{'p50 (s)':>10}{'p95 (s)':>10}{'p99 (s)':>10}"
+               f"{'total (s)':>11}{'received':>10}{'sent':>10}{'rejected':>10}")
+    for rpc in response.rpcs:
+        click.echo(f"{rpc.method:<24}{rpc.calls:>8}{rpc.errors:>8}{rpc.inFlight:>8}{rpc.p50:>10.4f}{rpc.p95:>10.4f}"
+                   f"{rpc.p99:>10.4f}{rpc.totalSeconds:>11.3f}{rpc.rowsReceived:>10}{rpc.rowsSent:>10}{rpc.rowsRejected:>10}")
+
+
+@cli.command()
+@click.option("-d", "--duration", "duration", type=float, default=10.0, help="Seconds to profile the server for")
+@click.option("-m", "--memory", "memory", is_flag=True, help="Trace the memory allocations instead of sampling the stacks")
+@click.option("-n", "--top", "top", type=int, default=20, help="Number of entries to show")
+def profile(duration, memory, top):
+    """Profile the server while it handles other requests, the profile is written on the server"""
+    try:
+        response = client.profile(duration, memory, top=top)
+    except RpcError as e:
+        return click.echo(f"Grpc error: {e.details()}")
+    click.echo(f"Profile written to {response.path}")
+    if memory:
+        click.echo(f"{'blocks':>10}{'size (kB)':>12}  location")
+        for entry in response.entries:
+            click.echo(f"{entry.count:>10}{entry.total / 1024:>12.1f}  {entry.location}")
+    else:
+        click.echo(f"{response.samples} samples")
+        click.echo(f"{'self':>8}{'total':>8}  function")
+        for entry in response.entries:
+            click.echo(f"{entry.count:>8}{entry.total:>8}  {entry.location}")
+
 if __name__ == "__main__":
     cli(obj={})
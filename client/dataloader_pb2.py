@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.rpc import status_pb2 as google_dot_rpc_dot_status__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x64\x61taloader.proto\x12\ndataloader\x1a\x17google/rpc/status.proto\"\x07\n\x05\x45mpty\"\x17\n\tIdRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\x18\n\nIdResponse\x12\n\n\x02id\x18\x01 \x01(\x03\"!\n\x12RepeatedIdResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x03\"O\n\x05Media\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x10\n\x08\x66ile_uri\x18\x02 \x01(\t\x12\x11\n\tfile_type\x18\x03 \x01(\x03\x12\x15\n\rthumbnail_uri\x18\x04 \x01(\t\"%\n\x10GetMediasRequest\x12\x11\n\tfile_type\x18\x01 \x01(\x03\"(\n\x14GetMediaByURIRequest\x12\x10\n\x08\x66ile_uri\x18\x01 \x01(\t\"l\n\x16StreamingMediaResponse\x12\"\n\x05media\x18\x01 \x01(\x0b\x32\x11.dataloader.MediaH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\\\n\x19\x43reateMediaStreamResponse\x12\x0f\n\x05\x63ount\x18\x01 \x01(\x03H\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"5\n\x06TagSet\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\"&\n\x11GetTagSetsRequest\x12\x11\n\ttagTypeId\x18\x01 \x01(\x03\"&\n\x16GetTagSetRequestByName\x12\x0c\n\x04name\x18\x01 \x01(\t\"6\n\x13\x43reateTagSetRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttagTypeId\x18\x02 \x01(\x03\"o\n\x17StreamingTagSetResponse\x12$\n\x06tagset\x18\x01 \x01(\x0b\x32\x12.dataloader.TagSetH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xaa\x02\n\x03Tag\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"$\n\x13\x41lphanumericalValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1f\n\x0eNumericalValue\x12\r\n\x05value\x18\x01 \x01(\x03\"\x1a\n\tDateValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1a\n\tTimeValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1f\n\x0eTimeStampValue\x12\r\n\x05value\x18\x01 \x01(\t\"5\n\x0eGetTagsRequest\x12\x10\n\x08tagSetId\x18\x01 \x01(\x03\x12\x11\n\ttagTypeId\x18\x02 \x01(\x03\"\xab\x02\n\x10\x43reateTagRequest\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"f\n\x14StreamingTagResponse\x12\x1e\n\x03tag\x18\x01 \x01(\x0b\x32\x0f.dataloader.TagH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xc0\x02\n\x16\x43reateTagStreamRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"\x9e\x01\n\x17\x43reateTagStreamResponse\x12>\n\x06id_map\x18\x01 \x03(\x0b\x32..dataloader.CreateTagStreamResponse.IdMapEntry\x12\x15\n\rerror_message\x18\x02 \x01(\t\x1a,\n\nIdMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\")\n\x07Tagging\x12\x0f\n\x07mediaId\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\"6\n\x14\x43reateTaggingRequest\x12\x0f\n\x07mediaId\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\"r\n\x18StreamingTaggingResponse\x12&\n\x07tagging\x18\x01 \x01(\x0b\x32\x13.dataloader.TaggingH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"^\n\x1b\x43reateTaggingStreamResponse\x12\x0f\n\x05\x63ount\x18\x01 \x01(\x03H\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"K\n\tHierarchy\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08tagSetId\x18\x03 \x01(\x03\x12\x12\n\nrootNodeId\x18\x04 \x01(\x03\")\n\x15GetHierarchiesRequest\x12\x10\n\x08tagSetId\x18\x01 \x01(\x03\"8\n\x16\x43reateHierarchyRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\"x\n\x1aStreamingHierarchyResponse\x12*\n\thierarchy\x18\x01 \x01(\x0b\x32\x15.dataloader.HierarchyH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"L\n\x04Node\x12\n\n\x02id\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x03 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x04 \x01(\x03\"M\n\x11\x43reateNodeRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x02 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x03 \x01(\x03\"K\n\x0fGetNodesRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x02 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x03 \x01(\x03\"i\n\x15StreamingNodeResponse\x12 \n\x04node\x18\x01 \x01(\x0b\x32\x10.dataloader.NodeH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message2\x8e\x10\n\nDataLoader\x12Q\n\tgetMedias\x12\x1c.dataloader.GetMediasRequest\x1a\".dataloader.StreamingMediaResponse\"\x00\x30\x01\x12:\n\x0cgetMediaById\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Media\"\x00\x12\x46\n\rgetMediaByURI\x12 .dataloader.GetMediaByURIRequest\x1a\x11.dataloader.Media\"\x00\x12\x35\n\x0b\x63reateMedia\x12\x11.dataloader.Media\x1a\x11.dataloader.Media\"\x00\x12S\n\x11\x63reateMediaStream\x12\x11.dataloader.Media\x1a%.dataloader.CreateMediaStreamResponse\"\x00(\x01\x30\x01\x12\x39\n\x0b\x64\x65leteMedia\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Empty\"\x00\x12T\n\ngetTagSets\x12\x1d.dataloader.GetTagSetsRequest\x1a#.dataloader.StreamingTagSetResponse\"\x00\x30\x01\x12<\n\rgetTagSetById\x12\x15.dataloader.IdRequest\x1a\x12.dataloader.TagSet\"\x00\x12K\n\x0fgetTagSetByName\x12\".dataloader.GetTagSetRequestByName\x1a\x12.dataloader.TagSet\"\x00\x12\x45\n\x0c\x63reateTagSet\x12\x1f.dataloader.CreateTagSetRequest\x1a\x12.dataloader.TagSet\"\x00\x12K\n\x07getTags\x12\x1a.dataloader.GetTagsRequest\x1a .dataloader.StreamingTagResponse\"\x00\x30\x01\x12\x32\n\x06getTag\x12\x15.dataloader.IdRequest\x1a\x0f.dataloader.Tag\"\x00\x12<\n\tcreateTag\x12\x1c.dataloader.CreateTagRequest\x1a\x0f.dataloader.Tag\"\x00\x12`\n\x0f\x63reateTagStream\x12\".dataloader.CreateTagStreamRequest\x1a#.dataloader.CreateTagStreamResponse\"\x00(\x01\x30\x01\x12J\n\x0bgetTaggings\x12\x11.dataloader.Empty\x1a$.dataloader.StreamingTaggingResponse\"\x00\x30\x01\x12K\n\x10getMediasWithTag\x12\x15.dataloader.IdRequest\x1a\x1e.dataloader.RepeatedIdResponse\"\x00\x12G\n\x0cgetMediaTags\x12\x15.dataloader.IdRequest\x1a\x1e.dataloader.RepeatedIdResponse\"\x00\x12H\n\rcreateTagging\x12 .dataloader.CreateTaggingRequest\x1a\x13.dataloader.Tagging\"\x00\x12\x66\n\x13\x63reateTaggingStream\x12 .dataloader.CreateTaggingRequest\x1a\'.dataloader.CreateTaggingStreamResponse\"\x00(\x01\x30\x01\x12_\n\x0egetHierarchies\x12!.dataloader.GetHierarchiesRequest\x1a&.dataloader.StreamingHierarchyResponse\"\x00\x30\x01\x12>\n\x0cgetHierarchy\x12\x15.dataloader.IdRequest\x1a\x15.dataloader.Hierarchy\"\x00\x12N\n\x0f\x63reateHierarchy\x12\".dataloader.CreateHierarchyRequest\x1a\x15.dataloader.Hierarchy\"\x00\x12N\n\x08getNodes\x12\x1b.dataloader.GetNodesRequest\x1a!.dataloader.StreamingNodeResponse\"\x00\x30\x01\x12\x34\n\x07getNode\x12\x15.dataloader.IdRequest\x1a\x10.dataloader.Node\"\x00\x12?\n\ncreateNode\x12\x1d.dataloader.CreateNodeRequest\x1a\x10.dataloader.Node\"\x00\x12Z\n\x10\x63reateNodeStream\x12\x1d.dataloader.CreateNodeRequest\x1a!.dataloader.StreamingNodeResponse\"\x00(\x01\x30\x01\x12\x38\n\ndeleteNode\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Empty\"\x00\x12\x37\n\rresetDatabase\x12\x11.dataloader.Empty\x1a\x11.dataloader.Empty\"\x00\x42\x1aZ\x18m3.dataloader/dataloaderb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10\x64\x61taloader.proto\x12\ndataloader\x1a\x17google/rpc/status.proto\"\x07\n\x05\x45mpty\"\x17\n\tIdRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\x18\n\nIdResponse\x12\n\n\x02id\x18\x01 \x01(\x03\" \n\x11RepeatedIdRequest\x12\x0b\n\x03ids\x18\x01 \x03(\x03\"!\n\x12RepeatedIdResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x03\"C\n\x0fRejectedRequest\x12\r\n\x05index\x18\x01 \x01(\x03\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.Status\"O\n\x05Media\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x10\n\x08\x66ile_uri\x18\x02 \x01(\t\x12\x11\n\tfile_type\x18\x03 \x01(\x03\x12\x15\n\rthumbnail_uri\x18\x04 \x01(\t\"%\n\x10GetMediasRequest\x12\x11\n\tfile_type\x18\x01 \x01(\x03\"(\n\x14GetMediaByURIRequest\x12\x10\n\x08\x66ile_uri\x18\x01 \x01(\t\"l\n\x16StreamingMediaResponse\x12\"\n\x05media\x18\x01 \x01(\x0b\x32\x11.dataloader.MediaH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"/\n\nMediaBatch\x12!\n\x06medias\x18\x01 \x03(\x0b\x32\x11.dataloader.Media\"v\n\x1bStreamingMediaBatchResponse\x12\'\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x16.dataloader.MediaBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xae\x01\n\x19\x43reateMediaStreamResponse\x12\x0f\n\x05\x63ount\x18\x01 \x01(\x03H\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x12-\n\x08rejected\x18\x03 \x03(\x0b\x32\x1b.dataloader.RejectedRequest\x12\x10\n\x08inserted\x18\x04 \x01(\x03\x12\x0f\n\x07skipped\x18\x05 \x01(\x03\x42\t\n\x07message\"5\n\x06TagSet\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\"&\n\x11GetTagSetsRequest\x12\x11\n\ttagTypeId\x18\x01 \x01(\x03\"&\n\x16GetTagSetRequestByName\x12\x0c\n\x04name\x18\x01 \x01(\t\"6\n\x13\x43reateTagSetRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\ttagTypeId\x18\x02 \x01(\x03\"o\n\x17StreamingTagSetResponse\x12$\n\x06tagset\x18\x01 \x01(\x0b\x32\x12.dataloader.TagSetH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xaa\x02\n\x03Tag\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"$\n\x13\x41lphanumericalValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1f\n\x0eNumericalValue\x12\r\n\x05value\x18\x01 \x01(\x03\"\x1a\n\tDateValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1a\n\tTimeValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x1f\n\x0eTimeStampValue\x12\r\n\x05value\x18\x01 \x01(\t\"5\n\x0eGetTagsRequest\x12\x10\n\x08tagSetId\x18\x01 \x01(\x03\x12\x11\n\ttagTypeId\x18\x02 \x01(\x03\"\xab\x02\n\x10\x43reateTagRequest\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"f\n\x14StreamingTagResponse\x12\x1e\n\x03tag\x18\x01 \x01(\x0b\x32\x0f.dataloader.TagH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\")\n\x08TagBatch\x12\x1d\n\x04tags\x18\x01 \x03(\x0b\x32\x0f.dataloader.Tag\"r\n\x19StreamingTagBatchResponse\x12%\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x14.dataloader.TagBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xc0\x02\n\x16\x43reateTagStreamRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\x12\x11\n\ttagTypeId\x18\x03 \x01(\x03\x12\x39\n\x0e\x61lphanumerical\x18\x04 \x01(\x0b\x32\x1f.dataloader.AlphanumericalValueH\x00\x12/\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.dataloader.TimeStampValueH\x00\x12%\n\x04time\x18\x06 \x01(\x0b\x32\x15.dataloader.TimeValueH\x00\x12%\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x15.dataloader.DateValueH\x00\x12/\n\tnumerical\x18\x08 \x01(\x0b\x32\x1a.dataloader.NumericalValueH\x00\x42\x07\n\x05value\"\xcd\x01\n\x17\x43reateTagStreamResponse\x12>\n\x06id_map\x18\x01 \x03(\x0b\x32..dataloader.CreateTagStreamResponse.IdMapEntry\x12\x15\n\rerror_message\x18\x02 \x01(\t\x12-\n\x08rejected\x18\x03 \x03(\x0b\x32\x1b.dataloader.RejectedRequest\x1a,\n\nIdMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\")\n\x07Tagging\x12\x0f\n\x07mediaId\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\"6\n\x14\x43reateTaggingRequest\x12\x0f\n\x07mediaId\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\"r\n\x18StreamingTaggingResponse\x12&\n\x07tagging\x18\x01 \x01(\x0b\x32\x13.dataloader.TaggingH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"0\n\x0cTaggingBatch\x12\x10\n\x08mediaIds\x18\x01 \x03(\x03\x12\x0e\n\x06tagIds\x18\x02 \x03(\x03\"z\n\x1dStreamingTaggingBatchResponse\x12)\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x18.dataloader.TaggingBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"@\n\x0cMediaTagList\x12 \n\x05media\x18\x01 \x01(\x0b\x32\x11.dataloader.Media\x12\x0e\n\x06tagIds\x18\x02 \x03(\x03\"=\n\x11MediaTagListBatch\x12(\n\x06medias\x18\x01 \x03(\x0b\x32\x18.dataloader.MediaTagList\"\x7f\n\x1dStreamingMediaTagListResponse\x12.\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x1d.dataloader.MediaTagListBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"\xd7\x01\n\nMediaQuery\x12\x0f\n\x05tagId\x18\x01 \x01(\x03H\x00\x12\x12\n\x08tagSetId\x18\x02 \x01(\x03H\x00\x12\x10\n\x06nodeId\x18\x03 \x01(\x03H\x00\x12+\n\x05\x61llOf\x18\x04 \x01(\x0b\x32\x1a.dataloader.MediaQueryListH\x00\x12+\n\x05\x61nyOf\x18\x05 \x01(\x0b\x32\x1a.dataloader.MediaQueryListH\x00\x12*\n\x08negation\x18\x06 \x01(\x0b\x32\x16.dataloader.MediaQueryH\x00\x42\x0c\n\nexpression\":\n\x0eMediaQueryList\x12(\n\x08operands\x18\x01 \x03(\x0b\x32\x16.dataloader.MediaQuery\"J\n\x12QueryMediasRequest\x12%\n\x05query\x18\x01 \x01(\x0b\x32\x16.dataloader.MediaQuery\x12\r\n\x05limit\x18\x02 \x01(\x03\"\xb0\x01\n\x1b\x43reateTaggingStreamResponse\x12\x0f\n\x05\x63ount\x18\x01 \x01(\x03H\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x12\x10\n\x08inserted\x18\x03 \x01(\x03\x12\x0f\n\x07skipped\x18\x04 \x01(\x03\x12-\n\x08rejected\x18\x05 \x03(\x0b\x32\x1b.dataloader.RejectedRequestB\t\n\x07message\"K\n\tHierarchy\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08tagSetId\x18\x03 \x01(\x03\x12\x12\n\nrootNodeId\x18\x04 \x01(\x03\")\n\x15GetHierarchiesRequest\x12\x10\n\x08tagSetId\x18\x01 \x01(\x03\"8\n\x16\x43reateHierarchyRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08tagSetId\x18\x02 \x01(\x03\"x\n\x1aStreamingHierarchyResponse\x12*\n\thierarchy\x18\x01 \x01(\x0b\x32\x15.dataloader.HierarchyH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"L\n\x04Node\x12\n\n\x02id\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x03 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x04 \x01(\x03\"M\n\x11\x43reateNodeRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x02 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x03 \x01(\x03\"c\n\x17\x43reateNodeStreamRequest\x12\x0e\n\x06tempId\x18\x01 \x01(\x03\x12\r\n\x05tagId\x18\x02 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x03 \x01(\x03\x12\x14\n\x0cparentTempId\x18\x04 \x01(\x03\"\xac\x01\n\x18\x43reateNodeStreamResponse\x12?\n\x06id_map\x18\x01 \x03(\x0b\x32/.dataloader.CreateNodeStreamResponse.IdMapEntry\x12!\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.Status\x1a,\n\nIdMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\x03:\x02\x38\x01\"K\n\x0fGetNodesRequest\x12\r\n\x05tagId\x18\x01 \x01(\x03\x12\x13\n\x0bhierarchyId\x18\x02 \x01(\x03\x12\x14\n\x0cparentNodeId\x18\x03 \x01(\x03\"i\n\x15StreamingNodeResponse\x12 \n\x04node\x18\x01 \x01(\x0b\x32\x10.dataloader.NodeH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\",\n\tNodeBatch\x12\x1f\n\x05nodes\x18\x01 \x03(\x0b\x32\x10.dataloader.Node\"t\n\x1aStreamingNodeBatchResponse\x12&\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x15.dataloader.NodeBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"9\n\x11GetSubtreeRequest\x12\x12\n\nrootNodeId\x18\x01 \x01(\x03\x12\x10\n\x08withTags\x18\x02 \x01(\x08\"Z\n\x0bSubtreeNode\x12\x1e\n\x04node\x18\x01 \x01(\x0b\x32\x10.dataloader.Node\x12\r\n\x05\x64\x65pth\x18\x02 \x01(\x03\x12\x1c\n\x03tag\x18\x03 \x01(\x0b\x32\x0f.dataloader.Tag\"6\n\x0cSubtreeBatch\x12&\n\x05nodes\x18\x01 \x03(\x0b\x32\x17.dataloader.SubtreeNode\"u\n\x18StreamingSubtreeResponse\x12)\n\x05\x62\x61tch\x18\x01 \x01(\x0b\x32\x18.dataloader.SubtreeBatchH\x00\x12#\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x12.google.rpc.StatusH\x00\x42\t\n\x07message\"]\n\x14RefreshViewsResponse\x12\x10\n\x08inserted\x18\x01 \x01(\x03\x12\x0f\n\x07\x64\x65leted\x18\x02 \x01(\x03\x12\x10\n\x08\x64uration\x18\x03 \x01(\x01\x12\x10\n\x08requests\x18\x04 \x01(\x03\"\xc6\x01\n\x08RpcStats\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\r\n\x05\x63\x61lls\x18\x02 \x01(\x03\x12\x0e\n\x06\x65rrors\x18\x03 \x01(\x03\x12\x10\n\x08inFlight\x18\x04 \x01(\x03\x12\x0b\n\x03p50\x18\x05 \x01(\x01\x12\x0b\n\x03p95\x18\x06 \x01(\x01\x12\x0b\n\x03p99\x18\x07 \x01(\x01\x12\x14\n\x0ctotalSeconds\x18\x08 \x01(\x01\x12\x14\n\x0crowsReceived\x18\t \x01(\x03\x12\x10\n\x08rowsSent\x18\n \x01(\x03\x12\x14\n\x0crowsRejected\x18\x0b \x01(\x03\"I\n\x13ServerStatsResponse\x12\x0e\n\x06uptime\x18\x01 \x01(\x01\x12\"\n\x04rpcs\x18\x02 \x03(\x0b\x32\x14.dataloader.RpcStats\"Q\n\x0eProfileRequest\x12\x10\n\x08\x64uration\x18\x01 \x01(\x01\x12\x0e\n\x06memory\x18\x02 \x01(\x08\x12\x10\n\x08interval\x18\x03 \x01(\x01\x12\x0b\n\x03top\x18\x04 \x01(\x03\">\n\x0cProfileEntry\x12\x10\n\x08location\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\r\n\x05total\x18\x03 \x01(\x03\"[\n\x0fProfileResponse\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0f\n\x07samples\x18\x02 \x01(\x03\x12)\n\x07\x65ntries\x18\x03 \x03(\x0b\x32\x18.dataloader.ProfileEntry2\x80\x19\n\nDataLoader\x12Q\n\tgetMedias\x12\x1c.dataloader.GetMediasRequest\x1a\".dataloader.StreamingMediaResponse\"\x00\x30\x01\x12]\n\x10getMediasBatched\x12\x1c.dataloader.GetMediasRequest\x1a\'.dataloader.StreamingMediaBatchResponse\"\x00\x30\x01\x12:\n\x0cgetMediaById\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Media\"\x00\x12\x46\n\rgetMediaByURI\x12 .dataloader.GetMediaByURIRequest\x1a\x11.dataloader.Media\"\x00\x12\\\n\x0egetMediasByIds\x12\x1d.dataloader.RepeatedIdRequest\x1a\'.dataloader.StreamingMediaBatchResponse\"\x00\x30\x01\x12\x35\n\x0b\x63reateMedia\x12\x11.dataloader.Media\x1a\x11.dataloader.Media\"\x00\x12S\n\x11\x63reateMediaStream\x12\x11.dataloader.Media\x1a%.dataloader.CreateMediaStreamResponse\"\x00(\x01\x30\x01\x12\x39\n\x0b\x64\x65leteMedia\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Empty\"\x00\x12T\n\ngetTagSets\x12\x1d.dataloader.GetTagSetsRequest\x1a#.dataloader.StreamingTagSetResponse\"\x00\x30\x01\x12<\n\rgetTagSetById\x12\x15.dataloader.IdRequest\x1a\x12.dataloader.TagSet\"\x00\x12K\n\x0fgetTagSetByName\x12\".dataloader.GetTagSetRequestByName\x1a\x12.dataloader.TagSet\"\x00\x12\x45\n\x0c\x63reateTagSet\x12\x1f.dataloader.CreateTagSetRequest\x1a\x12.dataloader.TagSet\"\x00\x12K\n\x07getTags\x12\x1a.dataloader.GetTagsRequest\x1a .dataloader.StreamingTagResponse\"\x00\x30\x01\x12W\n\x0egetTagsBatched\x12\x1a.dataloader.GetTagsRequest\x1a%.dataloader.StreamingTagBatchResponse\"\x00\x30\x01\x12\x32\n\x06getTag\x12\x15.dataloader.IdRequest\x1a\x0f.dataloader.Tag\"\x00\x12X\n\x0cgetTagsByIds\x12\x1d.dataloader.RepeatedIdRequest\x1a%.dataloader.StreamingTagBatchResponse\"\x00\x30\x01\x12<\n\tcreateTag\x12\x1c.dataloader.CreateTagRequest\x1a\x0f.dataloader.Tag\"\x00\x12`\n\x0f\x63reateTagStream\x12\".dataloader.CreateTagStreamRequest\x1a#.dataloader.CreateTagStreamResponse\"\x00(\x01\x30\x01\x12J\n\x0bgetTaggings\x12\x11.dataloader.Empty\x1a$.dataloader.StreamingTaggingResponse\"\x00\x30\x01\x12V\n\x12getTaggingsBatched\x12\x11.dataloader.Empty\x1a).dataloader.StreamingTaggingBatchResponse\"\x00\x30\x01\x12K\n\x10getMediasWithTag\x12\x15.dataloader.IdRequest\x1a\x1e.dataloader.RepeatedIdResponse\"\x00\x12G\n\x0cgetMediaTags\x12\x15.dataloader.IdRequest\x1a\x1e.dataloader.RepeatedIdResponse\"\x00\x12_\n\x10getMediaTagLists\x12\x1c.dataloader.GetMediasRequest\x1a).dataloader.StreamingMediaTagListResponse\"\x00\x30\x01\x12Z\n\x0bqueryMedias\x12\x1e.dataloader.QueryMediasRequest\x1a\'.dataloader.StreamingMediaBatchResponse\"\x00\x30\x01\x12H\n\rcreateTagging\x12 .dataloader.CreateTaggingRequest\x1a\x13.dataloader.Tagging\"\x00\x12\x66\n\x13\x63reateTaggingStream\x12 .dataloader.CreateTaggingRequest\x1a\'.dataloader.CreateTaggingStreamResponse\"\x00(\x01\x30\x01\x12_\n\x0egetHierarchies\x12!.dataloader.GetHierarchiesRequest\x1a&.dataloader.StreamingHierarchyResponse\"\x00\x30\x01\x12>\n\x0cgetHierarchy\x12\x15.dataloader.IdRequest\x1a\x15.dataloader.Hierarchy\"\x00\x12N\n\x0f\x63reateHierarchy\x12\".dataloader.CreateHierarchyRequest\x1a\x15.dataloader.Hierarchy\"\x00\x12N\n\x08getNodes\x12\x1b.dataloader.GetNodesRequest\x1a!.dataloader.StreamingNodeResponse\"\x00\x30\x01\x12Z\n\x0fgetNodesBatched\x12\x1b.dataloader.GetNodesRequest\x1a&.dataloader.StreamingNodeBatchResponse\"\x00\x30\x01\x12\x34\n\x07getNode\x12\x15.dataloader.IdRequest\x1a\x10.dataloader.Node\"\x00\x12Z\n\rgetNodesByIds\x12\x1d.dataloader.RepeatedIdRequest\x1a&.dataloader.StreamingNodeBatchResponse\"\x00\x30\x01\x12U\n\ngetSubtree\x12\x1d.dataloader.GetSubtreeRequest\x1a$.dataloader.StreamingSubtreeResponse\"\x00\x30\x01\x12?\n\ncreateNode\x12\x1d.dataloader.CreateNodeRequest\x1a\x10.dataloader.Node\"\x00\x12\x63\n\x10\x63reateNodeStream\x12#.dataloader.CreateNodeStreamRequest\x1a$.dataloader.CreateNodeStreamResponse\"\x00(\x01\x30\x01\x12\x38\n\ndeleteNode\x12\x15.dataloader.IdRequest\x1a\x11.dataloader.Empty\"\x00\x12\x37\n\rresetDatabase\x12\x11.dataloader.Empty\x1a\x11.dataloader.Empty\"\x00\x12\x45\n\x0crefreshViews\x12\x11.dataloader.Empty\x1a .dataloader.RefreshViewsResponse\"\x00\x12\x46\n\x0egetServerStats\x12\x11.dataloader.Empty\x1a\x1f.dataloader.ServerStatsResponse\"\x00\x12\x44\n\x07profile\x12\x1a.dataloader.ProfileRequest\x1a\x1b.dataloader.ProfileResponse\"\x00\x42\x1aZ\x18m3.dataloader/dataloaderb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -35,82 +35,142 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._serialized_options = b'Z\030m3.dataloader/dataloader'
   _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._loaded_options = None
   _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._serialized_options = b'8\001'
+  _globals['_CREATENODESTREAMRESPONSE_IDMAPENTRY']._loaded_options = None
+  _globals['_CREATENODESTREAMRESPONSE_IDMAPENTRY']._serialized_options = b'8\001'
   _globals['_EMPTY']._serialized_start=57
   _globals['_EMPTY']._serialized_end=64
   _globals['_IDREQUEST']._serialized_start=66
   _globals['_IDREQUEST']._serialized_end=89
   _globals['_IDRESPONSE']._serialized_start=91
   _globals['_IDRESPONSE']._serialized_end=115
-  _globals['_REPEATEDIDRESPONSE']._serialized_start=117
-  _globals['_REPEATEDIDRESPONSE']._serialized_end=150
-  _globals['_MEDIA']._serialized_start=152
-  _globals['_MEDIA']._serialized_end=231
-  _globals['_GETMEDIASREQUEST']._serialized_start=233
-  _globals['_GETMEDIASREQUEST']._serialized_end=270
-  _globals['_GETMEDIABYURIREQUEST']._serialized_start=272
-  _globals['_GETMEDIABYURIREQUEST']._serialized_end=312
-  _globals['_STREAMINGMEDIARESPONSE']._serialized_start=314
-  _globals['_STREAMINGMEDIARESPONSE']._serialized_end=422
-  _globals['_CREATEMEDIASTREAMRESPONSE']._serialized_start=424
-  _globals['_CREATEMEDIASTREAMRESPONSE']._serialized_end=516
-  _globals['_TAGSET']._serialized_start=518
-  _globals['_TAGSET']._serialized_end=571
-  _globals['_GETTAGSETSREQUEST']._serialized_start=573
-  _globals['_GETTAGSETSREQUEST']._serialized_end=611
-  _globals['_GETTAGSETREQUESTBYNAME']._serialized_start=613
-  _globals['_GETTAGSETREQUESTBYNAME']._serialized_end=651
-  _globals['_CREATETAGSETREQUEST']._serialized_start=653
-  _globals['_CREATETAGSETREQUEST']._serialized_end=707
-  _globals['_STREAMINGTAGSETRESPONSE']._serialized_start=709
-  _globals['_STREAMINGTAGSETRESPONSE']._serialized_end=820
-  _globals['_TAG']._serialized_start=823
-  _globals['_TAG']._serialized_end=1121
-  _globals['_ALPHANUMERICALVALUE']._serialized_start=1123
-  _globals['_ALPHANUMERICALVALUE']._serialized_end=1159
-  _globals['_NUMERICALVALUE']._serialized_start=1161
-  _globals['_NUMERICALVALUE']._serialized_end=1192
-  _globals['_DATEVALUE']._serialized_start=1194
-  _globals['_DATEVALUE']._serialized_end=1220
-  _globals['_TIMEVALUE']._serialized_start=1222
-  _globals['_TIMEVALUE']._serialized_end=1248
-  _globals['_TIMESTAMPVALUE']._serialized_start=1250
-  _globals['_TIMESTAMPVALUE']._serialized_end=1281
-  _globals['_GETTAGSREQUEST']._serialized_start=1283
-  _globals['_GETTAGSREQUEST']._serialized_end=1336
-  _globals['_CREATETAGREQUEST']._serialized_start=1339
-  _globals['_CREATETAGREQUEST']._serialized_end=1638
-  _globals['_STREAMINGTAGRESPONSE']._serialized_start=1640
-  _globals['_STREAMINGTAGRESPONSE']._serialized_end=1742
-  _globals['_CREATETAGSTREAMREQUEST']._serialized_start=1745
-  _globals['_CREATETAGSTREAMREQUEST']._serialized_end=2065
-  _globals['_CREATETAGSTREAMRESPONSE']._serialized_start=2068
-  _globals['_CREATETAGSTREAMRESPONSE']._serialized_end=2226
-  _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._serialized_start=2182
-  _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._serialized_end=2226
-  _globals['_TAGGING']._serialized_start=2228
-  _globals['_TAGGING']._serialized_end=2269
-  _globals['_CREATETAGGINGREQUEST']._serialized_start=2271
-  _globals['_CREATETAGGINGREQUEST']._serialized_end=2325
-  _globals['_STREAMINGTAGGINGRESPONSE']._serialized_start=2327
-  _globals['_STREAMINGTAGGINGRESPONSE']._serialized_end=2441
-  _globals['_CREATETAGGINGSTREAMRESPONSE']._serialized_start=2443
-  _globals['_CREATETAGGINGSTREAMRESPONSE']._serialized_end=2537
-  _globals['_HIERARCHY']._serialized_start=2539
-  _globals['_HIERARCHY']._serialized_end=2614
-  _globals['_GETHIERARCHIESREQUEST']._serialized_start=2616
-  _globals['_GETHIERARCHIESREQUEST']._serialized_end=2657
-  _globals['_CREATEHIERARCHYREQUEST']._serialized_start=2659
-  _globals['_CREATEHIERARCHYREQUEST']._serialized_end=2715
-  _globals['_STREAMINGHIERARCHYRESPONSE']._serialized_start=2717
-  _globals['_STREAMINGHIERARCHYRESPONSE']._serialized_end=2837
-  _globals['_NODE']._serialized_start=2839
-  _globals['_NODE']._serialized_end=2915
-  _globals['_CREATENODEREQUEST']._serialized_start=2917
-  _globals['_CREATENODEREQUEST']._serialized_end=2994
-  _globals['_GETNODESREQUEST']._serialized_start=2996
-  _globals['_GETNODESREQUEST']._serialized_end=3071
-  _globals['_STREAMINGNODERESPONSE']._serialized_start=3073
-  _globals['_STREAMINGNODERESPONSE']._serialized_end=3178
-  _globals['_DATALOADER']._serialized_start=3181
-  _globals['_DATALOADER']._serialized_end=5243
+  _globals['_REPEATEDIDREQUEST']._serialized_start=117
+  _globals['_REPEATEDIDREQUEST']._serialized_end=149
+  _globals['_REPEATEDIDRESPONSE']._serialized_start=151
+  _globals['_REPEATEDIDRESPONSE']._serialized_end=184
+  _globals['_REJECTEDREQUEST']._serialized_start=186
+  _globals['_REJECTEDREQUEST']._serialized_end=253
+  _globals['_MEDIA']._serialized_start=255
+  _globals['_MEDIA']._serialized_end=334
+  _globals['_GETMEDIASREQUEST']._serialized_start=336
+  _globals['_GETMEDIASREQUEST']._serialized_end=373
+  _globals['_GETMEDIABYURIREQUEST']._serialized_start=375
+  _globals['_GETMEDIABYURIREQUEST']._serialized_end=415
+  _globals['_STREAMINGMEDIARESPONSE']._serialized_start=417
+  _globals['_STREAMINGMEDIARESPONSE']._serialized_end=525
+  _globals['_MEDIABATCH']._serialized_start=527
+  _globals['_MEDIABATCH']._serialized_end=574
+  _globals['_STREAMINGMEDIABATCHRESPONSE']._serialized_start=576
+  _globals['_STREAMINGMEDIABATCHRESPONSE']._serialized_end=694
+  _globals['_CREATEMEDIASTREAMRESPONSE']._serialized_start=697
+  _globals['_CREATEMEDIASTREAMRESPONSE']._serialized_end=871
+  _globals['_TAGSET']._serialized_start=873
+  _globals['_TAGSET']._serialized_end=926
+  _globals['_GETTAGSETSREQUEST']._serialized_start=928
+  _globals['_GETTAGSETSREQUEST']._serialized_end=966
+  _globals['_GETTAGSETREQUESTBYNAME']._serialized_start=968
+  _globals['_GETTAGSETREQUESTBYNAME']._serialized_end=1006
+  _globals['_CREATETAGSETREQUEST']._serialized_start=1008
+  _globals['_CREATETAGSETREQUEST']._serialized_end=1062
+  _globals['_STREAMINGTAGSETRESPONSE']._serialized_start=1064
+  _globals['_STREAMINGTAGSETRESPONSE']._serialized_end=1175
+  _globals['_TAG']._serialized_start=1178
+  _globals['_TAG']._serialized_end=1476
+  _globals['_ALPHANUMERICALVALUE']._serialized_start=1478
+  _globals['_ALPHANUMERICALVALUE']._serialized_end=1514
+  _globals['_NUMERICALVALUE']._serialized_start=1516
+  _globals['_NUMERICALVALUE']._serialized_end=1547
+  _globals['_DATEVALUE']._serialized_start=1549
+  _globals['_DATEVALUE']._serialized_end=1575
+  _globals['_TIMEVALUE']._serialized_start=1577
+  _globals['_TIMEVALUE']._serialized_end=1603
+  _globals['_TIMESTAMPVALUE']._serialized_start=1605
+  _globals['_TIMESTAMPVALUE']._serialized_end=1636
+  _globals['_GETTAGSREQUEST']._serialized_start=1638
+  _globals['_GETTAGSREQUEST']._serialized_end=1691
+  _globals['_CREATETAGREQUEST']._serialized_start=1694
+  _globals['_CREATETAGREQUEST']._serialized_end=1993
+  _globals['_STREAMINGTAGRESPONSE']._serialized_start=1995
+  _globals['_STREAMINGTAGRESPONSE']._serialized_end=2097
+  _globals['_TAGBATCH']._serialized_start=2099
+  _globals['_TAGBATCH']._serialized_end=2140
+  _globals['_STREAMINGTAGBATCHRESPONSE']._serialized_start=2142
+  _globals['_STREAMINGTAGBATCHRESPONSE']._serialized_end=2256
+  _globals['_CREATETAGSTREAMREQUEST']._serialized_start=2259
+  _globals['_CREATETAGSTREAMREQUEST']._serialized_end=2579
+  _globals['_CREATETAGSTREAMRESPONSE']._serialized_start=2582
+  _globals['_CREATETAGSTREAMRESPONSE']._serialized_end=2787
+  _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._serialized_start=2743
+  _globals['_CREATETAGSTREAMRESPONSE_IDMAPENTRY']._serialized_end=2787
+  _globals['_TAGGING']._serialized_start=2789
+  _globals['_TAGGING']._serialized_end=2830
+  _globals['_CREATETAGGINGREQUEST']._serialized_start=2832
+  _globals['_CREATETAGGINGREQUEST']._serialized_end=2886
+  _globals['_STREAMINGTAGGINGRESPONSE']._serialized_start=2888
+  _globals['_STREAMINGTAGGINGRESPONSE']._serialized_end=3002
+  _globals['_TAGGINGBATCH']._serialized_start=3004
+  _globals['_TAGGINGBATCH']._serialized_end=3052
+  _globals['_STREAMINGTAGGINGBATCHRESPONSE']._serialized_start=3054
+  _globals['_STREAMINGTAGGINGBATCHRESPONSE']._serialized_end=3176
+  _globals['_MEDIATAGLIST']._serialized_start=3178
+  _globals['_MEDIATAGLIST']._serialized_end=3242
+  _globals['_MEDIATAGLISTBATCH']._serialized_start=3244
+  _globals['_MEDIATAGLISTBATCH']._serialized_end=3305
+  _globals['_STREAMINGMEDIATAGLISTRESPONSE']._serialized_start=3307
+  _globals['_STREAMINGMEDIATAGLISTRESPONSE']._serialized_end=3434
+  _globals['_MEDIAQUERY']._serialized_start=3437
+  _globals['_MEDIAQUERY']._serialized_end=3652
+  _globals['_MEDIAQUERYLIST']._serialized_start=3654
+  _globals['_MEDIAQUERYLIST']._serialized_end=3712
+  _globals['_QUERYMEDIASREQUEST']._serialized_start=3714
+  _globals['_QUERYMEDIASREQUEST']._serialized_end=3788
+  _globals['_CREATETAGGINGSTREAMRESPONSE']._serialized_start=3791
+  _globals['_CREATETAGGINGSTREAMRESPONSE']._serialized_end=3967
+  _globals['_HIERARCHY']._serialized_start=3969
+  _globals['_HIERARCHY']._serialized_end=4044
+  _globals['_GETHIERARCHIESREQUEST']._serialized_start=4046
+  _globals['_GETHIERARCHIESREQUEST']._serialized_end=4087
+  _globals['_CREATEHIERARCHYREQUEST']._serialized_start=4089
+  _globals['_CREATEHIERARCHYREQUEST']._serialized_end=4145
+  _globals['_STREAMINGHIERARCHYRESPONSE']._serialized_start=4147
+  _globals['_STREAMINGHIERARCHYRESPONSE']._serialized_end=4267
+  _globals['_NODE']._serialized_start=4269
+  _globals['_NODE']._serialized_end=4345
+  _globals['_CREATENODEREQUEST']._serialized_start=4347
+  _globals['_CREATENODEREQUEST']._serialized_end=4424
+  _globals['_CREATENODESTREAMREQUEST']._serialized_start=4426
+  _globals['_CREATENODESTREAMREQUEST']._serialized_end=4525
+  _globals['_CREATENODESTREAMRESPONSE']._serialized_start=4528
+  _globals['_CREATENODESTREAMRESPONSE']._serialized_end=4700
+  _globals['_CREATENODESTREAMRESPONSE_IDMAPENTRY']._serialized_start=2743
+  _globals['_CREATENODESTREAMRESPONSE_IDMAPENTRY']._serialized_end=2787
+  _globals['_GETNODESREQUEST']._serialized_start=4702
+  _globals['_GETNODESREQUEST']._serialized_end=4777
+  _globals['_STREAMINGNODERESPONSE']._serialized_start=4779
+  _globals['_STREAMINGNODERESPONSE']._serialized_end=4884
+  _globals['_NODEBATCH']._serialized_start=4886
+  _globals['_NODEBATCH']._serialized_end=4930
+  _globals['_STREAMINGNODEBATCHRESPONSE']._serialized_start=4932
+  _globals['_STREAMINGNODEBATCHRESPONSE']._serialized_end=5048
+  _globals['_GETSUBTREEREQUEST']._serialized_start=5050
+  _globals['_GETSUBTREEREQUEST']._serialized_end=5107
+  _globals['_SUBTREENODE']._serialized_start=5109
+  _globals['_SUBTREENODE']._serialized_end=5199
+  _globals['_SUBTREEBATCH']._serialized_start=5201
+  _globals['_SUBTREEBATCH']._serialized_end=5255
+  _globals['_STREAMINGSUBTREERESPONSE']._serialized_start=5257
+  _globals['_STREAMINGSUBTREERESPONSE']._serialized_end=5374
+  _globals['_REFRESHVIEWSRESPONSE']._serialized_start=5376
+  _globals['_REFRESHVIEWSRESPONSE']._serialized_end=5469
+  _globals['_RPCSTATS']._serialized_start=5472
+  _globals['_RPCSTATS']._serialized_end=5670
+  _globals['_SERVERSTATSRESPONSE']._serialized_start=5672
+  _globals['_SERVERSTATSRESPONSE']._serialized_end=5745
+  _globals['_PROFILEREQUEST']._serialized_start=5747
+  _globals['_PROFILEREQUEST']._serialized_end=5828
+  _globals['_PROFILEENTRY']._serialized_start=5830
+  _globals['_PROFILEENTRY']._serialized_end=5892
+  _globals['_PROFILERESPONSE']._serialized_start=5894
+  _globals['_PROFILERESPONSE']._serialized_end=5985
+  _globals['_DATALOADER']._serialized_start=5988
+  _globals['_DATALOADER']._serialized_end=9188
 # @@protoc_insertion_point(module_scope)
@@ -23,12 +23,26 @@ class IdResponse(_message.Message):
     id: int
     def __init__(self, id: _Optional[int] = ...) -> None: ...
 
+class RepeatedIdRequest(_message.Message):
+    __slots__ = ("ids",)
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class RepeatedIdResponse(_message.Message):
     __slots__ = ("ids",)
     IDS_FIELD_NUMBER: _ClassVar[int]
     ids: _containers.RepeatedScalarFieldContainer[int]
     def __init__(self, ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
+class RejectedRequest(_message.Message):
+    __slots__ = ("index", "error")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    error: _status_pb2.Status
+    def __init__(self, index: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
 class Media(_message.Message):
     __slots__ = ("id", "file_uri", "file_type", "thumbnail_uri")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -61,13 +75,33 @@ class StreamingMediaResponse(_message.Message):
     error: _status_pb2.Status
     def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
+class MediaBatch(_message.Message):
+    __slots__ = ("medias",)
+    MEDIAS_FIELD_NUMBER: _ClassVar[int]
+    medias: _containers.RepeatedCompositeFieldContainer[Media]
+    def __init__(self, medias: _Optional[_Iterable[_Union[Media, _Mapping]]] = ...) -> None: ...
+
+class StreamingMediaBatchResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: MediaBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[MediaBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
 class CreateMediaStreamResponse(_message.Message):
-    __slots__ = ("count", "error")
+    __slots__ = ("count", "error", "rejected", "inserted", "skipped")
     COUNT_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_FIELD_NUMBER: _ClassVar[int]
     count: int
     error: _status_pb2.Status
-    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    inserted: int
+    skipped: int
+    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ..., inserted: _Optional[int] = ..., skipped: _Optional[int] = ...) -> None: ...
 
 class TagSet(_message.Message):
     __slots__ = ("id", "name", "tagTypeId")
@@ -191,6 +225,20 @@ class StreamingTagResponse(_message.Message):
     error: _status_pb2.Status
     def __init__(self, tag: _Optional[_Union[Tag, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
+class TagBatch(_message.Message):
+    __slots__ = ("tags",)
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    tags: _containers.RepeatedCompositeFieldContainer[Tag]
+    def __init__(self, tags: _Optional[_Iterable[_Union[Tag, _Mapping]]] = ...) -> None: ...
+
+class StreamingTagBatchResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: TagBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[TagBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
 class CreateTagStreamRequest(_message.Message):
     __slots__ = ("tagId", "tagSetId", "tagTypeId", "alphanumerical", "timestamp", "time", "date", "numerical")
     TAGID_FIELD_NUMBER: _ClassVar[int]
@@ -212,7 +260,7 @@ class CreateTagStreamRequest(_message.Message):
     def __init__(self, tagId: _Optional[int] = ..., tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
 
 class CreateTagStreamResponse(_message.Message):
-    __slots__ = ("id_map", "error_message")
+    __slots__ = ("id_map", "error_message", "rejected")
     class IdMapEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -222,9 +270,11 @@ class CreateTagStreamResponse(_message.Message):
         def __init__(self, key: _Optional[int] = ..., value: _Optional[int] = ...) -> None: ...
     ID_MAP_FIELD_NUMBER: _ClassVar[int]
     ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
     id_map: _containers.ScalarMap[int, int]
     error_message: str
-    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error_message: _Optional[str] = ...) -> None: ...
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error_message: _Optional[str] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ...) -> None: ...
 
 class Tagging(_message.Message):
     __slots__ = ("mediaId", "tagId")
@@ -250,13 +300,87 @@ class StreamingTaggingResponse(_message.Message):
     error: _status_pb2.Status
     def __init__(self, tagging: _Optional[_Union[Tagging, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
+class TaggingBatch(_message.Message):
+    __slots__ = ("mediaIds", "tagIds")
+    MEDIAIDS_FIELD_NUMBER: _ClassVar[int]
+    TAGIDS_FIELD_NUMBER: _ClassVar[int]
+    mediaIds: _containers.RepeatedScalarFieldContainer[int]
+    tagIds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, mediaIds: _Optional[_Iterable[int]] = ..., tagIds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class StreamingTaggingBatchResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: TaggingBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[TaggingBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class MediaTagList(_message.Message):
+    __slots__ = ("media", "tagIds")
+    MEDIA_FIELD_NUMBER: _ClassVar[int]
+    TAGIDS_FIELD_NUMBER: _ClassVar[int]
+    media: Media
+    tagIds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ..., tagIds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class MediaTagListBatch(_message.Message):
+    __slots__ = ("medias",)
+    MEDIAS_FIELD_NUMBER: _ClassVar[int]
+    medias: _containers.RepeatedCompositeFieldContainer[MediaTagList]
+    def __init__(self, medias: _Optional[_Iterable[_Union[MediaTagList, _Mapping]]] = ...) -> None: ...
+
+class StreamingMediaTagListResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: MediaTagListBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[MediaTagListBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class MediaQuery(_message.Message):
+    __slots__ = ("tagId", "tagSetId", "nodeId", "allOf", "anyOf", "negation")
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    NODEID_FIELD_NUMBER: _ClassVar[int]
+    ALLOF_FIELD_NUMBER: _ClassVar[int]
+    ANYOF_FIELD_NUMBER: _ClassVar[int]
+    NEGATION_FIELD_NUMBER: _ClassVar[int]
+    tagId: int
+    tagSetId: int
+    nodeId: int
+    allOf: MediaQueryList
+    anyOf: MediaQueryList
+    negation: MediaQuery
+    def __init__(self, tagId: _Optional[int] = ..., tagSetId: _Optional[int] = ..., nodeId: _Optional[int] = ..., allOf: _Optional[_Union[MediaQueryList, _Mapping]] = ..., anyOf: _Optional[_Union[MediaQueryList, _Mapping]] = ..., negation: _Optional[_Union[MediaQuery, _Mapping]] = ...) -> None: ...
+
+class MediaQueryList(_message.Message):
+    __slots__ = ("operands",)
+    OPERANDS_FIELD_NUMBER: _ClassVar[int]
+    operands: _containers.RepeatedCompositeFieldContainer[MediaQuery]
+    def __init__(self, operands: _Optional[_Iterable[_Union[MediaQuery, _Mapping]]] = ...) -> None: ...
+
+class QueryMediasRequest(_message.Message):
+    __slots__ = ("query", "limit")
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    query: MediaQuery
+    limit: int
+    def __init__(self, query: _Optional[_Union[MediaQuery, _Mapping]] = ..., limit: _Optional[int] = ...) -> None: ...
+
 class CreateTaggingStreamResponse(_message.Message):
-    __slots__ = ("count", "error")
+    __slots__ = ("count", "error", "inserted", "skipped", "rejected")
     COUNT_FIELD_NUMBER: _ClassVar[int]
     ERROR_FIELD_NUMBER: _ClassVar[int]
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
     count: int
     error: _status_pb2.Status
-    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+    inserted: int
+    skipped: int
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ..., inserted: _Optional[int] = ..., skipped: _Optional[int] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ...) -> None: ...
 
 class Hierarchy(_message.Message):
     __slots__ = ("id", "name", "tagSetId", "rootNodeId")
@@ -314,6 +438,33 @@ class CreateNodeRequest(_message.Message):
     parentNodeId: int
     def __init__(self, tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
 
+class CreateNodeStreamRequest(_message.Message):
+    __slots__ = ("tempId", "tagId", "hierarchyId", "parentTempId")
+    TEMPID_FIELD_NUMBER: _ClassVar[int]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
+    PARENTTEMPID_FIELD_NUMBER: _ClassVar[int]
+    tempId: int
+    tagId: int
+    hierarchyId: int
+    parentTempId: int
+    def __init__(self, tempId: _Optional[int] = ..., tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentTempId: _Optional[int] = ...) -> None: ...
+
+class CreateNodeStreamResponse(_message.Message):
+    __slots__ = ("id_map", "error")
+    class IdMapEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: int
+        value: int
+        def __init__(self, key: _Optional[int] = ..., value: _Optional[int] = ...) -> None: ...
+    ID_MAP_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    id_map: _containers.ScalarMap[int, int]
+    error: _status_pb2.Status
+    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
 class GetNodesRequest(_message.Message):
     __slots__ = ("tagId", "hierarchyId", "parentNodeId")
     TAGID_FIELD_NUMBER: _ClassVar[int]
@@ -331,3 +482,127 @@ class StreamingNodeResponse(_message.Message):
     node: Node
     error: _status_pb2.Status
     def __init__(self, node: _Optional[_Union[Node, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class NodeBatch(_message.Message):
+    __slots__ = ("nodes",)
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[Node]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[Node, _Mapping]]] = ...) -> None: ...
+
+class StreamingNodeBatchResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: NodeBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[NodeBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class GetSubtreeRequest(_message.Message):
+    __slots__ = ("rootNodeId", "withTags")
+    ROOTNODEID_FIELD_NUMBER: _ClassVar[int]
+    WITHTAGS_FIELD_NUMBER: _ClassVar[int]
+    rootNodeId: int
+    withTags: bool
+    def __init__(self, rootNodeId: _Optional[int] = ..., withTags: bool = ...) -> None: ...
+
+class SubtreeNode(_message.Message):
+    __slots__ = ("node", "depth", "tag")
+    NODE_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    node: Node
+    depth: int
+    tag: Tag
+    def __init__(self, node: _Optional[_Union[Node, _Mapping]] = ..., depth: _Optional[int] = ..., tag: _Optional[_Union[Tag, _Mapping]] = ...) -> None: ...
+
+class SubtreeBatch(_message.Message):
+    __slots__ = ("nodes",)
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[SubtreeNode]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[SubtreeNode, _Mapping]]] = ...) -> None: ...
+
+class StreamingSubtreeResponse(_message.Message):
+    __slots__ = ("batch", "error")
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: SubtreeBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[SubtreeBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class RefreshViewsResponse(_message.Message):
+    __slots__ = ("inserted", "deleted", "duration", "requests")
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    DELETED_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    inserted: int
+    deleted: int
+    duration: float
+    requests: int
+    def __init__(self, inserted: _Optional[int] = ..., deleted: _Optional[int] = ..., duration: _Optional[float] = ..., requests: _Optional[int] = ...) -> None: ...
+
+class RpcStats(_message.Message):
+    __slots__ = ("method", "calls", "errors", "inFlight", "p50", "p95", "p99", "totalSeconds", "rowsReceived", "rowsSent", "rowsRejected")
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    ERRORS_FIELD_NUMBER: _ClassVar[int]
+    INFLIGHT_FIELD_NUMBER: _ClassVar[int]
+    P50_FIELD_NUMBER: _ClassVar[int]
+    P95_FIELD_NUMBER: _ClassVar[int]
+    P99_FIELD_NUMBER: _ClassVar[int]
+    TOTALSECONDS_FIELD_NUMBER: _ClassVar[int]
+    ROWSRECEIVED_FIELD_NUMBER: _ClassVar[int]
+    ROWSSENT_FIELD_NUMBER: _ClassVar[int]
+    ROWSREJECTED_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    calls: int
+    errors: int
+    inFlight: int
+    p50: float
+    p95: float
+    p99: float
+    totalSeconds: float
+    rowsReceived: int
+    rowsSent: int
+    rowsRejected: int
+    def __init__(self, method: _Optional[str] = ..., calls: _Optional[int] = ..., errors: _Optional[int] = ..., inFlight: _Optional[int] = ..., p50: _Optional[float] = ..., p95: _Optional[float] = ..., p99: _Optional[float] = ..., totalSeconds: _Optional[float] = ..., rowsReceived: _Optional[int] = ..., rowsSent: _Optional[int] = ..., rowsRejected: _Optional[int] = ...) -> None: ...
+
+class ServerStatsResponse(_message.Message):
+    __slots__ = ("uptime", "rpcs")
+    UPTIME_FIELD_NUMBER: _ClassVar[int]
+    RPCS_FIELD_NUMBER: _ClassVar[int]
+    uptime: float
+    rpcs: _containers.RepeatedCompositeFieldContainer[RpcStats]
+    def __init__(self, uptime: _Optional[float] = ..., rpcs: _Optional[_Iterable[_Union[RpcStats, _Mapping]]] = ...) -> None: ...
+
+class ProfileRequest(_message.Message):
+    __slots__ = ("duration", "memory", "interval", "top")
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    MEMORY_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    TOP_FIELD_NUMBER: _ClassVar[int]
+    duration: float
+    memory: bool
+    interval: float
+    top: int
+    def __init__(self, duration: _Optional[float] = ..., memory: bool = ..., interval: _Optional[float] = ..., top: _Optional[int] = ...) -> None: ...
+
+class ProfileEntry(_message.Message):
+    __slots__ = ("location", "count", "total")
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    location: str
+    count: int
+    total: int
+    def __init__(self, location: _Optional[str] = ..., count: _Optional[int] = ..., total: _Optional[int] = ...) -> None: ...
+
+class ProfileResponse(_message.Message):
+    __slots__ = ("path", "samples", "entries")
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    samples: int
+    entries: _containers.RepeatedCompositeFieldContainer[ProfileEntry]
+    def __init__(self, path: _Optional[str] = ..., samples: _Optional[int] = ..., entries: _Optional[_Iterable[_Union[ProfileEntry, _Mapping]]] = ...) -> None: ...
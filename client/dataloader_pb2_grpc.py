@@ -39,6 +39,11 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.StreamingMediaResponse.FromString,
                 _registered_method=True)
+        self.getMediasBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getMediasBatched',
+                request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
+                _registered_method=True)
         self.getMediaById = channel.unary_unary(
                 '/dataloader.DataLoader/getMediaById',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
@@ -49,6 +54,11 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.GetMediaByURIRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.Media.FromString,
                 _registered_method=True)
+        self.getMediasByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getMediasByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
+                _registered_method=True)
         self.createMedia = channel.unary_unary(
                 '/dataloader.DataLoader/createMedia',
                 request_serializer=dataloader__pb2.Media.SerializeToString,
@@ -89,11 +99,21 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.GetTagsRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.StreamingTagResponse.FromString,
                 _registered_method=True)
+        self.getTagsBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getTagsBatched',
+                request_serializer=dataloader__pb2.GetTagsRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTagBatchResponse.FromString,
+                _registered_method=True)
         self.getTag = channel.unary_unary(
                 '/dataloader.DataLoader/getTag',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.Tag.FromString,
                 _registered_method=True)
+        self.getTagsByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getTagsByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTagBatchResponse.FromString,
+                _registered_method=True)
         self.createTag = channel.unary_unary(
                 '/dataloader.DataLoader/createTag',
                 request_serializer=dataloader__pb2.CreateTagRequest.SerializeToString,
@@ -109,6 +129,11 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.Empty.SerializeToString,
                 response_deserializer=dataloader__pb2.StreamingTaggingResponse.FromString,
                 _registered_method=True)
+        self.getTaggingsBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getTaggingsBatched',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTaggingBatchResponse.FromString,
+                _registered_method=True)
         self.getMediasWithTag = channel.unary_unary(
                 '/dataloader.DataLoader/getMediasWithTag',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
@@ -119,6 +144,16 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.RepeatedIdResponse.FromString,
                 _registered_method=True)
+        self.getMediaTagLists = channel.unary_stream(
+                '/dataloader.DataLoader/getMediaTagLists',
+                request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaTagListResponse.FromString,
+                _registered_method=True)
+        self.queryMedias = channel.unary_stream(
+                '/dataloader.DataLoader/queryMedias',
+                request_serializer=dataloader__pb2.QueryMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
+                _registered_method=True)
         self.createTagging = channel.unary_unary(
                 '/dataloader.DataLoader/createTagging',
                 request_serializer=dataloader__pb2.CreateTaggingRequest.SerializeToString,
@@ -149,11 +184,26 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.GetNodesRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.StreamingNodeResponse.FromString,
                 _registered_method=True)
+        self.getNodesBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getNodesBatched',
+                request_serializer=dataloader__pb2.GetNodesRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingNodeBatchResponse.FromString,
+                _registered_method=True)
         self.getNode = channel.unary_unary(
                 '/dataloader.DataLoader/getNode',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.Node.FromString,
                 _registered_method=True)
+        self.getNodesByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getNodesByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingNodeBatchResponse.FromString,
+                _registered_method=True)
+        self.getSubtree = channel.unary_stream(
+                '/dataloader.DataLoader/getSubtree',
+                request_serializer=dataloader__pb2.GetSubtreeRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingSubtreeResponse.FromString,
+                _registered_method=True)
         self.createNode = channel.unary_unary(
                 '/dataloader.DataLoader/createNode',
                 request_serializer=dataloader__pb2.CreateNodeRequest.SerializeToString,
@@ -161,8 +211,8 @@ class DataLoaderStub(object):
                 _registered_method=True)
         self.createNodeStream = channel.stream_stream(
                 '/dataloader.DataLoader/createNodeStream',
-                request_serializer=dataloader__pb2.CreateNodeRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.StreamingNodeResponse.FromString,
+                request_serializer=dataloader__pb2.CreateNodeStreamRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.CreateNodeStreamResponse.FromString,
                 _registered_method=True)
         self.deleteNode = channel.unary_unary(
                 '/dataloader.DataLoader/deleteNode',
@@ -174,6 +224,21 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.Empty.SerializeToString,
                 response_deserializer=dataloader__pb2.Empty.FromString,
                 _registered_method=True)
+        self.refreshViews = channel.unary_unary(
+                '/dataloader.DataLoader/refreshViews',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.RefreshViewsResponse.FromString,
+                _registered_method=True)
+        self.getServerStats = channel.unary_unary(
+                '/dataloader.DataLoader/getServerStats',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.ServerStatsResponse.FromString,
+                _registered_method=True)
+        self.profile = channel.unary_unary(
+                '/dataloader.DataLoader/profile',
+                request_serializer=dataloader__pb2.ProfileRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.ProfileResponse.FromString,
+                _registered_method=True)
 
 
 class DataLoaderServicer(object):
@@ -186,6 +251,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getMediasBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getMediaById(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -198,6 +269,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getMediasByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createMedia(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -249,12 +326,24 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTagsBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTagsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -274,6 +363,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTaggingsBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getMediasWithTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -286,12 +381,26 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def createTagging(self, request, context):
+    def getMediaTagLists(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def queryMedias(self, request, context):
+        """Get all the medias with the IDs of their tags, in batches, with optional type filter (used for exports)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def createTagging(self, request, context):
+        """Get the medias matching a boolean expression over tags, tagsets and hierarchy nodes, in batches ordered by ID
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createTaggingStream(self, request_iterator, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -326,12 +435,30 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getNodesBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getNode(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getNodesByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def getSubtree(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createNode(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -357,6 +484,27 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def refreshViews(self, request, context):
+        """Reads and executes the DDL, which does 2 things: drop the schemas, and recreate all the tables and rules
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def getServerStats(self, request, context):
+        """Recompute nodes_taggings and tagsets_taggings without blocking their readers, or create them (views.sql)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def profile(self, request, context):
+        """Calls, errors, latencies and rows of each RPC since the server started (also served in the Prometheus format)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DataLoaderServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -365,6 +513,11 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
                     response_serializer=dataloader__pb2.StreamingMediaResponse.SerializeToString,
             ),
+            'getMediasBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediasBatched,
+                    request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
+            ),
             'getMediaById': grpc.unary_unary_rpc_method_handler(
                     servicer.getMediaById,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
@@ -375,6 +528,11 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.GetMediaByURIRequest.FromString,
                     response_serializer=dataloader__pb2.Media.SerializeToString,
             ),
+            'getMediasByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediasByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
+            ),
             'createMedia': grpc.unary_unary_rpc_method_handler(
                     servicer.createMedia,
                     request_deserializer=dataloader__pb2.Media.FromString,
@@ -415,11 +573,21 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.GetTagsRequest.FromString,
                     response_serializer=dataloader__pb2.StreamingTagResponse.SerializeToString,
             ),
+            'getTagsBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTagsBatched,
+                    request_deserializer=dataloader__pb2.GetTagsRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingTagBatchResponse.SerializeToString,
+            ),
             'getTag': grpc.unary_unary_rpc_method_handler(
                     servicer.getTag,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
                     response_serializer=dataloader__pb2.Tag.SerializeToString,
             ),
+            'getTagsByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTagsByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingTagBatchResponse.SerializeToString,
+            ),
             'createTag': grpc.unary_unary_rpc_method_handler(
                     servicer.createTag,
                     request_deserializer=dataloader__pb2.CreateTagRequest.FromString,
@@ -435,6 +603,11 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.Empty.FromString,
                     response_serializer=dataloader__pb2.StreamingTaggingResponse.SerializeToString,
             ),
+            'getTaggingsBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTaggingsBatched,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.StreamingTaggingBatchResponse.SerializeToString,
+            ),
             'getMediasWithTag': grpc.unary_unary_rpc_method_handler(
                     servicer.getMediasWithTag,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
@@ -445,6 +618,16 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
                     response_serializer=dataloader__pb2.RepeatedIdResponse.SerializeToString,
             ),
+            'getMediaTagLists': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediaTagLists,
+                    request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaTagListResponse.SerializeToString,
+            ),
+            'queryMedias': grpc.unary_stream_rpc_method_handler(
+                    servicer.queryMedias,
+                    request_deserializer=dataloader__pb2.QueryMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
+            ),
             'createTagging': grpc.unary_unary_rpc_method_handler(
                     servicer.createTagging,
                     request_deserializer=dataloader__pb2.CreateTaggingRequest.FromString,
@@ -475,11 +658,26 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.GetNodesRequest.FromString,
                     response_serializer=dataloader__pb2.StreamingNodeResponse.SerializeToString,
             ),
+            'getNodesBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getNodesBatched,
+                    request_deserializer=dataloader__pb2.GetNodesRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingNodeBatchResponse.SerializeToString,
+            ),
             'getNode': grpc.unary_unary_rpc_method_handler(
                     servicer.getNode,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
                     response_serializer=dataloader__pb2.Node.SerializeToString,
             ),
+            'getNodesByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getNodesByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingNodeBatchResponse.SerializeToString,
+            ),
+            'getSubtree': grpc.unary_stream_rpc_method_handler(
+                    servicer.getSubtree,
+                    request_deserializer=dataloader__pb2.GetSubtreeRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingSubtreeResponse.SerializeToString,
+            ),
             'createNode': grpc.unary_unary_rpc_method_handler(
                     servicer.createNode,
                     request_deserializer=dataloader__pb2.CreateNodeRequest.FromString,
@@ -487,8 +685,8 @@ def add_DataLoaderServicer_to_server(servicer, server):
             ),
             'createNodeStream': grpc.stream_stream_rpc_method_handler(
                     servicer.createNodeStream,
-                    request_deserializer=dataloader__pb2.CreateNodeRequest.FromString,
-                    response_serializer=dataloader__pb2.StreamingNodeResponse.SerializeToString,
+                    request_deserializer=dataloader__pb2.CreateNodeStreamRequest.FromString,
+                    response_serializer=dataloader__pb2.CreateNodeStreamResponse.SerializeToString,
             ),
             'deleteNode': grpc.unary_unary_rpc_method_handler(
                     servicer.deleteNode,
@@ -500,6 +698,21 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.Empty.FromString,
                     response_serializer=dataloader__pb2.Empty.SerializeToString,
             ),
+            'refreshViews': grpc.unary_unary_rpc_method_handler(
+                    servicer.refreshViews,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.RefreshViewsResponse.SerializeToString,
+            ),
+            'getServerStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.getServerStats,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.ServerStatsResponse.SerializeToString,
+            ),
+            'profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.profile,
+                    request_deserializer=dataloader__pb2.ProfileRequest.FromString,
+                    response_serializer=dataloader__pb2.ProfileResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'dataloader.DataLoader', rpc_method_handlers)
@@ -538,6 +751,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getMediasBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getMediasBatched',
+            dataloader__pb2.GetMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def getMediaById(request,
             target,
@@ -592,6 +832,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getMediasByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getMediasByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def createMedia(request,
             target,
@@ -808,6 +1075,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getTagsBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getTagsBatched',
+            dataloader__pb2.GetTagsRequest.SerializeToString,
+            dataloader__pb2.StreamingTagBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def getTag(request,
             target,
@@ -835,6 +1129,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getTagsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getTagsByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingTagBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def createTag(request,
             target,
@@ -916,6 +1237,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getTaggingsBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getTaggingsBatched',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.StreamingTaggingBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def getMediasWithTag(request,
             target,
@@ -970,6 +1318,60 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getMediaTagLists(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getMediaTagLists',
+            dataloader__pb2.GetMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaTagListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def queryMedias(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/queryMedias',
+            dataloader__pb2.QueryMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def createTagging(request,
             target,
@@ -1132,6 +1534,33 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getNodesBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getNodesBatched',
+            dataloader__pb2.GetNodesRequest.SerializeToString,
+            dataloader__pb2.StreamingNodeBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def getNode(request,
             target,
@@ -1159,6 +1588,60 @@ class DataLoader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def getNodesByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getNodesByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingNodeBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def getSubtree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/dataloader.DataLoader/getSubtree',
+            dataloader__pb2.GetSubtreeRequest.SerializeToString,
+            dataloader__pb2.StreamingSubtreeResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def createNode(request,
             target,
@@ -1201,8 +1684,8 @@ class DataLoader(object):
             request_iterator,
             target,
             '/dataloader.DataLoader/createNodeStream',
-            dataloader__pb2.CreateNodeRequest.SerializeToString,
-            dataloader__pb2.StreamingNodeResponse.FromString,
+            dataloader__pb2.CreateNodeStreamRequest.SerializeToString,
+            dataloader__pb2.CreateNodeStreamResponse.FromString,
             options,
             channel_credentials,
             insecure,
@@ -1266,3 +1749,84 @@ class DataLoader(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def refreshViews(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/dataloader.DataLoader/refreshViews',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.RefreshViewsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def getServerStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/dataloader.DataLoader/getServerStats',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.ServerStatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/dataloader.DataLoader/profile',
+            dataloader__pb2.ProfileRequest.SerializeToString,
+            dataloader__pb2.ProfileResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
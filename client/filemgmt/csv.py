@@ -99,35 +99,36 @@ class CSVHandler(FileHandler):
             csv_writer = csv.writer(file, delimiter=";", quoting=csv.QUOTE_NONE, escapechar='', quotechar='')
             csv_writer.writerow(header)
 
+            # The medias are received with the IDs of their tags in a single stream, then their tags
+            # are retrieved together in batches instead of one request per tagging
             try:
-                response_medias = self.client.get_medias(-1)
-            except RpcError as e:
+                media_rows = [(media_tag_list.media.file_uri, media_tag_list.tagIds)
+                              for media_tag_list in self.client.get_media_tag_lists(-1)]
+            except Exception as e:
                 logging.error(f"Failed to retrieve medias: {e}")
                 return
-            for media_response in response_medias:
-                if media_response.HasField("error"):
-                    logging.warning(f"Error retrieving media: {media_response.error}")
-                    continue
-                path = media_response.file_uri                              # type: ignore
+
+            tag_values = {}
+            try:
+                for tag_response in self.client.get_tags_by_ids({id_tag for _, tag_ids in media_rows for id_tag in tag_ids}):
+                    possible_values = [tag_response.alphanumerical.value,
+                                    tag_response.timestamp.value,
+                                    tag_response.time.value,
+                                    tag_response.date.value,
+                                    tag_response.numerical.value]
+                    value = next(value for value in possible_values if value != "")
+                    tag_values[tag_response.id] = (tag_response.tagSetId, value)
+            except Exception as e:
+                logging.error(f"Failed to retrieve tags: {e}")
+                return
+
+            for path, tag_ids in media_rows:
                 row = [f'\"{path}\"']
-                try:
-                    tag_ids = self.client.get_media_tags(media_response.id)          # type: ignore
-                except RpcError as e:
-                    logging.error(f"Failed to retrieve tags for media {media_response.id}: {e}")
-                    continue
                 for id_tag in tag_ids:
-                    try:
-                        tag_response = self.client.get_tag(int(id_tag))                      # type: ignore
-                    except RpcError as e:
-                        logging.warning(f"Failed to retrieve tag {id_tag}: {e}")
+                    if id_tag not in tag_values:
+                        logging.warning(f"Failed to retrieve tag {id_tag}")
                         continue
-                    tagset_id = tag_response.tagSetId                               # type: ignore
-                    possible_values = [tag_response.alphanumerical.value,           # type: ignore
-                                    tag_response.timestamp.value,                # type: ignore
-                                    tag_response.time.value,                     # type: ignore
-                                    tag_response.date.value,                     # type: ignore
-                                    tag_response.numerical.value]                # type: ignore
-                    value = next(value for value in possible_values if value != "")
+                    tagset_id, value = tag_values[id_tag]
                     row.extend([f'{tagset_id}', f'\"{value}\"'])
                     
                 csv_writer.writerow(row)
@@ -16,6 +16,10 @@ class FastJSONHandler(FileHandler):
 # NOTE: I used the library tqdm for visualising progress and measuring execution times, but it mixed the execution times of
 # the different sections. All the 'tqdm.write' statements are basically prints made to work with tqdm progress bars
 
+    def __init__(self, bulk_load: bool = False) -> None:
+        super().__init__()
+        self.bulk_load = bulk_load      # Send the tags, taggings and nodes in the bulk-load mode of the server
+
     def importFile(self, path):
     # Import a JSON file's contents using the 'fast' format. It is structured in 3 parts: 
     # - Tagsets and their respective tags, with value and ID
@@ -61,7 +65,7 @@ class FastJSONHandler(FileHandler):
                         tags = tagset_item.get('tags')
                         tagid_map_frag = {}
                         try:
-                            tags_response_iterator = thread_client.add_tags(tagset_response.id, tagset_type, tags)
+                            tags_response_iterator = thread_client.add_tags(tagset_response.id, tagset_type, tags, self.bulk_load)
                         except RpcError as e:
                             if e.code() == StatusCode.UNAVAILABLE:
                                 logging.error(f"Service unavailable while adding tags for tagset {tagset_name}: {e}")
@@ -69,10 +73,12 @@ class FastJSONHandler(FileHandler):
                             logging.warning(f"Failed to add tags for tagset {tagset_name}: {e}")
                             return
                         for tags_response in tags_response_iterator:
-                            if tags_response.HasField("error"):
-                                logging.warning(f"Error adding tags for tagset {tagset_name}: {tags_response.error}")
+                            if tags_response.error_message:
+                                logging.warning(f"Error adding tags for tagset {tagset_name}: {tags_response.error_message}")
                                 return
-                            tagid_map_frag.update(tags_response)
+                            for rejected in tags_response.rejected:
+                                logging.warning(f"Tag {tags[rejected.index].get('id')} of tagset {tagset_name} was not added: {rejected.error.message}")
+                            tagid_map_frag.update(tags_response.id_map)
 
                         return tagid_map_frag
                                     
@@ -113,7 +119,7 @@ class FastJSONHandler(FileHandler):
                                 tags.append(tag_id_map[item])
 
                         try:
-                            response_iterator = thread_client.add_taggings(media_id=media_response.id, tag_ids=tags)
+                            response_iterator = thread_client.add_taggings(media_id=media_response.id, tag_ids=tags, bulk_load=self.bulk_load)
                         except RpcError as e:
                             if e.code() == StatusCode.UNAVAILABLE:
                                 logging.error(f"Service unavailable while adding taggings for media {media_path}: {e}")
@@ -124,6 +130,8 @@ class FastJSONHandler(FileHandler):
                         for response in response_iterator:
                             if response.HasField("error"):
                                 logging.warning(f"Error adding taggings for media {media_path}: {response.error}")
+                            for rejected in response.rejected:
+                                logging.warning(f"Tagging of media {media_path} with tag {tags[rejected.index]} was not added: {rejected.error.message}")
                             continue
                         return None
                     
@@ -158,36 +166,30 @@ class FastJSONHandler(FileHandler):
                                 return
                             hierarchy_id = hierarchy_response.id
 
-                            def addNode(node, parentnode_id):
-                                tag_id = tag_id_map[node.get('tag_id')]
-                                if tag_id:
-                                    try:
-                                        new_node = thread_client.add_node(tag_id, hierarchy_id, parentnode_id)    # type: ignore
-                                    except RpcError as e:
-                                        if e.code() == StatusCode.UNAVAILABLE:
-                                            logging.error(f"Service unavailable while adding node with tag {tag_id} to hierarchy {hierarchy_id}: {e}")
-                                            print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                                        logging.warning(f"Failed to add node with tag {tag_id} to hierarchy {hierarchy_id}: {e}")
-                                        return
-                                    child_nodes = node.get('child_nodes')
-                                    for child_node_item in child_nodes:
-                                        addNode(child_node_item, new_node.id)
+                            def nodes():
+                            # Walk of the hierarchy sending each node before its children, with temporary IDs given in
+                            # visit order. A node whose tag was not imported is skipped with its subtree.
+                                temp_id = 0
+                                stack = [(hierarchy_item.get('rootnode'), 0)]
+                                while stack:
+                                    node, parent_temp_id = stack.pop()
+                                    tag_id = tag_id_map.get(node.get('tag_id'))
+                                    if tag_id:
+                                        temp_id += 1
+                                        yield (temp_id, tag_id, hierarchy_id, parent_temp_id)
+                                        for child_node_item in reversed(node.get('child_nodes')):
+                                            stack.append((child_node_item, temp_id))
 
-                            
-                            rootnode_item = hierarchy_item.get('rootnode')
-                            rootnode_tag_id = tag_id_map[rootnode_item.get('tag_id')]
-                            if rootnode_tag_id:
-                                try:
-                                    rootnode_id = thread_client.add_rootnode(rootnode_tag_id, hierarchy_response.id).id   # type: ignore
-                                except RpcError as e:
-                                    if e.code() == StatusCode.UNAVAILABLE:
-                                        logging.error(f"Service unavailable while adding root node with tag {rootnode_tag_id} to hierarchy {hierarchy_id}: {e}")
-                                        print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                                    logging.warning(f"Failed to add root node with tag {rootnode_tag_id} to hierarchy {hierarchy_id}: {e}")
-                                    return
-                                child_nodes = rootnode_item.get('child_nodes')
-                                for child_node_item in child_nodes:                    
-                                    addNode(child_node_item, rootnode_id)
+                            try:
+                                for nodes_response in thread_client.add_nodes(nodes(), self.bulk_load):
+                                    if nodes_response.HasField("error"):
+                                        logging.warning(f"Error adding nodes to hierarchy {hierarchy_id}: {nodes_response.error.message}")
+                            except RpcError as e:
+                                if e.code() == StatusCode.UNAVAILABLE:
+                                    logging.error(f"Service unavailable while adding nodes to hierarchy {hierarchy_id}: {e}")
+                                    print("Fatal error, check log file.", file=sys.stderr);exit(1)
+                                logging.warning(f"Failed to add nodes to hierarchy {hierarchy_id}: {e}")
+                                return
                                     
                         except Exception as e:
                             printlock.acquire()
@@ -214,7 +216,6 @@ class FastJSONHandler(FileHandler):
         tagsets = []
         tagsets_lock = threading.Lock()
         medias = []
-        medias_lock = threading.Lock()
         hierarchies = []
         hierarchies_lock = threading.Lock()
 
@@ -239,9 +240,6 @@ class FastJSONHandler(FileHandler):
                 logging.error(f"Failed to retrieve tags for tagset {tagset_response.id}: {e}")
                 return
             for tag_response in response_tags:
-                if tag_response.HasField("error"):
-                    logging.warning(f"Error retrieving tag {tag_response.id} for tagset {tagset_response.id}: {tag_response.error}")
-                    continue
                 tag_id = tag_response.id                               
                 possible_values = [tag_response.alphanumerical.value,
                                 tag_response.timestamp.value,
@@ -271,51 +269,27 @@ class FastJSONHandler(FileHandler):
 
         tagset_executor.shutdown()
         
+        # The medias are received with the IDs of their tags in a single stream, instead of one request per media
         medias_pbar = tqdm(total=0, desc="Exporting medias")
-        def processMedia(media_response):
-            thread_client = grpc_client.LoaderClient()
-            tag_ids = []
-            try:
-                tag_ids_response = thread_client.get_media_tags(media_response.id)
-            except RpcError as e:
-                if e.code() == StatusCode.UNAVAILABLE:
-                    logging.error(f"Service unavailable while retrieving tags for media {media_response.id}: {e}")
-                    print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                logging.error(f"Failed to retrieve tags for media {media_response.id}: {e}")
-  
-            tag_ids = list(tag_ids_response)
-            medias_lock.acquire()
-            medias.append(
-                {
-                    "path":media_response.file_uri,
-                    "tags":tag_ids
-                }
-            )
-            medias_lock.release()
-            medias_pbar.update(1)
-
         try:
-            response_medias = self.client.get_medias(-1)
+            for media_tag_list in self.client.get_media_tag_lists(-1):
+                medias.append(
+                    {
+                        "path":media_tag_list.media.file_uri,
+                        "tags":list(media_tag_list.tagIds)
+                    }
+                )
+                medias_pbar.total += 1
+                medias_pbar.update(1)
         except RpcError as e:
             if e.code() == StatusCode.UNAVAILABLE:
                 logging.error(f"Service unavailable while retrieving medias: {e}")
                 print("Fatal error, check log file.", file=sys.stderr);exit(1)
             logging.error(f"Failed to retrieve medias: {e}")
             return
-
-        medias_executor = ThreadPoolExecutor(max_workers=10)
-        for media_response in response_medias:
-            if media_response.HasField("error"):
-                if media_response.error.code == StatusCode.NOT_FOUND:
-                    continue
-                else:
-                    logging.warning(f"Error retrieving media {media_response.id}: {media_response.error}")
-                    return
-            medias_pbar.total += 1
-            medias_pbar.refresh()
-            medias_executor.submit(processMedia, media_response)
-        
-        medias_executor.shutdown()
+        except Exception as e:
+            logging.error(f"Failed to retrieve medias: {e}")
+            return
                 
         try:
             response_hierarchies = self.client.get_hierarchies(-1)
@@ -330,35 +304,25 @@ class FastJSONHandler(FileHandler):
             thread_client = grpc_client.LoaderClient()
             hierarchy_name = hierarchy_response.name
             hierarchy_tagset_id = hierarchy_response.tagSetId
+            # The whole hierarchy is received with one request, and the tree is built in one pass
+            # since each node comes after its parent
+            trees = {}
             try:
-                rootnode = thread_client.get_node(hierarchy_response.rootNodeId)
+                for subtree_node in thread_client.get_subtree(hierarchy_response.rootNodeId):
+                    tree = {"tag_id": subtree_node.node.tagId, "child_nodes": []}
+                    trees[subtree_node.node.id] = tree
+                    if subtree_node.depth > 0:
+                        trees[subtree_node.node.parentNodeId]["child_nodes"].append(tree)
             except RpcError as e:
                 if e.code() == StatusCode.UNAVAILABLE:
-                    logging.error(f"Service unavailable while retrieving root node for hierarchy {hierarchy_name}: {e}")
+                    logging.error(f"Service unavailable while retrieving the nodes of hierarchy {hierarchy_name}: {e}")
                     print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                logging.error(f"Failed to retrieve root node for hierarchy {hierarchy_name}: {e}")
+                logging.error(f"Failed to retrieve the nodes of hierarchy {hierarchy_name}: {e}")
+                return
+            except Exception as e:
+                logging.error(f"Failed to retrieve the nodes of hierarchy {hierarchy_name}: {e}")
                 return
-            def fillTree(node):
-                try:
-                    child_nodes_response = thread_client.get_nodes(parentnode_id=node.id)
-                except RpcError as e:
-                    if e.code() == StatusCode.UNAVAILABLE:
-                        logging.error(f"Service unavailable while retrieving child nodes for node {node.id}: {e}")
-                        print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                    logging.error(f"Failed to retrieve child nodes for node {node.id}: {e}")
-                    return {"tag_id": node.tagId, "child_nodes": []}
-                child_nodes = []
-                for child_node in child_nodes_response:
-                    if child_node.HasField("error"):
-                        if child_node.error.code == StatusCode.NOT_FOUND:
-                            return {"tag_id": node.tagId, "child_nodes": []}
-                        else:
-                            logging.warning(f"Error retrieving child node {child_node.id}: {child_node.error}")
-                            return {"tag_id": node.tagId, "child_nodes": []}
-                    child_nodes.append(fillTree(child_node))
-                return {"tag_id": node.tagId, "child_nodes":child_nodes}
-            
-            filled_tree = fillTree(rootnode)
+            filled_tree = trees[hierarchy_response.rootNodeId]
             hierarchies_lock.acquire()
             hierarchies.append({
                 "name":hierarchy_name,
@@ -155,39 +155,33 @@ class JSONHandler(FileHandler):
         medias = []
         hierarchies = []
 
-        def fillTree(node):
+        def fillTree(rootnode_id):
+        # The whole hierarchy is received with its tags in one request, and the tree is built in one pass
+        # since each node comes after its parent
+            trees = {}
             try:
-                tag_response = self.client.get_tag(node.tagId)
+                for subtree_node in self.client.get_subtree(rootnode_id, with_tags=True):
+                    tag_response = subtree_node.tag
+                    possible_values = [tag_response.alphanumerical.value,
+                                    tag_response.timestamp.value,
+                                    tag_response.time.value,
+                                    tag_response.date.value,
+                                    tag_response.numerical.value]
+                    value = next(value for value in possible_values if value != "")
+                    tree = {"tag_value": value, "child_nodes": []}
+                    trees[subtree_node.node.id] = tree
+                    if subtree_node.depth > 0:
+                        trees[subtree_node.node.parentNodeId]["child_nodes"].append(tree)
             except RpcError as e:
                 if e.code() == StatusCode.UNAVAILABLE:
-                    logging.error(f"Service unavailable while retrieving tag {node.tagId}: {e}")
+                    logging.error(f"Service unavailable while retrieving the nodes under node {rootnode_id}: {e}")
                     print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                logging.warning(f"Failed to retrieve tag for node {node.id}: {e}")
+                logging.warning(f"Failed to retrieve the nodes under node {rootnode_id}: {e}")
                 return {"tag_value": "", "child_nodes":[]}
-            possible_values = [tag_response.alphanumerical.value,           # type: ignore
-                                        tag_response.timestamp.value,                # type: ignore
-                                        tag_response.time.value,                     # type: ignore
-                                        tag_response.date.value,                     # type: ignore
-                                        tag_response.numerical.value]                # type: ignore
-            value = next(value for value in possible_values if value != "")
-            try:
-                child_nodes_response = self.client.get_nodes(parentnode_id=node.id)
-            except RpcError as e:
-                if e.code() == StatusCode.UNAVAILABLE:
-                    logging.error(f"Service unavailable while retrieving child nodes for node {node.id}: {e}")
-                    print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                logging.warning(f"Failed to retrieve child nodes for node {node.id}: {e}")
-                return {"tag_value": value, "child_nodes":[]}
-            child_nodes = []
-            for child_node in child_nodes_response:
-                if child_node.HasField("error"):
-                    if child_node.error.code == StatusCode.NOT_FOUND:
-                        return {"tag_value": value, "child_nodes":[]}
-                    else:
-                        logging.warning(f"Error retrieving child node {child_node.id}: {child_node.error.message}")
-                        continue
-                child_nodes.append(fillTree(child_node))
-            return {"tag_value": value, "child_nodes":child_nodes}
+            except Exception as e:
+                logging.warning(f"Failed to retrieve the nodes under node {rootnode_id}: {e}")
+                return {"tag_value": "", "child_nodes":[]}
+            return trees[rootnode_id]
         
         try:
             response_tagsets = self.client.get_tagsets(-1)
@@ -209,46 +203,42 @@ class JSONHandler(FileHandler):
                 "type": tagset_response.tagTypeId   # type: ignore
                 })
         
+        # The medias are received with the IDs of their tags in a single stream
         try:
-            response_medias = self.client.get_medias(-1)
+            for media_tag_list in self.client.get_media_tag_lists(-1):
+                medias.append({"path": media_tag_list.media.file_uri, "tags": list(media_tag_list.tagIds)})
         except RpcError as e:
             if e.code() == StatusCode.UNAVAILABLE:
                 logging.error(f"Service unavailable while retrieving medias: {e}")
                 print("Fatal error, check log file.", file=sys.stderr);exit(1)
             logging.error(f"Failed to retrieve medias: {e}")
             return
-        for media_response in response_medias:
-            if media_response.HasField("error"):
-                if media_response.error.code == StatusCode.NOT_FOUND:
-                    continue
-                else:
-                    logging.warning(f"Error retrieving media: {media_response.error.message}")
-                    continue
-            media_path = media_response.file_uri
-            tags = []
-            try:
-                tag_ids = self.client.get_media_tags(media_response.id)          # type: ignore
-            except RpcError as e:
-                if e.code() == StatusCode.UNAVAILABLE:
-                    logging.error(f"Service unavailable while retrieving tags for media {media_response.id}: {e}")
-                    print("Fatal error, check log file.", file=sys.stderr);exit(1)
-                logging.error(f"Failed to retrieve tags for media {media_response.id}: {e}")
-                continue
-            for id_tag in tag_ids:
-                tag_response = self.client.get_tag(id_tag)                     
-                tagset_id = tag_response.tagSetId                               # type: ignore
-                possible_values = [tag_response.alphanumerical.value,           # type: ignore
-                                tag_response.timestamp.value,                # type: ignore
-                                tag_response.time.value,                     # type: ignore
-                                tag_response.date.value,                     # type: ignore
-                                tag_response.numerical.value]                # type: ignore
+        except Exception as e:
+            logging.error(f"Failed to retrieve medias: {e}")
+            return
+
+        # The tags of all the medias are retrieved together in batches, instead of one request per tagging,
+        # and the tag IDs of the medias are replaced by their tagset and value
+        tag_values = {}
+        try:
+            for tag_response in self.client.get_tags_by_ids({id_tag for media in medias for id_tag in media["tags"]}):
+                possible_values = [tag_response.alphanumerical.value,
+                                tag_response.timestamp.value,
+                                tag_response.time.value,
+                                tag_response.date.value,
+                                tag_response.numerical.value]
                 value = next(value for value in possible_values if value != "")     # Due to grpc standrads, the numerical value won't be Null if not initialised, 
                                                                                     # but zero. Thus we take advantage of the fact that it is the last possible value and
                                                                                     # that only one value can be set for a specified tag
-
-                tags.append({"tagset_id":tagset_id, "value":value})
-
-            medias.append({"path": media_path, "tags": tags})
+                tag_values[tag_response.id] = {"tagset_id":tag_response.tagSetId, "value":value}
+        except RpcError as e:
+            if e.code() == StatusCode.UNAVAILABLE:
+                logging.error(f"Service unavailable while retrieving tags: {e}")
+                print("Fatal error, check log file.", file=sys.stderr);exit(1)
+            logging.error(f"Failed to retrieve tags: {e}")
+            return
+        for media in medias:
+            media["tags"] = [tag_values[id_tag] for id_tag in media["tags"] if id_tag in tag_values]
 
 
         try:
@@ -268,8 +258,7 @@ class JSONHandler(FileHandler):
                     continue
             hierarchy_name = hierarchy_response.name
             hierarchy_tagset_id = hierarchy_response.tagSetId
-            rootnode = self.client.get_node(hierarchy_response.rootNodeId)
-            filled_tree = fillTree(rootnode)
+            filled_tree = fillTree(hierarchy_response.rootNodeId)
             hierarchies.append({
                 "name":hierarchy_name,
                 "tagset_id":hierarchy_tagset_id,
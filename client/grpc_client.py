@@ -1,12 +1,82 @@
+import logging
 import os
+import uuid
 
 import grpc
 import dataloader_pb2 as rpc_objects
 import dataloader_pb2_grpc
 
+IDS_PER_REQUEST = 5000      # IDs sent in each request of the get..._by_ids functions
+BULK_LOAD_METADATA = (("bulk-load", "true"),)   # Metadata of the import streams sent in bulk-load mode
+STREAM_TRANSACTION_METADATA = (("stream-transaction", "true"),)   # Whole import stream in one transaction
+REQUEST_ID_METADATA = "request-id"  # Metadata holding the ID of a call, which prefixes the logs of the server
+
+
+class NoResultsError(Exception):
+# NOT_FOUND status sent by the list RPCs when there are no results, holding its message
+    pass
+
+
+def unpack_batches(response_iterator, not_found: bool = False):
+# Yields the batches received from one of the batched streaming RPCs. NOT_FOUND, sent when there are no results,
+# ends the iteration, or raises NoResultsError with not_found. The other errors are raised
+    for response in response_iterator:
+        if response.HasField("error"):
+            if response.error.code == grpc.StatusCode.NOT_FOUND.value[0]:
+                if not_found:
+                    raise NoResultsError(response.error.message)
+                return
+            raise Exception(response.error.message)
+        yield response.batch
+
+
+def stream_metadata(bulk_load: bool = False, transaction: bool = False):
+# Metadata of the import streams. With transaction, nothing is committed if the stream fails or is interrupted
+    metadata = (BULK_LOAD_METADATA if bulk_load else ()) + (STREAM_TRANSACTION_METADATA if transaction else ())
+    return metadata or None
+
+
+def get_batches_by_ids(rpc, ids):
+# Calls one of the get...ByIds RPCs for each chunk of IDS_PER_REQUEST IDs and yields the received batches.
+# A chunk without any existing ID is answered with NOT_FOUND and skipped
+    ids = list(ids)
+    for start in range(0, len(ids), IDS_PER_REQUEST):
+        request = rpc_objects.RepeatedIdRequest(ids=ids[start:start + IDS_PER_REQUEST])
+        yield from unpack_batches(rpc(request))
+
+
+class RequestIdInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor,
+                           grpc.StreamUnaryClientInterceptor, grpc.StreamStreamClientInterceptor):
+# Sends a new request ID with every call, so that the logs of the client and the server can be matched.
+# The failed unary calls are logged with their ID, and the streams when they start (at DEBUG level)
+    logger = logging.getLogger(__name__)
+
+    def with_request_id(self, client_call_details):
+        request_id = uuid.uuid4().hex[:12]
+        metadata = list(client_call_details.metadata or ()) + [(REQUEST_ID_METADATA, request_id)]
+        return request_id, client_call_details._replace(metadata=metadata)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        request_id, client_call_details = self.with_request_id(client_call_details)
+        call = continuation(client_call_details, request)
+        if call.exception() is not None:
+            self.logger.warning("Request %s to %s failed: %s", request_id, client_call_details.method, call.details())
+        return call
+
+    def intercept_stream(self, continuation, client_call_details, request):
+        request_id, client_call_details = self.with_request_id(client_call_details)
+        self.logger.debug("Request %s to %s", request_id, client_call_details.method)
+        return continuation(client_call_details, request)
+
+    intercept_unary_stream = intercept_stream
+    intercept_stream_unary = intercept_stream
+    intercept_stream_stream = intercept_stream
+
+
 class LoaderClient:
     def __init__(self, grpc_host='localhost', grpc_port='50051') -> None:
-        self.grpc_channel = grpc.insecure_channel(f'{grpc_host}:{grpc_port}')
+        self.grpc_channel = grpc.intercept_channel(grpc.insecure_channel(f'{grpc_host}:{grpc_port}'),
+                                                   RequestIdInterceptor())
         self.grpc_stub = dataloader_pb2_grpc.DataLoaderStub(self.grpc_channel)
 
     #!================ Media/media functions ======================================================================
@@ -25,15 +95,21 @@ class LoaderClient:
         return response
 
 
-    def get_medias(self, file_type: int):
+    def get_medias_by_ids(self, ids):
+    # Get the medias with the given IDs, the IDs that do not exist are skipped
+        for batch in get_batches_by_ids(self.grpc_stub.getMediasByIds, ids):
+            yield from batch.medias
+
+
+    def get_medias(self, file_type: int, not_found: bool = False):
         # List all the medias stored with an optional filter on the file type
         if file_type > 0:
             request = rpc_objects.GetMediasRequest(file_type=file_type)
         else :
             request = rpc_objects.GetMediasRequest()
-        response_iterator = self.grpc_stub.getMedias(request)
-        for response in response_iterator:
-            yield response.media
+        # The medias are received in batches and yielded one by one
+        for batch in unpack_batches(self.grpc_stub.getMediasBatched(request), not_found):
+            yield from batch.medias
             
 
     def add_dir(self, directory: str, formats):
@@ -63,7 +139,17 @@ class LoaderClient:
        
         response_iterator = self.grpc_stub.createMediaStream(add_media_requests_generator())
         for response in response_iterator:
-            yield 'Info: added %d medias to database.' % (response.count)
+            # Each response holds the inserted and skipped (URI already in the database) counts so far, with the
+            # medias of the batch that could not be added, or an error for a batch that failed as a whole
+            if response.HasField("error"):
+                yield 'Warning: a batch of files was not added: %s' % response.error.message
+                continue
+            for rejected in response.rejected:
+                yield 'Warning: file %d was not added: %s' % (rejected.index + 1, rejected.error.message)
+            if response.skipped > 0:
+                yield 'Info: added %d medias to database, %d already in the database.' % (response.inserted, response.skipped)
+            else:
+                yield 'Info: added %d medias to database.' % response.inserted
         if file_count == 0 : yield 'Info: no files of the specified format were found in the directory.'
         else : yield 'Info: %d files were found in the directory.' % file_count
 
@@ -121,7 +207,7 @@ class LoaderClient:
         
     #!================ Tag functions ======================================================================
     
-    def get_tags(self, tagtype_id: int, tagset_id: int):
+    def get_tags(self, tagtype_id: int, tagset_id: int, not_found: bool = False):
         if tagtype_id > 0 and tagset_id > 0:
             request = rpc_objects.GetTagsRequest(
                 tagTypeId=tagtype_id,
@@ -138,9 +224,8 @@ class LoaderClient:
         else:
             request = rpc_objects.GetTagsRequest()
             
-        response_iterator = self.grpc_stub.getTags(request)
-        for response in response_iterator:
-            yield response.tag
+        for batch in unpack_batches(self.grpc_stub.getTagsBatched(request), not_found):
+            yield from batch.tags
 
     def add_tag(self, tagset_id: int, tagtype_id: int, value):
         match tagtype_id:
@@ -182,7 +267,8 @@ class LoaderClient:
         return response
    
         
-    def add_tags(self, tagset_id: int, tagtype_id: int, tags:list[dict]):
+    def add_tags(self, tagset_id: int, tagtype_id: int, tags:list[dict], bulk_load: bool = False, transaction: bool = False):
+        # With bulk_load, the server validates each batch with a single query instead of per-row triggers
         def tags_iterator():
             for tag_item in tags:
                 request = None
@@ -228,10 +314,13 @@ class LoaderClient:
                 except Exception as e:
                     print(f"Error: {e}")
                 yield request
-        response_iterator = self.grpc_stub.createTagStream(tags_iterator())
+        # Each response holds the map of the given tag IDs to the database IDs for a batch, and the rejected tags,
+        # or an error_message
+        metadata = stream_metadata(bulk_load, transaction)
+        response_iterator = self.grpc_stub.createTagStream(tags_iterator(), metadata=metadata)
         try:
             for response in response_iterator:
-                yield response.id_map
+                yield response
         except Exception as e:
             print(f"Tagset: {tagset_id}, TagType: {tagtype_id}")
             print(f"Error: {e}")
@@ -241,12 +330,18 @@ class LoaderClient:
         response = self.grpc_stub.getTag(request)
         return response
 
+    def get_tags_by_ids(self, ids):
+        # Get the tags with the given IDs, the IDs that do not exist are skipped
+        for batch in get_batches_by_ids(self.grpc_stub.getTagsByIds, ids):
+            yield from batch.tags
+
     #!================ Tagging functions ======================================================================
-    def get_taggings(self):
+    def get_taggings(self, not_found: bool = False):
         request = rpc_objects.Empty()
-        response_iterator = self.grpc_stub.getTaggings(request)
-        for response in response_iterator:
-            yield response.tagging
+        # The taggings are received in batches of columns
+        for batch in unpack_batches(self.grpc_stub.getTaggingsBatched(request), not_found):
+            for media_id, tag_id in zip(batch.mediaIds, batch.tagIds):
+                yield rpc_objects.Tagging(mediaId=media_id, tagId=tag_id)
 
     def add_tagging(self, tag_id: int, media_id: int):
         request = rpc_objects.CreateTaggingRequest(
@@ -256,13 +351,16 @@ class LoaderClient:
         response = self.grpc_stub.createTagging(request)
         return response
     
-    def add_taggings(self, media_id, tag_ids):
+    def add_taggings(self, media_id, tag_ids, bulk_load: bool = False, transaction: bool = False):
         def taggings_iterator():
             for tag_id in tag_ids:
                 yield rpc_objects.CreateTaggingRequest(mediaId=media_id, tagId=tag_id)
 
-        for response in self.grpc_stub.createTaggingStream(taggings_iterator()):
-            yield response.count
+        # Each response holds the received, inserted and skipped counts and the rejected taggings,
+        # or an error for a failed batch
+        metadata = stream_metadata(bulk_load, transaction)
+        for response in self.grpc_stub.createTaggingStream(taggings_iterator(), metadata=metadata):
+            yield response
 
     def get_medias_with_tag(self, id: int):
         request = rpc_objects.IdRequest(id=id)
@@ -274,6 +372,19 @@ class LoaderClient:
         response = self.grpc_stub.getMediaTags(request)
         return response.ids
 
+    def get_media_tag_lists(self, file_type: int):
+        # Get all the medias with the IDs of their tags, with an optional filter on the file type
+        request = rpc_objects.GetMediasRequest(file_type=file_type) if file_type > 0 else rpc_objects.GetMediasRequest()
+        for batch in unpack_batches(self.grpc_stub.getMediaTagLists(request)):
+            yield from batch.medias
+
+    def query_medias(self, query: rpc_objects.MediaQuery, limit: int = 0):
+        # Get the medias matching a boolean expression, in ID order. E.g. tag 1 AND NOT tag 2:
+        # MediaQuery(allOf=MediaQueryList(operands=[MediaQuery(tagId=1), MediaQuery(negation=MediaQuery(tagId=2))]))
+        request = rpc_objects.QueryMediasRequest(query=query, limit=limit)
+        for batch in unpack_batches(self.grpc_stub.queryMedias(request)):
+            yield from batch.medias
+
 #!================ Hierarchy functions ====================================================================
 
     def get_hierarchies(self, tagset_id: int):
@@ -321,18 +432,46 @@ class LoaderClient:
         )
         response = self.grpc_stub.createNode(request)
         return response
+
+    def add_nodes(self, nodes, bulk_load: bool = False):
+        # nodes is an iterable of (temp_id, tag_id, hierarchy_id, parent_temp_id), with parent_temp_id = 0 for a rootnode
+        # and each parent before its children. Yields the map of temporary IDs to node IDs of each batch, or an error
+        def nodes_iterator():
+            for temp_id, tag_id, hierarchy_id, parent_temp_id in nodes:
+                yield rpc_objects.CreateNodeStreamRequest(
+                    tempId=temp_id,
+                    tagId=tag_id,
+                    hierarchyId=hierarchy_id,
+                    parentTempId=parent_temp_id
+                )
+
+        metadata = BULK_LOAD_METADATA if bulk_load else None
+        for response in self.grpc_stub.createNodeStream(nodes_iterator(), metadata=metadata):
+            yield response
         
         
     def get_node(self, id: int):
         request = rpc_objects.IdRequest(id=id)
         response = self.grpc_stub.getNode(request)
         return response
+
+    def get_nodes_by_ids(self, ids):
+        # Get the nodes with the given IDs, the IDs that do not exist are skipped
+        for batch in get_batches_by_ids(self.grpc_stub.getNodesByIds, ids):
+            yield from batch.nodes
     
-    def get_nodes(self, hierarchy_id: int = 0, tag_id: int = 0, parentnode_id: int = 0):
+    def get_subtree(self, root_node_id: int, with_tags: bool = False):
+        # Get a node and all the nodes below it, with their depth and optionally their tag. Each node comes after its parent
+        request = rpc_objects.GetSubtreeRequest(rootNodeId=root_node_id, withTags=with_tags)
+        for response in self.grpc_stub.getSubtree(request):
+            if response.HasField("error"):
+                raise Exception(response.error.message)
+            yield from response.batch.nodes
+    
+    def get_nodes(self, hierarchy_id: int = 0, tag_id: int = 0, parentnode_id: int = 0, not_found: bool = False):
         request = rpc_objects.GetNodesRequest(hierarchyId=hierarchy_id, tagId=tag_id, parentNodeId=parentnode_id)
-        response_iterator = self.grpc_stub.getNodes(request)
-        for response in response_iterator:
-            yield response.node
+        for batch in unpack_batches(self.grpc_stub.getNodesBatched(request), not_found):
+            yield from batch.nodes
     
     def delete_node(self, node_id: int):
         request = rpc_objects.IdRequest(id=node_id)
@@ -346,4 +485,21 @@ class LoaderClient:
     def reset(self):
         request = rpc_objects.Empty()
         response = self.grpc_stub.resetDatabase(request)
-        return 'Success, database was successfully reset.'
\ No newline at end of file
+        return 'Success, database was successfully reset.'
+
+    # Refresh the materialisations used by the browser (nodes_taggings, tagsets_taggings), or create them
+    def refresh_views(self):
+        request = rpc_objects.Empty()
+        return self.grpc_stub.refreshViews(request)
+
+
+    # Calls, errors, latencies and rows of each RPC since the server started
+    def get_server_stats(self):
+        request = rpc_objects.Empty()
+        return self.grpc_stub.getServerStats(request)
+
+
+    # Profile the server for duration seconds, sampling its stacks or tracing its memory allocations
+    def profile(self, duration, memory=False, interval=0, top=0):
+        request = rpc_objects.ProfileRequest(duration=duration, memory=memory, interval=interval, top=top)
+        return self.grpc_stub.profile(request, timeout=duration + 30)
\ No newline at end of file
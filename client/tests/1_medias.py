@@ -15,7 +15,7 @@ def test_cli():
     # Test 'get all medias' with empty DB
     result = runner.invoke(cli, ['get', 'medias'])
     print('Result: ', result.output)
-    assert result.output.strip() == "Exception('No results were fetched')"
+    assert result.output.strip() == "No results were fetched"
     
     # Test 'get 1 media' with empty DB
     result = runner.invoke(cli, ['get', 'media', '-i', '1'])
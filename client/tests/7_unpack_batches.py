@@ -0,0 +1,39 @@
+import pytest
+import grpc
+from google.rpc import status_pb2
+import dataloader_pb2 as rpc_objects
+from grpc_client import unpack_batches, NoResultsError
+
+# These tests do not need the server: the responses of the batched RPCs are built locally
+
+def batch_response(*ids):
+    return rpc_objects.StreamingMediaBatchResponse(batch=rpc_objects.MediaBatch(medias=[rpc_objects.Media(id=i) for i in ids]))
+
+def error_response(code, message):
+    return rpc_objects.StreamingMediaBatchResponse(error=status_pb2.Status(code=code.value[0], message=message))
+
+def test_batches():
+    # The batches are yielded in order
+    batches = list(unpack_batches(iter([batch_response(1, 2), batch_response(3)])))
+    assert [[media.id for media in batch.medias] for batch in batches] == [[1, 2], [3]]
+
+def test_not_found():
+    not_found = error_response(grpc.StatusCode.NOT_FOUND, "NotFoundError('No results were fetched')")
+
+    # NOT_FOUND ends the iteration by default, e.g. for the children of a leaf node in the exports
+    assert list(unpack_batches(iter([not_found]))) == []
+
+    # With not_found, as in the get commands of the cli, it is raised with the message of the server
+    with pytest.raises(NoResultsError) as e:
+        list(unpack_batches(iter([not_found]), not_found=True))
+    assert str(e.value) == "NotFoundError('No results were fetched')"
+
+def test_other_errors():
+    # The other errors are raised after the batches received before them
+    responses = iter([batch_response(1), error_response(grpc.StatusCode.INTERNAL, "OperationalError('lost')")])
+    batches = unpack_batches(responses, not_found=True)
+    assert [media.id for media in next(batches).medias] == [1]
+    with pytest.raises(Exception) as e:
+        next(batches)
+    assert not isinstance(e.value, NoResultsError)
+    assert str(e.value) == "OperationalError('lost')"
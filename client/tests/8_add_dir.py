@@ -0,0 +1,46 @@
+import grpc
+from google.rpc import status_pb2
+import dataloader_pb2 as rpc_objects
+from grpc_client import LoaderClient
+
+# These tests do not need the server: the responses of createMediaStream are built locally
+
+class FakeStub:
+    def __init__(self, *responses):
+        self.responses = responses
+
+    def createMediaStream(self, request_iterator):
+        # The requests are read like the server does, before the responses are sent
+        self.requests = list(request_iterator)
+        return iter(self.responses)
+
+def add_dir(tmp_path, *responses):
+    for name in ("a.jpg", "b.mp3", "c.txt"):
+        (tmp_path / name).touch()
+    client = LoaderClient()
+    client.grpc_stub = FakeStub(*responses)
+    return list(client.add_dir(str(tmp_path), ["jpg", "mp3"]))
+
+def test_added_and_skipped(tmp_path):
+    rejected = rpc_objects.RejectedRequest(index=1, error=status_pb2.Status(message="DataError('bad')"))
+    output = add_dir(tmp_path, rpc_objects.CreateMediaStreamResponse(count=2, inserted=1, rejected=[rejected]),
+                     rpc_objects.CreateMediaStreamResponse(count=4, inserted=2, skipped=1))
+    assert output == [
+        "Warning: file 2 was not added: DataError('bad')",
+        "Info: added 1 medias to database.",
+        "Info: added 2 medias to database, 1 already in the database.",
+        "Info: 2 files were found in the directory.",
+    ]
+
+def test_failed_batch(tmp_path):
+    # A failed batch is a warning, and the next totals do not count its medias as added
+    error = status_pb2.Status(code=grpc.StatusCode.INTERNAL.value[0], message="OperationalError('lost')")
+    output = add_dir(tmp_path, rpc_objects.CreateMediaStreamResponse(count=2, inserted=2),
+                     rpc_objects.CreateMediaStreamResponse(error=error, inserted=2),
+                     rpc_objects.CreateMediaStreamResponse(count=6, inserted=4))
+    assert output == [
+        "Info: added 2 medias to database.",
+        "Warning: a batch of files was not added: OperationalError('lost')",
+        "Info: added 4 medias to database.",
+        "Info: 2 files were found in the directory.",
+    ]
@@ -1,1048 +1,2407 @@
 from concurrent import futures
+import argparse
+import asyncio
+import bisect
+import collections
+import contextlib
+import functools
+import http.server
+import inspect
+import itertools
 import logging
+import logging.handlers
+import os
 import psycopg
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
+from psycopg.types.numeric import Int4
+from psycopg_pool import ConnectionPool, AsyncConnectionPool
+import queue
 import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 
 from words import WORDS
 import grpc
+from google.rpc import status_pb2
 import dataloader_pb2 as rpc_objects
 from dataloader_pb2_grpc import DataLoaderServicer, add_DataLoaderServicer_to_server
 
 BATCH_SIZE = 5000
+FETCH_SIZE = 2000     # Rows fetched per round trip by the server-side cursors of the list RPCs
+
+# Connection settings, the pool and worker values can be overridden from the command line
+DB_CONNINFO = "dbname=SpotifyDataBase user=postgres password=root host=localhost port=5432"
+SERVER_ADDRESS = "[::]:50051"
+MAX_WORKERS = 10            # Threads serving RPCs, i.e. the number of RPCs handled concurrently
+POOL_MIN_SIZE = 2           # Connections kept open even when the server is idle
+POOL_MAX_SIZE = 10          # Should be >= MAX_WORKERS, otherwise workers wait for a free connection
+POOL_TIMEOUT = 30.0         # Seconds an RPC waits for a connection before failing
+POOL_MAX_LIFETIME = 3600.0  # Seconds before a connection is closed and replaced by a new one
+REFRESH_DELAY = 0.0         # Seconds without import before the materialisations are refreshed, 0 to disable
+
+# SQL files of the repository, found from the location of app.py rather than from the working directory of the server
+DDL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ddl.sql")
+VIEWS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "views.sql")
+
+
+class NotFoundError(Exception):
+# Raised when a query returns no rows, sent to the client with the NOT_FOUND status code
+    pass
+
+
+class ConflictError(Exception):
+# Raised when an element already exists with different attributes, sent with the ALREADY_EXISTS status code
+    pass
+
+
+class InvalidArgumentError(Exception):
+# Raised when a request is malformed, e.g. references a tag type that does not exist or does not match its tagset,
+# sent with the INVALID_ARGUMENT status code
+    pass
+
+
+def status_code(e: Exception) -> grpc.StatusCode:
+# Maps an exception raised in a handler to the gRPC status code returned to the client
+    if isinstance(e, NotFoundError):
+        return grpc.StatusCode.NOT_FOUND
+    if isinstance(e, ConflictError):
+        return grpc.StatusCode.ALREADY_EXISTS
+    if isinstance(e, InvalidArgumentError):
+        return grpc.StatusCode.INVALID_ARGUMENT
+    return grpc.StatusCode.INTERNAL
+
+
+def error_status(e: Exception) -> status_pb2.Status:
+# Builds the google.rpc.Status sent in the error field of streamed responses
+    return status_pb2.Status(code=status_code(e).value[0], message=repr(e))
+
+
+#!================ Logging ============================================================================
+# The handlers log through a RequestLogger, whose records are prefixed with the request ID sent by the client in the
+# metadata (or a random one). The records are put on a queue by the request threads (or the event loop), and
+# formatted and written by the thread of a QueueListener, so that console I/O does not slow the RPCs down.
+# Each RPC has its own logger, "dataloader.<RPC name>", whose level can be set with --rpc-log-level, and can be
+# sampled with --log-sample: only 1 call in N logs below WARNING. The handlers called for every row of an import
+# (createTagging, createMedia, ...) log at DEBUG, the others at INFO.
+
+LOG_LEVEL = "INFO"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+REQUEST_ID_METADATA = "request-id"
+LOG_SAMPLING = {}           # RPC name: N, only 1 call in N of the RPC logs below WARNING
+LOG_COUNTERS = collections.defaultdict(itertools.count)
+LOG = logging.getLogger("dataloader")
+REFRESHER_LOG = logging.getLogger("dataloader.refresher")
+
+
+class RequestLogger(logging.LoggerAdapter):
+# Logger of a single call of an RPC. The request ID is only looked up when a record is logged
+
+    def __init__(self, method: str, context, sampled: bool) -> None:
+        super().__init__(logging.getLogger("dataloader." + method))
+        self.context = context
+        self.sampled = sampled
+        self.request_id = None
+
+    def isEnabledFor(self, level: int) -> bool:
+        return (self.sampled or level >= logging.WARNING) and self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        if self.request_id is None:
+            self.request_id = next((value for key, value in self.context.invocation_metadata() or ()
+                                    if key == REQUEST_ID_METADATA), None)
+            if self.request_id is None:
+                self.request_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
+        return "[%s] %s" % (self.request_id, msg), kwargs
+
+
+def request_logger(context, method: str) -> RequestLogger:
+# Logger of a call of the given RPC, sampled according to LOG_SAMPLING
+    n = LOG_SAMPLING.get(method, 1)
+    return RequestLogger(method, context, n <= 1 or next(LOG_COUNTERS[method]) % n == 0)
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+# QueueHandler that leaves the formatting to the handlers of the listener. The default prepare() formats the
+# message in the calling thread, which is needed only when the records are sent to another process.
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def start_logging(level: str = LOG_LEVEL, rpc_levels: dict | None = None,
+                  sampling: dict | None = None) -> logging.handlers.QueueListener:
+# Sends the records of all the loggers through a queue to a console handler, run by the returned listener
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = logging.handlers.QueueListener(log_queue, console)
+    root = logging.getLogger()
+    root.handlers = [RecordQueueHandler(log_queue)]
+    root.setLevel(level)
+    for method, rpc_level in (rpc_levels or {}).items():
+        logging.getLogger("dataloader." + method).setLevel(rpc_level)
+    LOG_SAMPLING.update(sampling or {})
+    listener.start()
+    return listener
+
+
+def create_pool(min_size: int = POOL_MIN_SIZE, max_size: int = POOL_MAX_SIZE,
+                timeout: float = POOL_TIMEOUT, max_lifetime: float = POOL_MAX_LIFETIME) -> ConnectionPool:
+# Opens the pool of connections shared by the RPC handlers. Each RPC checks out its own connection
+# for its whole duration, so concurrent RPCs run on different Postgres backends.
+    pool = ConnectionPool(
+        conninfo=DB_CONNINFO,
+        kwargs={
+            "row_factory": dict_row,    # Retreive the columns by their names
+            "autocommit": True
+        },
+        min_size=min_size,
+        max_size=max_size,
+        timeout=timeout,
+        max_lifetime=max_lifetime,
+        configure=prepare_statements,
+        open=True
+    )
+    pool.wait()
+    return pool
+
+
+async def create_async_pool(min_size: int = POOL_MIN_SIZE, max_size: int = POOL_MAX_SIZE,
+                            timeout: float = POOL_TIMEOUT, max_lifetime: float = POOL_MAX_LIFETIME) -> AsyncConnectionPool:
+# Same as create_pool, with asyncio connections for the coroutine handlers of AsyncDataLoader
+    pool = AsyncConnectionPool(
+        conninfo=DB_CONNINFO,
+        kwargs={
+            "row_factory": dict_row,
+            "autocommit": True
+        },
+        min_size=min_size,
+        max_size=max_size,
+        timeout=timeout,
+        max_lifetime=max_lifetime,
+        open=False
+    )
+    await pool.open(wait=True)
+    return pool
+
+
+#!================ Queries and row conversions =========================================================
+# Shared by the threaded DataLoader and the asyncio AsyncDataLoader, so both servers return the same data
+
+TAGS_SQL = """SELECT
+    t.id,
+    t.tagtype_id,
+    t.tagset_id,
+    ant.name as text_value,
+	tst.name as timestamp_value,
+	tt.name as time_value,
+	dt.name as date_value,
+	nt.name as num_value
+FROM
+    public.tags t
+LEFT JOIN
+    public.alphanumerical_tags ant ON t.id = ant.id
+LEFT JOIN
+    public.timestamp_tags tst ON t.id = tst.id
+LEFT JOIN
+    public.time_tags tt ON t.id = tt.id
+LEFT JOIN
+    public.date_tags dt ON t.id = dt.id
+LEFT JOIN
+    public.numerical_tags nt ON t.id = nt.id
+"""
+
+
+# Queries of the get...ByIds RPCs, the IDs are sent as a single array parameter
+MEDIAS_BY_IDS_SQL = "SELECT * FROM public.medias WHERE id = ANY(%s)"
+TAGS_BY_IDS_SQL = TAGS_SQL + "WHERE t.id = ANY(%s)"
+NODES_BY_IDS_SQL = "SELECT * FROM public.nodes WHERE id = ANY(%s)"
+
+# Nodes of the subtree under a node, used by getSubtree. Same recursion as the function get_subtree_from_parent_node
+# of views.sql, with the depth of each node so that the client can rebuild the tree in one pass. The nodes are sorted
+# by depth, so that each node comes after its parent.
+SUBTREE_SQL = """WITH RECURSIVE subtree AS (
+    SELECT n.id, n.tag_id, n.hierarchy_id, n.parentnode_id, 0 AS depth
+    FROM public.nodes n
+    WHERE n.id = %s
+    UNION ALL
+    SELECT n.id, n.tag_id, n.hierarchy_id, n.parentnode_id, s.depth + 1
+    FROM public.nodes n
+    JOIN subtree s ON n.parentnode_id = s.id
+)
+"""
+SUBTREE_NODES_SQL = SUBTREE_SQL + "SELECT * FROM subtree ORDER BY depth, id"
+# Same with the columns of TAGS_SQL for the tag of each node
+SUBTREE_TAGS_SQL = SUBTREE_SQL + """SELECT s.*, t.tagtype_id, t.tagset_id, t.text_value, t.timestamp_value, t.time_value, t.date_value, t.num_value
+FROM subtree s
+JOIN (""" + TAGS_SQL + """) t ON t.id = s.tag_id
+ORDER BY s.depth, s.id"""
+
+# Single-row inserts of createMedia and createTagging, which insert nothing when the media or tagging already exists
+CREATE_MEDIA_SQL = """INSERT INTO public.medias (file_uri, file_type, thumbnail_uri) VALUES (%s, %s, %s)
+ON CONFLICT (file_uri) DO NOTHING RETURNING *"""
+CREATE_TAGGING_SQL = """INSERT INTO public.taggings (object_id, tag_id) VALUES (%s, %s)
+ON CONFLICT DO NOTHING"""
+
+# createMediaStream copies each batch into a temporary staging table, then merges it into public.medias
+# so that the medias whose URI is already in the database are skipped instead of failing the whole batch.
+# Like taggings_staging, the table lives as long as the pooled connection and is emptied after each merge.
+MEDIAS_STAGING_SQL = """CREATE TEMP TABLE IF NOT EXISTS medias_staging (
+    file_uri text,
+    file_type integer,
+    thumbnail_uri text
+) ON COMMIT DELETE ROWS"""
+MEDIAS_COPY_SQL = "COPY medias_staging (file_uri, file_type, thumbnail_uri) FROM STDIN (FORMAT BINARY)"
+MEDIAS_COPY_TYPES = ["text", "int4", "text"]
+MEDIAS_MERGE_SQL = """INSERT INTO public.medias (file_uri, file_type, thumbnail_uri)
+SELECT file_uri, file_type, thumbnail_uri FROM medias_staging
+ON CONFLICT (file_uri) DO NOTHING"""
+MEDIAS_STAGING_CLEAR_SQL = "DELETE FROM medias_staging"
+
+# createTaggingStream copies each batch into a temporary staging table, then merges it into public.taggings
+# so that taggings already in the database are skipped instead of failing the whole batch.
+# The staging table lives as long as the pooled connection, and is emptied after each merge (or by the commit).
+TAGGINGS_STAGING_SQL = """CREATE TEMP TABLE IF NOT EXISTS taggings_staging (
+    object_id integer NOT NULL,
+    tag_id integer NOT NULL
+) ON COMMIT DELETE ROWS"""
+TAGGINGS_COPY_SQL = "COPY taggings_staging (object_id, tag_id) FROM STDIN (FORMAT BINARY)"
+TAGGINGS_COPY_TYPES = ["int4", "int4"]
+TAGGINGS_MERGE_SQL = """INSERT INTO public.taggings (object_id, tag_id)
+SELECT object_id, tag_id FROM taggings_staging
+ON CONFLICT DO NOTHING"""
+TAGGINGS_STAGING_CLEAR_SQL = "DELETE FROM taggings_staging"
+
+
+# Typed table and column type of the values of each tag type
+TAG_TYPE_TABLES = {
+    1: ("alphanumerical_tags", "text"),
+    2: ("timestamp_tags", "timestamp"),
+    3: ("time_tags", "time"),
+    4: ("date_tags", "date"),
+    5: ("numerical_tags", "integer"),
+}
+
+# Set-based insertion of a batch of tags of one type, used by createTagStream. The values are deduplicated on
+# (name, tagset_id), the ones already in the typed table are reused, and the new ones get their IDs from the
+# identity sequence of public.tags before being inserted in public.tags and the typed table in the same statement.
+# Returns the pairs (client ID, database ID) for every row of the batch.
+CREATE_TAGS_SQL = """WITH input AS (
+    SELECT client_id, tagset_id, CAST(name AS {value_type}) AS name
+    FROM unnest(%s::bigint[], %s::integer[], %s::text[]) AS u(client_id, tagset_id, name)
+), input_values AS (
+    SELECT DISTINCT tagset_id, name FROM input
+), existing AS MATERIALIZED (
+    SELECT x.id, x.tagset_id, x.name
+    FROM public.{table} x
+    JOIN input_values v ON x.tagset_id = v.tagset_id AND x.name = v.name
+), created AS MATERIALIZED (
+    SELECT nextval(pg_get_serial_sequence('public.tags', 'id'))::integer AS id, v.tagset_id, v.name
+    FROM input_values v
+    WHERE NOT EXISTS (SELECT 1 FROM existing e WHERE e.tagset_id = v.tagset_id AND e.name = v.name)
+), inserted_tags AS (
+    INSERT INTO public.tags (id, tagtype_id, tagset_id)
+    SELECT id, {tagtype_id}, tagset_id FROM created
+), inserted_values AS (
+    INSERT INTO public.{table} (id, name, tagset_id)
+    SELECT id, name, tagset_id FROM created
+)
+SELECT i.client_id, COALESCE(e.id, c.id) AS id
+FROM input i
+LEFT JOIN existing e ON e.tagset_id = i.tagset_id AND e.name = i.name
+LEFT JOIN created c ON c.tagset_id = i.tagset_id AND c.name = i.name"""
+CREATE_TAGS_SQLS = {
+    tagtype_id: CREATE_TAGS_SQL.format(table=table, value_type=value_type, tagtype_id=tagtype_id)
+    for tagtype_id, (table, value_type) in TAG_TYPE_TABLES.items()
+}
+
+# Get or create of a single tag, used by createTag. The function get_or_create_tag (see ddl.sql) looks the tag up
+# and creates it if needed in one call, and returns it with the columns of TAGS_SQL
+GET_OR_CREATE_TAG_SQL = "SELECT * FROM public.get_or_create_tag(%s, %s, %s)"
+
+
+# Set-based insertion of one level of nodes, used by createNodeStream. Like createNode, a node that already exists
+# with the same tag, hierarchy and parent is reused. The new nodes get their IDs from the identity sequence of
+# public.nodes, and the new rootnodes are set as rootnode of their hierarchy.
+# Returns the pairs (temporary ID, node ID) for every row of the level.
+CREATE_NODES_SQL = """WITH input AS (
+    SELECT temp_id, tag_id, hierarchy_id, parentnode_id
+    FROM unnest(%s::bigint[], %s::integer[], %s::integer[], %s::integer[]) AS u(temp_id, tag_id, hierarchy_id, parentnode_id)
+), input_nodes AS (
+    SELECT DISTINCT tag_id, hierarchy_id, parentnode_id FROM input
+), existing AS MATERIALIZED (
+    SELECT DISTINCT ON (n.tag_id, n.hierarchy_id, n.parentnode_id) n.id, n.tag_id, n.hierarchy_id, n.parentnode_id
+    FROM public.nodes n
+    JOIN input_nodes v ON n.tag_id = v.tag_id AND n.hierarchy_id = v.hierarchy_id
+        AND n.parentnode_id IS NOT DISTINCT FROM v.parentnode_id
+    ORDER BY n.tag_id, n.hierarchy_id, n.parentnode_id, n.id
+), created AS MATERIALIZED (
+    SELECT nextval(pg_get_serial_sequence('public.nodes', 'id'))::integer AS id, v.tag_id, v.hierarchy_id, v.parentnode_id
+    FROM input_nodes v
+    WHERE NOT EXISTS (
+        SELECT 1 FROM existing e
+        WHERE e.tag_id = v.tag_id AND e.hierarchy_id = v.hierarchy_id AND e.parentnode_id IS NOT DISTINCT FROM v.parentnode_id
+    )
+), inserted_nodes AS (
+    INSERT INTO public.nodes (id, tag_id, hierarchy_id, parentnode_id)
+    SELECT id, tag_id, hierarchy_id, parentnode_id FROM created
+), updated_hierarchies AS (
+    UPDATE public.hierarchies h SET rootnode_id = c.id
+    FROM created c
+    WHERE c.parentnode_id IS NULL AND h.id = c.hierarchy_id
+)
+SELECT i.temp_id, COALESCE(e.id, c.id) AS id
+FROM input i
+LEFT JOIN existing e ON e.tag_id = i.tag_id AND e.hierarchy_id = i.hierarchy_id
+    AND e.parentnode_id IS NOT DISTINCT FROM i.parentnode_id
+LEFT JOIN created c ON c.tag_id = i.tag_id AND c.hierarchy_id = i.hierarchy_id
+    AND c.parentnode_id IS NOT DISTINCT FROM i.parentnode_id"""
+
+
+# Bulk-load mode of createTagStream, createTaggingStream and createNodeStream, requested by the client with the
+# metadata "bulk-load: true". Each batch transaction sets session_replication_role to replica, which skips the
+# validation triggers (check_tagtype_matching, trigger_check_nodes_tagset) and the foreign key checks, then
+# validates the whole batch with one of the queries below before the commit. They return a message for the first
+# invalid row, and the batch is rolled back. Setting session_replication_role requires a superuser (or the SET
+# privilege on it). The maintenance triggers of views.sql are enabled ALWAYS and still run in this mode.
+BULK_LOAD_METADATA = "bulk-load"
+BULK_LOAD_SQL = "SET LOCAL session_replication_role = replica"
+TAGS_BULK_CHECK_SQL = """SELECT 'Tag ' || t.id || ' does not match the type of tagset ' || t.tagset_id
+    || ' or the tagset does not exist' AS error
+FROM public.tags t
+LEFT JOIN public.tagsets s ON s.id = t.tagset_id
+WHERE t.id = ANY(%s) AND s.tagtype_id IS DISTINCT FROM t.tagtype_id
+LIMIT 1"""
+TAGGINGS_BULK_CHECK_SQL = """SELECT 'Tagging of media ' || s.object_id || ' with tag ' || s.tag_id
+    || ' refers to a media or tag that does not exist' AS error
+FROM taggings_staging s
+WHERE NOT EXISTS (SELECT 1 FROM public.medias m WHERE m.id = s.object_id)
+    OR NOT EXISTS (SELECT 1 FROM public.tags t WHERE t.id = s.tag_id)
+LIMIT 1"""
+NODES_BULK_CHECK_SQL = """SELECT 'Node ' || n.id || ' (tag ' || n.tag_id || ', hierarchy ' || n.hierarchy_id
+    || ') refers to a row that does not exist or to a tag outside of the tagset of the hierarchy' AS error
+FROM public.nodes n
+LEFT JOIN public.hierarchies h ON h.id = n.hierarchy_id
+LEFT JOIN public.tags t ON t.id = n.tag_id
+WHERE n.id = ANY(%s) AND (h.id IS NULL OR t.tagset_id IS DISTINCT FROM h.tagset_id
+    OR (n.parentnode_id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM public.nodes p WHERE p.id = n.parentnode_id)))
+LIMIT 1"""
+
+
+# Registry of the point lookups of the unary RPCs, run as prepared statements with execute_prepared: each statement
+# is parsed and planned once per pooled connection, then only its name and parameters are sent.
+# The statements are prepared when the pool opens a connection (see prepare_statements).
+PREPARED_STATEMENTS = {
+    # name: (query, types of the parameters)
+    "getMediaById": ("SELECT * FROM public.medias WHERE id = %s", (int,)),
+    "getMediaByURI": ("SELECT * FROM public.medias WHERE file_uri = %s", (str,)),
+    "getTag": (TAGS_SQL + "WHERE t.id = %s", (int,)),
+    "getMediasWithTag": ("SELECT object_id FROM public.taggings WHERE tag_id = %s", (int,)),
+    "getMediaTags": ("SELECT tag_id FROM public.taggings WHERE object_id = %s", (int,)),
+    "getHierarchy": ("SELECT * FROM public.hierarchies WHERE id = %s", (int,)),
+    "getNode": ("SELECT * FROM public.nodes WHERE id = %s", (int,)),
+}
+
+
+def prepared_params(params: tuple) -> tuple:
+# psycopg prepares a statement once per combination of parameter types, and sends small integers as smallint.
+# The IDs are sent as integer, the type of the ID columns, so that each statement is prepared only once.
+    return tuple(Int4(param) if isinstance(param, int) else param for param in params)
+
+
+def execute_prepared(cursor: psycopg.Cursor, name: str, *params) -> None:
+# Runs a statement of PREPARED_STATEMENTS with the given parameters
+    cursor.execute(PREPARED_STATEMENTS[name][0], prepared_params(params), prepare=True)
+
+
+def prepare_statements(conn: psycopg.Connection) -> None:
+# configure callback of the connection pool: prepares the statements of PREPARED_STATEMENTS on a new connection,
+# by running each of them once with empty parameters
+    for sql, types in PREPARED_STATEMENTS.values():
+        conn.execute(sql, prepared_params(tuple(t() for t in types)), prepare=True)
+
+
+def bulk_load_requested(context) -> bool:
+# True if the client asked for the bulk-load mode in the metadata of the call
+    return any(key == BULK_LOAD_METADATA and value == "true" for key, value in context.invocation_metadata() or ())
+
+
+def check_bulk_load(row: dict | None) -> None:
+# Raises the error returned by one of the *_BULK_CHECK_SQL queries, if any
+    if row is not None:
+        raise InvalidArgumentError(row['error'])
+
+
+def medias_sql(request: rpc_objects.GetMediasRequest) -> str:
+# Query of getMedias, with optional type filter
+    sql = "SELECT * FROM public.medias"
+    if request.file_type > 0 :
+        sql += " WHERE file_type = %d" % request.file_type
+    return sql
+
+
+def media_tag_lists_sql(request: rpc_objects.GetMediasRequest) -> str:
+# Query of getMediaTagLists: each media with the array of its tag IDs, with optional type filter. The medias and the
+# taggings are both read in the order of their primary keys and grouped while merged, so the rows stream from the cursor
+    sql = """SELECT m.id, m.file_uri, m.file_type, m.thumbnail_uri,
+    array_remove(array_agg(t.tag_id), NULL) AS tag_ids
+FROM public.medias m
+LEFT JOIN public.taggings t ON t.object_id = m.id"""
+    if request.file_type > 0 :
+        sql += " WHERE m.file_type = %d" % request.file_type
+    return sql + " GROUP BY m.id ORDER BY m.id"
+
+
+MAX_QUERY_TERMS = 100     # Tag, tagset and node IDs allowed in the expression of a queryMedias request
+
+# Medias matching each kind of leaf of a MediaQuery, read from the (tag_id, object_id) index of taggings
+# (index_tag_object_order in views.sql) and from nodes_taggings, which holds the medias of the subtree of each node
+MEDIA_QUERY_TERMS_SQL = {
+    "tagId": "SELECT object_id FROM public.taggings WHERE tag_id = %s",
+    "tagSetId": "SELECT r.object_id FROM public.tags t JOIN public.taggings r ON r.tag_id = t.id WHERE t.tagset_id = %s",
+    "nodeId": "SELECT object_id FROM public.nodes_taggings WHERE node_id = %s",
+}
+ALL_MEDIA_IDS_SQL = "SELECT id FROM public.medias"
+
+
+def media_query_sql(query: rpc_objects.MediaQuery, params: list) -> str:
+# Compiles a MediaQuery into a set operation returning the IDs of the matching medias, and appends its parameters
+# to params. AND is an INTERSECT of its operands minus (EXCEPT) its negated operands, OR is an UNION, and a NOT
+# outside of an AND is subtracted from all the medias
+    kind = query.WhichOneof("expression")
+    if kind is None:
+        raise InvalidArgumentError("Empty media query expression")
+    if kind in MEDIA_QUERY_TERMS_SQL:
+        if len(params) == MAX_QUERY_TERMS:
+            raise InvalidArgumentError("Media query with more than %d terms" % MAX_QUERY_TERMS)
+        params.append(getattr(query, kind))
+        return MEDIA_QUERY_TERMS_SQL[kind]
+    if kind == "negation":
+        return "%s EXCEPT (%s)" % (ALL_MEDIA_IDS_SQL, media_query_sql(query.negation, params))
+    operands = getattr(query, kind).operands
+    if len(operands) == 0:
+        raise InvalidArgumentError("Media query with an empty %s" % kind)
+    if kind == "anyOf":
+        return " UNION ".join("(%s)" % media_query_sql(operand, params) for operand in operands)
+    # The parameters are appended in the order of the placeholders, so the included operands are compiled first
+    included = [operand for operand in operands if operand.WhichOneof("expression") != "negation"]
+    excluded = [operand.negation for operand in operands if operand.WhichOneof("expression") == "negation"]
+    if included:
+        sql = " INTERSECT ".join("(%s)" % media_query_sql(operand, params) for operand in included)
+    else:
+        sql = ALL_MEDIA_IDS_SQL
+    for operand in excluded:
+        sql = "(%s) EXCEPT (%s)" % (sql, media_query_sql(operand, params))
+    return sql
+
+
+def query_medias_sql(request: rpc_objects.QueryMediasRequest, params: list) -> str:
+# Query of queryMedias: the medias whose ID is in the compiled expression, in ID order with an optional limit
+    sql = "SELECT * FROM public.medias WHERE id IN (%s) ORDER BY id" % media_query_sql(request.query, params)
+    if request.limit > 0:
+        sql += " LIMIT %d" % request.limit
+    return sql
+
+
+def tagsets_sql(request: rpc_objects.GetTagSetsRequest) -> str:
+# Query of getTagSets, with optional tagtype filter
+    sql = "SELECT * FROM public.tagsets"
+    if request.tagTypeId > 0 :
+        sql += " WHERE tagtype_id = %d" % request.tagTypeId
+    return sql
+
+
+def tags_sql(request: rpc_objects.GetTagsRequest) -> str:
+# Query of getTags, with optional tagtype and tagset filters
+    sql = TAGS_SQL
+    if request.tagSetId > 0 or request.tagTypeId > 0:
+        sql += " WHERE "
+        if request.tagSetId > 0 and request.tagTypeId > 0:
+            sql += "t.tagset_id = %d AND t.tagtype_id = %d" % (request.tagSetId, request.tagTypeId)
+        elif request.tagSetId > 0:
+            sql += "t.tagset_id = %d" % request.tagSetId
+        else:
+            sql += "t.tagtype_id = %d" % request.tagTypeId
+    return sql
+
+
+def hierarchies_sql(request: rpc_objects.GetHierarchiesRequest) -> str:
+# Query of getHierarchies, with optional tagset filter
+    sql = "SELECT * FROM public.hierarchies"
+    if request.tagSetId > 0:
+        sql += " WHERE tagset_id = %d" % request.tagSetId
+    return sql
+
+
+def nodes_sql(request: rpc_objects.GetNodesRequest) -> str:
+# Query of getNodes, with optional hierarchy, tag or parent node filters
+    sql = "SELECT * FROM public.nodes"
+    # Reflexion: a node is a tag reference in a hierarchy, 
+    # so if more than one filter is applied we'll get only one result
+    if request.hierarchyId > 0 or request.tagId > 0 or request.parentNodeId > 0:
+        sql += " WHERE"
+        if request.hierarchyId > 0:
+            sql += " hierarchy_id = %d AND" % request.hierarchyId
+        if request.tagId > 0:
+            sql += " tag_id = %d AND" % request.tagId
+        if request.parentNodeId > 0:
+            sql += " parentnode_id = %d AND" % request.parentNodeId
+        sql = sql[:len(sql)-3]
+    return sql
+
+
+def tag_value(req: rpc_objects.CreateTagRequest | rpc_objects.CreateTagStreamRequest) -> str:
+# Value of a tag request as text, cast to the type of the typed table by the database
+    match req.tagTypeId:
+        case 1:
+            return req.alphanumerical.value
+        case 2:
+            return req.timestamp.value
+        case 3:
+            return req.time.value
+        case 4:
+            return req.date.value
+        case 5:
+            return str(req.numerical.value)
+        case _:
+            raise InvalidArgumentError("Invalid tag type %d" % req.tagTypeId)
+
+
+def add_to_tag_batch(batch: dict, req: rpc_objects.CreateTagStreamRequest) -> None:
+# Adds a request of createTagStream to the batch, which holds the client IDs, tagset IDs and values per tag type.
+# The values are sent as text and cast to the type of the typed table by CREATE_TAGS_SQL.
+    value = tag_value(req)
+    client_ids, tagset_ids, values = batch.setdefault(req.tagTypeId, ([], [], []))
+    client_ids.append(req.tagId)
+    tagset_ids.append(req.tagSetId)
+    values.append(value)
+
+
+def add_to_node_levels(levels: list, depths: dict, req: rpc_objects.CreateNodeStreamRequest) -> None:
+# Adds a request of createNodeStream to the level of the batch matching its depth. Rootnodes and nodes whose parent
+# was created in a previous batch are on the first level, the other ones on the level after their parent's.
+    depth = depths[req.parentTempId] + 1 if req.parentTempId in depths else 0
+    depths[req.tempId] = depth
+    if depth == len(levels):
+        levels.append([])
+    levels[depth].append(req)
+
+
+def node_level_params(level: list, id_map: dict, batch_map: dict) -> tuple:
+# Builds the arrays of CREATE_NODES_SQL for a level, the parents being resolved from the nodes created so far
+    temp_ids, tag_ids, hierarchy_ids, parentnode_ids = [], [], [], []
+    for req in level:
+        if req.parentTempId:
+            parentnode_id = batch_map.get(req.parentTempId) or id_map.get(req.parentTempId)
+            if parentnode_id is None:
+                raise NotFoundError("Parent node with temporary ID %d was not created" % req.parentTempId)
+        else:
+            parentnode_id = None
+        temp_ids.append(req.tempId)
+        tag_ids.append(req.tagId)
+        hierarchy_ids.append(req.hierarchyId)
+        parentnode_ids.append(parentnode_id)
+    return temp_ids, tag_ids, hierarchy_ids, parentnode_ids
+
+
+def media_copy_row(req: rpc_objects.Media) -> tuple:
+# Row of MEDIAS_COPY_SQL for a request of createMediaStream
+    return req.file_uri, req.file_type, req.thumbnail_uri
+
+
+def tagging_copy_row(req: rpc_objects.CreateTaggingRequest) -> tuple:
+# Row of TAGGINGS_COPY_SQL for a request of createTaggingStream
+    return req.mediaId, req.tagId
+
+
+def media_from_row(row: dict) -> rpc_objects.Media:
+    return rpc_objects.Media(
+        id= row["id"],
+        file_uri= row["file_uri"],
+        file_type= row["file_type"],
+        thumbnail_uri= row["thumbnail_uri"]
+    )
+
+
+def tagset_from_row(row: dict) -> rpc_objects.TagSet:
+    return rpc_objects.TagSet(
+        id= row['id'],
+        name= row['name'],
+        tagTypeId= row['tagtype_id']
+    )
+
+
+# Value field of the Tag message per tag type: the field, the column of TAGS_SQL holding the value and the conversion
+# of the value, if any. The timestamps, times and dates are sent as text.
+TAG_VALUE_FIELDS = {
+    1: ("alphanumerical", "text_value", None),
+    2: ("timestamp", "timestamp_value", str),
+    3: ("time", "time_value", str),
+    4: ("date", "date_value", str),
+    5: ("numerical", "num_value", None),
+}
+
+
+def tag_from_row(row: dict) -> rpc_objects.Tag:
+# Builds the Tag message from a row of TAGS_SQL, the value field depends on the tag type
+    tag = rpc_objects.Tag()
+    if row['tagtype_id'] in TAG_VALUE_FIELDS:
+        field, column, convert = TAG_VALUE_FIELDS[row['tagtype_id']]
+        tag.id = row['id']
+        tag.tagSetId = row['tagset_id']
+        tag.tagTypeId = row['tagtype_id']
+        getattr(tag, field).value = row[column] if convert is None else convert(row[column])
+    return tag
+
+
+def tagging_batch_from_rows(rows: list) -> rpc_objects.TaggingBatch:
+# Packs the taggings column by column
+    return rpc_objects.TaggingBatch(
+        mediaIds=[row['object_id'] for row in rows],
+        tagIds=[row['tag_id'] for row in rows]
+    )
+
+
+def tagging_from_row(row: dict) -> rpc_objects.Tagging:
+    return rpc_objects.Tagging(
+        mediaId=row['object_id'],
+        tagId=row['tag_id']
+    )
+
+
+def hierarchy_from_row(row: dict) -> rpc_objects.Hierarchy:
+    return rpc_objects.Hierarchy(
+        id=row['id'],
+        name=row['name'],
+        tagSetId=row['tagset_id'],
+        rootNodeId=row['rootnode_id']
+    )
+
+
+def node_from_row(row: dict) -> rpc_objects.Node:
+    return rpc_objects.Node(
+        id=row['id'],
+        tagId=row['tag_id'],
+        hierarchyId=row['hierarchy_id'],
+        parentNodeId=row['parentnode_id']
+    )
+
+
+def subtree_node_from_row(row: dict, with_tags: bool) -> rpc_objects.SubtreeNode:
+# Builds a node of getSubtree from a row of SUBTREE_NODES_SQL or SUBTREE_TAGS_SQL
+    subtree_node = rpc_objects.SubtreeNode(node=node_from_row(row), depth=row['depth'])
+    if with_tags:
+        subtree_node.tag.CopyFrom(tag_from_row({**row, 'id': row['tag_id']}))
+    return subtree_node
+
+
+# The list RPCs of medias and tags read their rows as tuples in binary format, and fill the messages with converters
+# built once per query shape: the columns are looked up by name when the converter is built, then each row is mapped
+# by position into the fields. The messages are filled in place in their response, which avoids building each one
+# and copying it into its batch.
+
+def row_columns(cursor) -> tuple:
+# Names of the columns of the rows of an executed cursor, i.e. the shape of its query
+    return tuple(column.name for column in cursor.description)
+
+
+def fill_batch(messages, fill, rows: list) -> None:
+# Adds a message filled from each row to a repeated field
+    add = messages.add
+    for row in rows:
+        fill(add(), row)
+
+
+@functools.lru_cache(maxsize=None)
+def media_converter(columns: tuple):
+# Function filling a Media message from a tuple row with the given columns
+    id_at, file_uri_at, file_type_at, thumbnail_uri_at = (
+        columns.index(column) for column in ("id", "file_uri", "file_type", "thumbnail_uri")
+    )
+
+    def fill(media: rpc_objects.Media, row: tuple) -> None:
+        media.id = row[id_at]
+        media.file_uri = row[file_uri_at]
+        media.file_type = row[file_type_at]
+        media.thumbnail_uri = row[thumbnail_uri_at]
+    return fill
+
+
+@functools.lru_cache(maxsize=None)
+def media_tag_list_converter(columns: tuple):
+# Function filling a MediaTagList message from a tuple row of media_tag_lists_sql
+    fill_media = media_converter(columns)
+    tag_ids_at = columns.index("tag_ids")
+
+    def fill(media_tag_list: rpc_objects.MediaTagList, row: tuple) -> None:
+        fill_media(media_tag_list.media, row)
+        media_tag_list.tagIds.extend(row[tag_ids_at])
+    return fill
+
+
+@functools.lru_cache(maxsize=None)
+def tag_converter(columns: tuple):
+# Function filling a Tag message from a tuple row of TAGS_SQL, the value field is looked up by tag type.
+# The tags of an unknown type are left empty, as in tag_from_row.
+    id_at, tagset_id_at, tagtype_id_at = (columns.index(column) for column in ("id", "tagset_id", "tagtype_id"))
+    value_fields = {
+        tagtype_id: (field, columns.index(column), convert)
+        for tagtype_id, (field, column, convert) in TAG_VALUE_FIELDS.items()
+    }
+
+    def fill(tag: rpc_objects.Tag, row: tuple) -> None:
+        value_field = value_fields.get(row[tagtype_id_at])
+        if value_field is None:
+            return
+        field, value_at, convert = value_field
+        tag.id = row[id_at]
+        tag.tagSetId = row[tagset_id_at]
+        tag.tagTypeId = row[tagtype_id_at]
+        getattr(tag, field).value = row[value_at] if convert is None else convert(row[value_at])
+    return fill
+
+
+#!================ Import stream transactions =========================================================
+# Transactions of the import streams (createMediaStream, createTagStream, createTaggingStream). Each batch runs in
+# its own transaction, or in a savepoint of a transaction around the whole stream when the client sends the metadata
+# "stream-transaction: true". When a batch fails with one of ROW_ERRORS, errors caused by the content of some rows,
+# it is bisected in savepoints (see insert_or_bisect): the good rows are inserted and the bad ones are returned in the
+# rejected field of the response, with their index in the stream. k bad rows in a batch of n cost about
+# 2 * k * log2(n) more statements. The other errors, e.g. a lost connection, fail the whole batch.
+# The rows already in the database (medias with an existing URI, existing taggings) are not errors: the staging
+# tables merge them with ON CONFLICT DO NOTHING and they are counted in the skipped field instead.
+STREAM_TRANSACTION_METADATA = "stream-transaction"
+ROW_ERRORS = (psycopg.DataError, psycopg.IntegrityError, psycopg.errors.RaiseException, InvalidArgumentError, NotFoundError)
+
+
+def stream_transaction(conn: psycopg.Connection | psycopg.AsyncConnection, context):
+# Transaction around a whole import stream, when the client asked for it in the metadata of the call. The transaction
+# of each batch is then a savepoint, and nothing is committed if the stream fails or is cancelled.
+    if any(key == STREAM_TRANSACTION_METADATA and value == "true" for key, value in context.invocation_metadata() or ()):
+        return conn.transaction()
+    return contextlib.nullcontext()
+
+
+def read_batch(request, requests, rows: list, to_row):
+# Yields the rows of the batch opened by request, up to BATCH_SIZE, and keeps them in rows to insert them again
+# if the batch is bisected. Consuming the generator reads the rest of the batch.
+    while request is not None:
+        rows.append(to_row(request))
+        yield rows[-1]
+        request = next(requests, None) if len(rows) < BATCH_SIZE else None
+
+
+async def read_batch_async(request, requests, rows: list, to_row):
+# read_batch for the streams of the asyncio server
+    while request is not None:
+        rows.append(to_row(request))
+        yield rows[-1]
+        request = await anext(requests, None) if len(rows) < BATCH_SIZE else None
+
+
+def insert_or_bisect(conn: psycopg.Connection, insert, rows: list, offset: int, results: list, rejected: list,
+                     error: Exception | None = None) -> None:
+# Runs insert(rows) in a savepoint and adds its result to results. When it raises one of ROW_ERRORS, the rows are
+# split in halves inserted separately, down to the single rows that fail, which are added to rejected with their
+# error. error is the error of a previous attempt with the same rows, which are then split right away.
+# offset is the index of the first row in the stream.
+    if error is None:
+        try:
+            with conn.transaction():
+                results.append(insert(rows))
+            return
+        except ROW_ERRORS as e:
+            error = e
+    if len(rows) == 1:
+        rejected.append(rpc_objects.RejectedRequest(index=offset, error=error_status(error)))
+        return
+    half = len(rows) // 2
+    insert_or_bisect(conn, insert, rows[:half], offset, results, rejected)
+    insert_or_bisect(conn, insert, rows[half:], offset + half, results, rejected)
+
+
+async def insert_or_bisect_async(conn: psycopg.AsyncConnection, insert, rows: list, offset: int, results: list,
+                                 rejected: list, error: Exception | None = None) -> None:
+# insert_or_bisect for the streams of the asyncio server, insert being a coroutine function
+    if error is None:
+        try:
+            async with conn.transaction():
+                results.append(await insert(rows))
+            return
+        except ROW_ERRORS as e:
+            error = e
+    if len(rows) == 1:
+        rejected.append(rpc_objects.RejectedRequest(index=offset, error=error_status(error)))
+        return
+    half = len(rows) // 2
+    await insert_or_bisect_async(conn, insert, rows[:half], offset, results, rejected)
+    await insert_or_bisect_async(conn, insert, rows[half:], offset + half, results, rejected)
+
+
+def merge_medias(cursor: psycopg.Cursor) -> int:
+# Merges the staging table of createMediaStream into public.medias, and returns the number of inserted medias
+    cursor.execute(MEDIAS_MERGE_SQL)
+    inserted = cursor.rowcount
+    cursor.execute(MEDIAS_STAGING_CLEAR_SQL)
+    return inserted
+
+
+async def merge_medias_async(cursor: psycopg.AsyncCursor) -> int:
+# merge_medias for the asyncio server
+    await cursor.execute(MEDIAS_MERGE_SQL)
+    inserted = cursor.rowcount
+    await cursor.execute(MEDIAS_STAGING_CLEAR_SQL)
+    return inserted
+
+
+def merge_taggings(cursor: psycopg.Cursor, bulk_load: bool) -> int:
+# Merges the staging table of createTaggingStream into public.taggings, and returns the number of inserted taggings
+    if bulk_load:
+        cursor.execute(TAGGINGS_BULK_CHECK_SQL)
+        check_bulk_load(cursor.fetchone())
+    cursor.execute(TAGGINGS_MERGE_SQL)
+    inserted = cursor.rowcount
+    cursor.execute(TAGGINGS_STAGING_CLEAR_SQL)
+    return inserted
+
+
+async def merge_taggings_async(cursor: psycopg.AsyncCursor, bulk_load: bool) -> int:
+# merge_taggings for the asyncio server
+    if bulk_load:
+        await cursor.execute(TAGGINGS_BULK_CHECK_SQL)
+        check_bulk_load(await cursor.fetchone())
+    await cursor.execute(TAGGINGS_MERGE_SQL)
+    inserted = cursor.rowcount
+    await cursor.execute(TAGGINGS_STAGING_CLEAR_SQL)
+    return inserted
+
+
+#!================ Tagset cache =========================================================================
+# The tagsets and tag types are few and rarely change, but each created tag needs the type of its tagset.
+# They are kept in memory by the server instead of being read from the database for each request.
+
+TAGSETS_CACHE_SQL = "SELECT id, name, tagtype_id FROM public.tagsets"
+TAG_TYPES_CACHE_SQL = "SELECT id, description FROM public.tag_types"
+TAGSETS_MISSING_SQL = TAGSETS_CACHE_SQL + " WHERE id = ANY(%s) OR name = ANY(%s)"
+
+
+class TagSetCache:
+# In-memory copy of the tagsets (id, name, tagtype_id) and tag types, shared by the handlers of a server.
+# createTagSet adds the tagsets it creates, and the tagsets created by other servers are read on a cache miss.
+# invalidate() bumps the generation counter when the tables are changed behind the cache (e.g. resetDatabase):
+# the data loaded at an older generation is then reloaded before the next lookup.
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.generation = 0             # Bumped by invalidate()
+        self.loaded_generation = -1     # Generation of the data in the cache, reload needed when different
+        self.by_id = {}
+        self.by_name = {}
+        self.tag_types = {}
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.generation += 1
+
+    def is_stale(self) -> bool:
+        return self.loaded_generation != self.generation
+
+    def load(self, generation: int, tagsets: list, tag_types: list) -> None:
+    # Replaces the content of the cache with the rows read at the given generation. If the cache was invalidated
+    # while they were read, the cache stays stale and is reloaded by the next lookup
+        with self.lock:
+            self.by_id = {row['id']: row for row in tagsets}
+            self.by_name = {row['name']: row for row in tagsets}
+            self.tag_types = {row['id']: row['description'] for row in tag_types}
+            self.loaded_generation = generation
+
+    def add(self, tagset: dict) -> None:
+        with self.lock:
+            self.by_id[tagset['id']] = tagset
+            self.by_name[tagset['name']] = tagset
+
+    def get(self, tagset_id: int) -> dict | None:
+        return self.by_id.get(tagset_id)
+
+    def get_by_name(self, name: str) -> dict | None:
+        return self.by_name.get(name)
+
+    def has_tag_type(self, tagtype_id: int) -> bool:
+        return tagtype_id in self.tag_types
+
+    def missing(self, tagset_ids, name: str | None) -> tuple | None:
+    # Parameters of TAGSETS_MISSING_SQL for the given tagsets that are not in the cache, None if they all are
+        ids = [tagset_id for tagset_id in set(tagset_ids) if tagset_id not in self.by_id]
+        names = [name] if name is not None and name not in self.by_name else []
+        return (ids, names) if ids or names else None
+
+
+def check_tagsets(cache: TagSetCache, tagtype_id: int, tagset_ids) -> None:
+# Checks that the tagsets exist and hold tags of the given type before inserting tags in them. The trigger
+# check_tagtype_matching does the same in the database, this check fails before sending the rows.
+    if not cache.has_tag_type(tagtype_id):
+        raise InvalidArgumentError("Invalid tag type %d" % tagtype_id)
+    for tagset_id in set(tagset_ids):
+        tagset = cache.get(tagset_id)
+        if tagset is None:
+            raise NotFoundError("Tagset %d does not exist" % tagset_id)
+        if tagset['tagtype_id'] != tagtype_id:
+            raise InvalidArgumentError("Tagset %d holds tags of type %d, not %d" % (tagset_id, tagset['tagtype_id'], tagtype_id))
+
+
+#!================ Materialisations refresh ============================================================
+# nodes_taggings and tagsets_taggings (see views.sql) are tables kept up to date by triggers. A refresh recomputes
+# them from scratch and applies the difference, as REFRESH MATERIALIZED VIEW CONCURRENTLY does: the rows are
+# deleted and inserted in a transaction, so the readers see the old content until the commit and are never blocked.
+# When the tables do not exist (e.g. after resetDatabase), the refresh creates them by running views.sql.
+
+VIEWS_EXIST_SQL = """SELECT to_regclass('public.nodes_taggings') IS NOT NULL
+    AND to_regclass('public.tagsets_taggings') IS NOT NULL AS exist"""
+NODES_TAGGINGS_FRESH_SQL = """SELECT DISTINCT h.parentnode_id, h.id AS node_id, h.tag_id, r.object_id
+FROM (SELECT n.parentnode_id, n.id, (public.get_subtree_from_parent_node(n.id)).tag_id FROM public.nodes n) h
+JOIN public.taggings r ON r.tag_id = h.tag_id"""
+TAGSETS_TAGGINGS_FRESH_SQL = """SELECT t.tagset_id, r.tag_id, r.object_id
+FROM public.tags t
+JOIN public.taggings r ON r.tag_id = t.id"""
+# Pairs of (DELETE of the stale rows, INSERT of the missing rows) for each table
+REFRESH_VIEWS_SQLS = [
+    ("""WITH stale AS (SELECT * FROM public.nodes_taggings EXCEPT %s)
+DELETE FROM public.nodes_taggings s USING stale d
+WHERE s.node_id = d.node_id AND s.object_id = d.object_id AND s.tag_id = d.tag_id""" % NODES_TAGGINGS_FRESH_SQL,
+     """INSERT INTO public.nodes_taggings (parentnode_id, node_id, tag_id, object_id)
+%s EXCEPT SELECT * FROM public.nodes_taggings
+ON CONFLICT DO NOTHING""" % NODES_TAGGINGS_FRESH_SQL),
+    ("""WITH stale AS (SELECT * FROM public.tagsets_taggings EXCEPT %s)
+DELETE FROM public.tagsets_taggings s USING stale d
+WHERE s.tag_id = d.tag_id AND s.object_id = d.object_id AND s.tagset_id = d.tagset_id""" % TAGSETS_TAGGINGS_FRESH_SQL,
+     """INSERT INTO public.tagsets_taggings (tagset_id, tag_id, object_id)
+%s EXCEPT SELECT * FROM public.tagsets_taggings
+ON CONFLICT DO NOTHING""" % TAGSETS_TAGGINGS_FRESH_SQL),
+]
+
+
+class ViewRefresher:
+# Runs the refreshes of the materialisations, one at a time. The refreshes requested while one is running are
+# coalesced into the next one: each caller waits for a refresh that started after its request, so it sees its data,
+# but a burst of requests runs at most two refreshes. With a delay, schedule() requests a refresh in the background
+# once no import has finished for delay seconds.
+
+    def __init__(self, pool: ConnectionPool, delay: float = REFRESH_DELAY) -> None:
+        self.pool = pool
+        self.delay = delay
+        self.condition = threading.Condition()
+        self.requested = 0          # Number of refreshes requested
+        self.completed = 0          # Number of requests served by the completed refreshes
+        self.running = False
+        self.result = None          # Response of the last completed refresh
+        self.timer = None
+
+    def refresh(self) -> rpc_objects.RefreshViewsResponse:
+    # Requests a refresh and waits for it. The first waiting caller runs it, the others get its response
+        with self.condition:
+            self.requested += 1
+            generation = self.requested
+            while self.completed < generation:
+                if self.running:
+                    self.condition.wait()
+                    continue
+                self.running = True
+                served = self.requested
+                result_requests = served - self.completed
+                self.condition.release()
+                try:
+                    result = self.run()
+                    result.requests = result_requests
+                finally:
+                    self.condition.acquire()
+                    self.running = False
+                    self.condition.notify_all()
+                self.completed = served
+                self.result = result
+            return self.result
+
+    def schedule(self) -> None:
+    # Called when an import finishes: (re)starts the countdown of the background refresh
+        if self.delay <= 0:
+            return
+        with self.condition:
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.delay, self.refresh_in_background)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def refresh_in_background(self) -> None:
+        try:
+            result = self.refresh()
+            REFRESHER_LOG.info("-> Refreshed the materialisations in %.3fs (%d rows inserted, %d deleted)",
+                               result.duration, result.inserted, result.deleted)
+        except Exception as e:
+            REFRESHER_LOG.warning("-> %r", e)
+
+    def run(self) -> rpc_objects.RefreshViewsResponse:
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+        try:
+            start = time.perf_counter()
+            inserted = deleted = 0
+            with conn.transaction():
+                cursor.execute(VIEWS_EXIST_SQL)
+                if cursor.fetchone()['exist']:
+                    for delete_sql, insert_sql in REFRESH_VIEWS_SQLS:
+                        cursor.execute(delete_sql)
+                        deleted += cursor.rowcount
+                        cursor.execute(insert_sql)
+                        inserted += cursor.rowcount
+                else:
+                    # views.sql uses unqualified names, while ddl.sql empties the search path of its connection
+                    cursor.execute("SET LOCAL search_path TO public")
+                    cursor.execute(open(VIEWS_PATH, "r").read())
+                    cursor.execute("SELECT (SELECT count(*) FROM public.nodes_taggings) + (SELECT count(*) FROM public.tagsets_taggings) AS count")
+                    inserted = cursor.fetchone()['count']
+            return rpc_objects.RefreshViewsResponse(
+                inserted=inserted, deleted=deleted, duration=time.perf_counter() - start)
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+#!================ Metrics ============================================================================
+# Metrics of each RPC, recorded by the interceptors of the gRPC servers and served in the Prometheus text format
+# on METRICS_PORT (http://localhost:9464/metrics) and by getServerStats. Latencies go to a histogram with fixed
+# buckets: the quantiles are estimated from it, by interpolating in the bucket holding them (as histogram_quantile).
+# The latency of a stream is the time until its last response, and its rows are the requests received and the
+# rows of the responses sent (the size of each batch).
+
+METRICS_ADDRESS = "localhost"
+METRICS_PORT = 9464         # Port of the Prometheus endpoint, 0 to disable
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class RpcMetrics:
+# Counters of a single RPC, updated under the lock of the Metrics registry
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = {}            # Status code name: number of errors
+        self.in_flight = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)     # The last bucket is +Inf
+        self.total_seconds = 0.0
+        self.rows_received = 0
+        self.rows_sent = 0
+        self.rows_rejected = 0
+
+    def quantile(self, q: float) -> float:
+    # Latency under which a fraction q of the calls finished, estimated from the histogram
+        count = sum(self.buckets)
+        if count == 0:
+            return 0.0
+        rank = q * count
+        cumulative = 0
+        for i, n in enumerate(self.buckets):
+            if cumulative + n >= rank and n > 0:
+                if i == len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[-1]
+                lower = LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                return lower + (LATENCY_BUCKETS[i] - lower) * (rank - cumulative) / n
+            cumulative += n
+        return LATENCY_BUCKETS[-1]
+
+
+# Repeated field holding the rows of each batch message of the streaming RPCs
+BATCH_ROWS_FIELDS = {
+    "MediaBatch": "medias",
+    "TagBatch": "tags",
+    "TaggingBatch": "mediaIds",
+    "MediaTagListBatch": "medias",
+    "NodeBatch": "nodes",
+    "SubtreeBatch": "nodes",
+}
+
+
+def response_rows(response) -> tuple:
+# Rows sent, rows rejected and status code name of the error (or None) carried by a response of a streaming RPC.
+# A batch counts its rows, the responses of the import streams count none (their rows are the received requests).
+    fields = response.DESCRIPTOR.fields_by_name
+    error = None
+    rows = 0
+    which = response.WhichOneof("message") if "message" in response.DESCRIPTOR.oneofs_by_name else None
+    if which == "batch":
+        batch = response.batch
+        field = BATCH_ROWS_FIELDS.get(batch.DESCRIPTOR.name)
+        rows = len(getattr(batch, field)) if field is not None else 0
+    elif which not in (None, "count", "error"):
+        rows = 1
+    if "error" in fields and response.HasField("error"):
+        error = grpc.StatusCode.UNKNOWN.name
+        for code in grpc.StatusCode:
+            if code.value[0] == response.error.code:
+                error = code.name
+    elif "error_message" in fields and response.error_message:
+        error = grpc.StatusCode.UNKNOWN.name
+    rejected = len(response.rejected) if "rejected" in fields else 0
+    return rows, rejected, error
+
+
+class Metrics:
+# Registry of the metrics of all the RPCs, shared by the threads and the event loop of the server
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.rpcs = {}              # Method name: RpcMetrics
+        self.pools = {}             # Label: connection pool, whose statistics are exported too
+        self.start = time.time()
+
+    def get(self, method: str) -> RpcMetrics:
+        rpc = self.rpcs.get(method)
+        if rpc is None:
+            rpc = self.rpcs.setdefault(method, RpcMetrics())
+        return rpc
+
+    def started(self, method: str) -> float:
+    # Records the start of a call, and returns its start time for finished()
+        with self.lock:
+            rpc = self.get(method)
+            rpc.calls += 1
+            rpc.in_flight += 1
+        return time.perf_counter()
+
+    def finished(self, method: str, start: float, error: str | None = None) -> None:
+        duration = time.perf_counter() - start
+        with self.lock:
+            rpc = self.get(method)
+            rpc.in_flight -= 1
+            rpc.buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+            rpc.total_seconds += duration
+            if error is not None:
+                rpc.errors[error] = rpc.errors.get(error, 0) + 1
+
+    def received(self, method: str, rows: int) -> None:
+        with self.lock:
+            self.get(method).rows_received += rows
+
+    def sent(self, method: str, response) -> None:
+    # Records the rows and the error of a response of a streaming RPC
+        rows, rejected, error = response_rows(response)
+        with self.lock:
+            rpc = self.get(method)
+            rpc.rows_sent += rows
+            rpc.rows_rejected += rejected
+            if error is not None:
+                rpc.errors[error] = rpc.errors.get(error, 0) + 1
+
+    def stats(self) -> rpc_objects.ServerStatsResponse:
+    # Response of getServerStats
+        with self.lock:
+            return rpc_objects.ServerStatsResponse(uptime=time.time() - self.start, rpcs=[
+                rpc_objects.RpcStats(
+                    method=method, calls=rpc.calls, errors=sum(rpc.errors.values()), inFlight=rpc.in_flight,
+                    p50=rpc.quantile(0.5), p95=rpc.quantile(0.95), p99=rpc.quantile(0.99),
+                    totalSeconds=rpc.total_seconds, rowsReceived=rpc.rows_received, rowsSent=rpc.rows_sent,
+                    rowsRejected=rpc.rows_rejected)
+                for method, rpc in sorted(self.rpcs.items())
+            ])
+
+    def prometheus(self) -> str:
+    # All the metrics in the Prometheus text exposition format
+        lines = []
+        def family(name, kind, help, samples):
+            lines.append("# HELP dataloader_%s %s" % (name, help))
+            lines.append("# TYPE dataloader_%s %s" % (name, kind))
+            for suffix, labels, value in samples:
+                labels = ",".join('%s="%s"' % label for label in labels)
+                lines.append("dataloader_%s%s{%s} %s" % (name, suffix, labels, value))
+
+        with self.lock:
+            rpcs = sorted(self.rpcs.items())
+            family("rpc_calls_total", "counter", "Calls received per RPC",
+                   [("", [("method", m)], rpc.calls) for m, rpc in rpcs])
+            family("rpc_errors_total", "counter", "Calls or stream batches that ended with an error, per status code",
+                   [("", [("method", m), ("code", code)], n) for m, rpc in rpcs for code, n in sorted(rpc.errors.items())])
+            family("rpc_in_flight", "gauge", "Calls and streams being served",
+                   [("", [("method", m)], rpc.in_flight) for m, rpc in rpcs])
+            samples = []
+            for m, rpc in rpcs:
+                cumulative = 0
+                for bound, n in zip(LATENCY_BUCKETS + ("+Inf",), rpc.buckets):
+                    cumulative += n
+                    samples.append(("_bucket", [("method", m), ("le", str(bound))], cumulative))
+                samples.append(("_sum", [("method", m)], rpc.total_seconds))
+                samples.append(("_count", [("method", m)], cumulative))
+            family("rpc_duration_seconds", "histogram", "Latency of the calls, until the last response of a stream",
+                   samples)
+            family("rpc_rows_received_total", "counter", "Requests received by the client-streaming RPCs",
+                   [("", [("method", m)], rpc.rows_received) for m, rpc in rpcs])
+            family("rpc_rows_sent_total", "counter", "Rows sent by the server-streaming RPCs",
+                   [("", [("method", m)], rpc.rows_sent) for m, rpc in rpcs])
+            family("rpc_rows_rejected_total", "counter", "Requests of the import streams that were not inserted",
+                   [("", [("method", m)], rpc.rows_rejected) for m, rpc in rpcs])
+        pool_stats = {label: pool.get_stats() for label, pool in self.pools.items()}
+        for key in sorted({key for stats in pool_stats.values() for key in stats}):
+            family("pool_" + key, "gauge", "Statistic %s of the connection pool (see psycopg_pool)" % key,
+                   [("", [("pool", label)], stats[key]) for label, stats in pool_stats.items() if key in stats])
+        family("uptime_seconds", "gauge", "Seconds since the server started", [("", [], time.time() - self.start)])
+        return "\n".join(lines) + "\n"
+
+    def wrap_handler(self, handler: grpc.RpcMethodHandler | None, method: str) -> grpc.RpcMethodHandler | None:
+    # Wraps the behaviour of a method handler to record its metrics. The wrapper is a coroutine or an asynchronous
+    # generator if the behaviour is one, so that grpc.aio still runs the synchronous handlers in its thread pool
+        if handler is None:
+            return None
+        method = method.rsplit("/", 1)[-1]
+        metrics = self
+
+        def count_requests(request_iterator):
+            for request in request_iterator:
+                metrics.received(method, 1)
+                yield request
+
+        async def count_requests_async(request_iterator):
+            async for request in request_iterator:
+                metrics.received(method, 1)
+                yield request
+
+        def wrap_unary(behavior):
+            streaming = handler.request_streaming
+            if inspect.iscoroutinefunction(behavior):
+                async def wrapper(request, context):
+                    start = metrics.started(method)
+                    error = None
+                    try:
+                        return await behavior(count_requests_async(request) if streaming else request, context)
+                    except BaseException:
+                        error = (context.code() or grpc.StatusCode.UNKNOWN).name
+                        raise
+                    finally:
+                        metrics.finished(method, start, error)
+            else:
+                def wrapper(request, context):
+                    start = metrics.started(method)
+                    error = None
+                    try:
+                        return behavior(count_requests(request) if streaming else request, context)
+                    except BaseException:
+                        error = (context.code() or grpc.StatusCode.UNKNOWN).name
+                        raise
+                    finally:
+                        metrics.finished(method, start, error)
+            return wrapper
+
+        def wrap_stream(behavior):
+            streaming = handler.request_streaming
+            if inspect.isasyncgenfunction(behavior):
+                async def wrapper(request, context):
+                    start = metrics.started(method)
+                    error = None
+                    try:
+                        async for response in behavior(count_requests_async(request) if streaming else request, context):
+                            metrics.sent(method, response)
+                            yield response
+                    except BaseException:
+                        error = (context.code() or grpc.StatusCode.CANCELLED).name
+                        raise
+                    finally:
+                        metrics.finished(method, start, error)
+            else:
+                def wrapper(request, context):
+                    start = metrics.started(method)
+                    error = None
+                    try:
+                        for response in behavior(count_requests(request) if streaming else request, context):
+                            metrics.sent(method, response)
+                            yield response
+                    except BaseException:
+                        error = (context.code() or grpc.StatusCode.CANCELLED).name
+                        raise
+                    finally:
+                        metrics.finished(method, start, error)
+            return wrapper
+
+        if handler.unary_unary:
+            return handler._replace(unary_unary=wrap_unary(handler.unary_unary))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=wrap_unary(handler.stream_unary))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=wrap_stream(handler.unary_stream))
+        return handler._replace(stream_stream=wrap_stream(handler.stream_stream))
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+# Records the metrics of the RPCs served by the threaded server
+
+    def __init__(self, metrics: Metrics) -> None:
+        self.metrics = metrics
+
+    def intercept_service(self, continuation, handler_call_details):
+        return self.metrics.wrap_handler(continuation(handler_call_details), handler_call_details.method)
+
+
+class AsyncMetricsInterceptor(grpc.aio.ServerInterceptor):
+# Records the metrics of the RPCs served by the grpc.aio server
+
+    def __init__(self, metrics: Metrics) -> None:
+        self.metrics = metrics
+
+    async def intercept_service(self, continuation, handler_call_details):
+        return self.metrics.wrap_handler(await continuation(handler_call_details), handler_call_details.method)
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+# HTTP handler of the Prometheus endpoint, the registry is set as attribute of the server
+
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.metrics.prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass    # The scrapes would flood the logs of the server
+
+
+def start_metrics_server(metrics: Metrics, port: int = METRICS_PORT) -> http.server.ThreadingHTTPServer | None:
+# Serves the metrics on http://METRICS_ADDRESS:port/metrics in a background thread, if port is not 0
+    if port == 0:
+        return None
+    server = http.server.ThreadingHTTPServer((METRICS_ADDRESS, port), MetricsHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    LOG.info("Metrics served at http://%s:%d/metrics", METRICS_ADDRESS, port)
+    return server
+
+
+#!================ Profiling ==========================================================================
+# The profile RPC profiles the running server for a while, one profile at a time. By default it samples the stacks
+# of all the threads every PROFILE_INTERVAL seconds from the thread of the RPC, which sees the worker threads and
+# the event loop of the aio server alike (cProfile only sees the thread that enables it). The stacks are written in
+# the collapsed format of flamegraph.pl / speedscope, one "frame;frame;...;frame count" line per distinct stack.
+# The threads waiting for work are skipped: the idle gRPC workers and loops (IDLE_FRAMES) and the background threads
+# of the pool and of the main thread (BACKGROUND_FRAMES). The lock and condition waits of the RPCs are kept, so that
+# a worker waiting in ConnectionPool.getconn shows the pool contention. A thread waiting for Postgres is in psycopg's
+# waiting functions: the time spent in SQL shows up there, the row adaptation in psycopg.types/psycopg.rows and the
+# protobuf construction in the *_from_row functions and the row converters. The memory mode traces the allocations
+# with tracemalloc instead, and writes the snapshot taken at the end (see tracemalloc.Snapshot.load).
+
+PROFILE_DIR = "profiles"    # Directory of the written profiles, relative to the working directory of the server
+PROFILE_INTERVAL = 0.005
+PROFILE_TOP = 20
+MAX_PROFILE_DURATION = 600.0
+TRACEMALLOC_FRAMES = 10
+IDLE_FRAMES = {             # (file name, function) of the innermost frame of a thread waiting for work
+    ("selectors.py", "select"),
+    ("_server.py", "_serve"),
+    ("socketserver.py", "serve_forever"),
+    ("thread.py", "_worker"),          # An idle thread of a ThreadPoolExecutor
+    ("handlers.py", "dequeue"),        # The log listener
+}
+BACKGROUND_FRAMES = {       # (file name, function) of a frame of a thread which never serves an RPC
+    ("pool.py", "worker"),             # The maintenance workers of the connection pool
+    ("sched.py", "run"),               # The scheduler of the connection pool
+    ("_server.py", "wait_for_termination"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def frame_name(code) -> str:
+# Name of a frame in the profiles, e.g. "DataLoader.getMedias (app.py:1234)"
+    return "%s (%s:%d)" % (getattr(code, "co_qualname", code.co_name), os.path.basename(code.co_filename),
+                           code.co_firstlineno)
+
+
+class Profiler:
+# Runs the profiles of the profile RPC, and writes them in a directory
+
+    def __init__(self, directory: str = PROFILE_DIR) -> None:
+        self.directory = directory
+        self.lock = threading.Lock()
+
+    def profile(self, request: rpc_objects.ProfileRequest) -> rpc_objects.ProfileResponse:
+        if not 0 < request.duration <= MAX_PROFILE_DURATION:
+            raise InvalidArgumentError("The duration must be between 0 and %d seconds" % MAX_PROFILE_DURATION)
+        if not self.lock.acquire(blocking=False):
+            raise ConflictError("A profile is already running")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            top = request.top or PROFILE_TOP
+            if request.memory:
+                return self.trace_allocations(request.duration, top)
+            return self.sample_stacks(request.duration, request.interval or PROFILE_INTERVAL, top)
+        finally:
+            self.lock.release()
+
+    def path(self, extension: str) -> str:
+        # The file is created with a unique name, so that profiles started in the same second are all kept
+        fd, path = tempfile.mkstemp(dir=self.directory, prefix="profile-%s-" % time.strftime("%Y%m%d-%H%M%S"),
+                                    suffix="." + extension)
+        os.close(fd)
+        return path
+
+    def sample_stacks(self, duration: float, interval: float, top: int) -> rpc_objects.ProfileResponse:
+        current = threading.get_ident()
+        stacks = collections.Counter()
+        samples = 0
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            for thread_id, frame in sys._current_frames().items():
+                code = frame.f_code
+                if thread_id == current or (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+                    continue
+                stack = []
+                background = False
+                while frame is not None:
+                    code = frame.f_code
+                    background = background or (os.path.basename(code.co_filename), code.co_name) in BACKGROUND_FRAMES
+                    stack.append(frame_name(code))
+                    frame = frame.f_back
+                if not background:
+                    stacks[tuple(reversed(stack))] += 1
+            samples += 1
+            time.sleep(interval)
+
+        path = self.path("collapsed")
+        with open(path, "w") as file:
+            for stack, count in stacks.most_common():
+                file.write("%s %d\n" % (";".join(stack), count))
+        self_counts = collections.Counter()
+        total_counts = collections.Counter()
+        for stack, count in stacks.items():
+            self_counts[stack[-1]] += count
+            for name in set(stack):
+                total_counts[name] += count
+        return rpc_objects.ProfileResponse(path=path, samples=samples, entries=[
+            rpc_objects.ProfileEntry(location=name, count=count, total=total_counts[name])
+            for name, count in self_counts.most_common(top)
+        ])
+
+    def trace_allocations(self, duration: float, top: int) -> rpc_objects.ProfileResponse:
+        # When tracemalloc was started before (e.g. with PYTHONTRACEMALLOC), it is left running
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        try:
+            time.sleep(duration)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            if started:
+                tracemalloc.stop()
+        path = self.path("snapshot")
+        snapshot.dump(path)
+        return rpc_objects.ProfileResponse(path=path, entries=[
+            rpc_objects.ProfileEntry(location=str(stat.traceback[0]), count=stat.count, total=stat.size)
+            for stat in snapshot.statistics("lineno")[:top]
+        ])
 
 
 class DataLoader(DataLoaderServicer):
 # The DataLoader class is the implementation of the GRPC dataloader server
 # It implements all the functions defined in the Protobuf file dataloader.proto
 
-    def __init__(self) -> None:
+    def __init__(self, pool: ConnectionPool, fetch_size: int = FETCH_SIZE, refresh_delay: float = REFRESH_DELAY,
+                 profile_dir: str = PROFILE_DIR) -> None:
         super().__init__()
-        self.conn = psycopg.connect(
-            conninfo="dbname=SpotifyDataBase user=postgres password=root host=localhost port=5432",
-            row_factory=dict_row, # Retreive the columns by their names
-            autocommit=True
-        )
-        cursor = self.conn.cursor() 
-        cursor.execute("select version()")
-        data = cursor.fetchone()
-        print("Connection established to: ", data)
-        cursor.close()
+        self.pool = pool
+        self.fetch_size = fetch_size
+        self.tagsets = TagSetCache()
+        self.refresher = ViewRefresher(pool, refresh_delay)
+        self.profiler = Profiler(profile_dir)
+        self.metrics = Metrics()
+        self.metrics.pools["threaded"] = pool
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("select version()")
+            data = cursor.fetchone()
+            LOG.info("Connection established to: %s", data)
+            cursor.close()
         
         # ! Uncomment to update an old schema with the new namings, triggers and tag_type in the tagsets table
         # try:
         #     cursor.execute(open("update_db_tables.sql", "r").read())
-        #     print("DB has been updated")
+        #     LOG.info("DB has been updated")
         # except Exception as e:
-        #     print("Error updating DB:" % repr(e))
+        #     LOG.error("Error updating DB: %r", e)
         # cursor.close()
 
-    def __del__(self):
-        self.conn.close()
+
+    def load_tagsets(self, cursor: psycopg.Cursor, tagset_ids = (), name: str | None = None) -> TagSetCache:
+    # Returns the tagset cache, reloaded first if it was invalidated. The given tagsets that are not in the cache,
+    # e.g. created by another server, are read from the database and added to it
+        cache = self.tagsets
+        if cache.is_stale():
+            generation = cache.generation
+            cursor.execute(TAGSETS_CACHE_SQL)
+            tagsets = cursor.fetchall()
+            cursor.execute(TAG_TYPES_CACHE_SQL)
+            cache.load(generation, tagsets, cursor.fetchall())
+        missing = cache.missing(tagset_ids, name)
+        if missing is not None:
+            cursor.execute(TAGSETS_MISSING_SQL, missing)
+            for row in cursor.fetchall():
+                cache.add(row)
+        return cache
 
 
     #!================ Medias =============================================================================
     def getMedias(self, request: rpc_objects.GetMediasRequest, context):
     # Get all the medias stored in DB, with optional type filter
       
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getMedias request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getMedias")
+        log.info("Received getMedias request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getMedias", row_factory=tuple_row, binary=True)
+        count = 0
         try:
-            sql = """SELECT * FROM public.medias;"""
-            if request.file_type > 0 :
-                sql += " WHERE file_type = %d" % request.file_type
-            cursor.execute(sql)
-            res = cursor.fetchall()
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
-            for row in res:
-                yield rpc_objects.MediaResponse(
-                    media=rpc_objects.Media(
-                        id= row["id"],
-                        file_uri= row["file_uri"],
-                        file_type= row["file_type"],
-                        thumbnail_uri= row["thumbnail_uri"]
-                    )
-                )
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute(medias_sql(request))
+                fill = media_converter(row_columns(cursor))
+                for row in cursor:
+                    count += 1
+                    response = rpc_objects.StreamingMediaResponse()
+                    fill(response.media, row)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            yield rpc_objects.MediaResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingMediaResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
-    def getMediaById(self, request: rpc_objects.IdRequest, context) -> rpc_objects.MediaResponse:
+    def getMediasBatched(self, request: rpc_objects.GetMediasRequest, context):
+    # Same as getMedias, with up to fetch_size medias per message
+
+        log = request_logger(context, "getMediasBatched")
+        log.info("Received getMediasBatched request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getMediasBatched", row_factory=tuple_row, binary=True)
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(medias_sql(request))
+                fill = media_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingMediaBatchResponse()
+                    fill_batch(response.batch.medias, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def getMediaById(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Media:
     # Get a single media with the given ID
      
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getMediaById request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getMediaById")
+        log.info("Received getMediaById request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = "SELECT * FROM public.medias WHERE id=%d" % request.id
-            cursor.execute(sql)
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
+            execute_prepared(cursor, "getMediaById", request.id)
+            if cursor.rowcount == 0: raise NotFoundError("No results were fetched")
             result = cursor.fetchall()[0]
-            return rpc_objects.MediaResponse(
-                media=rpc_objects.Media(
-                        id= result["id"],
-                        file_uri= result["file_uri"],
-                        file_type= result["file_type"],
-                        thumbnail_uri= result["thumbnail_uri"]
-                    )
+            return rpc_objects.Media(
+                id= result["id"],
+                file_uri= result["file_uri"],
+                file_type= result["file_type"],
+                thumbnail_uri= result["thumbnail_uri"]
             )
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.MediaResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
-    def getMediaByURI(self, request: rpc_objects.GetMediaByURIRequest, context) -> rpc_objects.MediaResponse:
+    def getMediaByURI(self, request: rpc_objects.GetMediaByURIRequest, context) -> rpc_objects.Media:
     # Get a single media with the given URI
       
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getMediaIdFromURI request with URI=%s" % (thread_id, request.file_uri))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getMediaByURI")
+        log.info("Received getMediaIdFromURI request with URI=%s", request.file_uri)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = "SELECT * FROM public.medias WHERE file_uri=%s"
-            data = (request.file_uri,)  # The comma is to make it a tuple with one element
-            cursor.execute(sql, data)
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
+            execute_prepared(cursor, "getMediaByURI", request.file_uri)
+            if cursor.rowcount == 0: raise NotFoundError("No results were fetched")
             result = cursor.fetchall()[0]
-            return rpc_objects.MediaResponse(
-                media=rpc_objects.Media(
-                        id= result["id"],
-                        file_uri= result["file_uri"],
-                        file_type= result["file_type"],
-                        thumbnail_uri= result["thumbnail_uri"]
-                    )
+            return rpc_objects.Media(
+                id= result["id"],
+                file_uri= result["file_uri"],
+                file_type= result["file_type"],
+                thumbnail_uri= result["thumbnail_uri"]
             )
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.MediaResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
 
-    def createMedia(self, request: rpc_objects.CreateMediaRequest, context) -> rpc_objects.MediaResponse:
+    def getMediasByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the medias with the given IDs with a single query, sent in batches of up to fetch_size medias.
+    # The IDs that do not exist are skipped
+
+        log = request_logger(context, "getMediasByIds")
+        log.info("Received getMediasByIds request with %d IDs", len(request.ids))
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getMediasByIds", row_factory=tuple_row, binary=True)
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(MEDIAS_BY_IDS_SQL, (list(request.ids),))
+                fill = media_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingMediaBatchResponse()
+                    fill_batch(response.batch.medias, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def createMedia(self, request: rpc_objects.Media, context) -> rpc_objects.Media:
     # Create a single media with given URI, type and thumbnail URI
      
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received createMedia request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "createMedia")
+        log.debug("Received createMedia request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = "SELECT * FROM public.medias WHERE file_uri = %s" 
-            data = (request.media.file_uri,)                                # The comma is to make it a tuple with one element
-            cursor.execute(sql, data)
+            # Insert first, the existing media is only fetched when the URI is already taken
+            params = prepared_params((request.file_uri, request.file_type, request.thumbnail_uri))
+            cursor.execute(CREATE_MEDIA_SQL, params, prepare=True)
             if cursor.rowcount > 0 :
-                # print("[%s] -> File URI '%s' already exists in database" % (thread_id, request.media.file_uri))
-                existing_media = cursor.fetchall()[0]
-                if existing_media['file_type'] == request.media.file_type and existing_media['thumbnail_uri'] == request.media.thumbnail_uri:
-                    # print("[%s] -> No conflicts, returning existing media" % thread_id)
-                    return rpc_objects.MediaResponse(
-                        media=rpc_objects.Media(
-                            id= existing_media['id'],
-                            file_uri= existing_media['file_uri'],
-                            file_type= existing_media['file_type'],
-                            thumbnail_uri= existing_media['thumbnail_uri']
-                        ))
-                else :
-                    # print("[%s] -> Other fields conflict, returning error message" % thread_id)
-                    return rpc_objects.MediaResponse(
-                        error_message="Error: Media URI '%s' already exists with a different type or thumbnail_uri" % request.media.file_uri
-                        )
-                
-            sql = "INSERT INTO public.medias (file_uri, file_type, thumbnail_uri) VALUES (%s, %s, %s) RETURNING *;" 
-            data = (request.media.file_uri, request.media.file_type, request.media.thumbnail_uri)
-            cursor.execute(sql, data)
-            response = cursor.fetchall()[0]
-            return rpc_objects.MediaResponse(
-                media=rpc_objects.Media(
-                    id=response['id'],
-                    file_uri=response['file_uri'],
-                    file_type=response['file_type'],
-                    thumbnail_uri=response['thumbnail_uri']
-                )
-            )
+                return media_from_row(cursor.fetchone())
+
+            log.debug("-> File URI '%s' already exists in database", request.file_uri)
+            execute_prepared(cursor, "getMediaByURI", request.file_uri)
+            existing_media = cursor.fetchone()
+            if existing_media is None :
+                raise NotFoundError("Media URI '%s' was deleted while being created" % request.file_uri)
+            if existing_media['file_type'] == request.file_type and existing_media['thumbnail_uri'] == request.thumbnail_uri:
+                log.debug("-> No conflicts, returning existing media")
+                return media_from_row(existing_media)
+            else :
+                log.debug("-> Other fields conflict, returning error message")
+                raise ConflictError("Media URI '%s' already exists with a different type or thumbnail_uri" % request.file_uri)
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.MediaResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
     def createMediaStream(self, request_iterator, context):
     # Create multiple medias at the same time in batches, 
     # returns confirmation/error messages when a batch is added
+    # Each batch is a binary COPY into a staging table merged into public.medias, the rows are written as the requests
+    # arrive. The medias whose URI already exists are skipped, and a batch that fails is bisected: the medias that
+    # cannot be inserted are returned. Returns the amount received, inserted and skipped after each batch
+
+        log = request_logger(context, "createMediaStream")
+        log.debug("Received createMediaStream request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+
+        def copy_medias(rows):
+            with cursor.copy(MEDIAS_COPY_SQL) as copy:
+                copy.set_types(MEDIAS_COPY_TYPES)
+                for row in rows:
+                    copy.write_row(row)
+            return merge_medias(cursor)
 
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received createMediaStream request" % thread_id)
-        cursor = self.conn.cursor()
-        request_counter = 0
-        sql = "INSERT INTO public.medias (file_uri, file_type, thumbnail_uri) VALUES "
-        data = ()
-
-        for request in request_iterator:
-            sql += "(%s, %s, %s)," 
-            data += (
-                request.media.file_uri,
-                request.media.file_type,
-                request.media.thumbnail_uri,
-            )
-            request_counter += 1
-
-            if request_counter % BATCH_SIZE == 0:
-                sql = sql[:-1] + ";"
-                try:
-                    cursor.execute(sql, data)
-                    yield rpc_objects.CreateMediaStreamResponse(count=request_counter)
-                except Exception as e:
-                    yield rpc_objects.CreateMediaStreamResponse(error_message=repr(e))
-                    # print("[%s] -> Error: packet addition failed" % thread_id)
-                finally:
-                    sql = "INSERT INTO public.medias (file_uri, file_type, thumbnail_uri) VALUES "
-                    data = ()
-
-        if request_counter % BATCH_SIZE > 0:
-            sql = sql[:-1] + ";"
-            try:
-                cursor.execute(sql, data)
-                response = rpc_objects.CreateMediaStreamResponse(count=request_counter)
-            except Exception as e:
-                response = rpc_objects.CreateMediaStreamResponse(error_message=repr(e))
-                # print("[%s] -> %s" % (thread_id, repr(e)))
-            yield response
+        try:
+            cursor.execute(MEDIAS_STAGING_SQL)
+            with stream_transaction(conn, context):
+                request_counter = 0
+                inserted_counter = 0
+                skipped_counter = 0
+                requests = iter(request_iterator)
+                for request in requests:
+                    # The request that opens the batch is written first, then up to BATCH_SIZE - 1 more
+                    rows = []
+                    batch = read_batch(request, requests, rows, media_copy_row)
+                    try:
+                        inserted = []
+                        rejected = []
+                        with conn.transaction():
+                            try:
+                                with conn.transaction():
+                                    inserted.append(copy_medias(batch))
+                            except ROW_ERRORS as e:
+                                for _ in batch:     # Reads the rest of the batch
+                                    pass
+                                insert_or_bisect(conn, copy_medias, rows, request_counter, inserted, rejected, e)
+                        request_counter += len(rows)
+                        inserted_counter += sum(inserted)
+                        skipped_counter += len(rows) - sum(inserted) - len(rejected)
+                        response = rpc_objects.CreateMediaStreamResponse(
+                            count=request_counter, inserted=inserted_counter, skipped=skipped_counter, rejected=rejected)
+                    except Exception as e:
+                        log.warning("-> Error: packet addition failed: %r", e)
+                        for _ in batch:
+                            pass
+                        request_counter += len(rows)
+                        response = rpc_objects.CreateMediaStreamResponse(
+                            error=error_status(e), inserted=inserted_counter, skipped=skipped_counter)
+                    yield response
 
-        cursor.close()
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
 
 
-    def deleteMedia(self, request: rpc_objects.IdRequest, context) -> rpc_objects.StatusResponse:
+    def deleteMedia(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Empty:
     # Delete a single media with the given ID
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received deleteMedia request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
-        response = rpc_objects.StatusResponse()
+        log = request_logger(context, "deleteMedia")
+        log.info("Received deleteMedia request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
             sql = "DELETE FROM public.medias WHERE id=%d;" % request.id
             cursor.execute(sql)
             if cursor.rowcount == 0:
-                raise Exception("Element not found")
+                raise NotFoundError("Element not found")
+            return rpc_objects.Empty()
             
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            response = rpc_objects.StatusResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
 
         finally:
             cursor.close()
-            return response
+            self.pool.putconn(conn)
 
 
     #!================ TagSets ============================================================================
     def getTagSets(self, request: rpc_objects.GetTagSetsRequest, context):
     # Get all the tagsets stored in DB, with optional tagtype filter
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getTagSets request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTagSets")
+        log.info("Received getTagSets request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTagSets")
         count = 0
         try:
-            sql = """SELECT * FROM public.tagsets"""
-            if request.tagTypeId > 0 :
-                sql += " WHERE tagtype_id = %d" % request.tagTypeId
-
-            cursor.execute(sql)
-            res = cursor.fetchall()
-            if len(res) == 0 : raise Exception("No results were fetched")
-            for row in res:
-                count += 1
-                yield rpc_objects.TagSetResponse(
-                    tagset=rpc_objects.TagSet(
-                        id= row['id'],
-                        name= row['name'],
-                        tagTypeId= row['tagtype_id']
-                    ))
-
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute(tagsets_sql(request))
+                for row in cursor:
+                    count += 1
+                    yield rpc_objects.StreamingTagSetResponse(tagset=tagset_from_row(row))
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            yield rpc_objects.TagSetResponse(error_message=repr(e))
-            print("[%s] -> %s" % (thread_id, repr(e)))
-
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTagSetResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
-    def getTagSetById(self, request: rpc_objects.IdRequest, context) -> rpc_objects.TagSetResponse:
+    def getTagSetById(self, request: rpc_objects.IdRequest, context) -> rpc_objects.TagSet:
     # Get a single tagset with the given ID
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getTagsetById request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTagSetById")
+        log.info("Received getTagsetById request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = "SELECT * FROM public.tagsets WHERE id=%d;" % request.id
-            cursor.execute(sql)
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")
-            result = cursor.fetchall()[0]
-            return rpc_objects.TagSetResponse(
-                tagset=rpc_objects.TagSet(
-                    id= result['id'],
-                    name= result['name'],
-                    tagTypeId= result['tagtype_id']
-                ))
+            result = self.load_tagsets(cursor, (request.id,)).get(request.id)
+            if result is None : raise NotFoundError("No results were fetched")
+            return tagset_from_row(result)
         
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TagSetResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
         
 
-    def getTagSetByName(self, request: rpc_objects.GetTagSetRequestByName, context) -> rpc_objects.TagSetResponse:
+    def getTagSetByName(self, request: rpc_objects.GetTagSetRequestByName, context) -> rpc_objects.TagSet:
     # Get a single tagset with the given name
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getTagSetByName request with name=%s" % (thread_id, request.name))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTagSetByName")
+        log.info("Received getTagSetByName request with name=%s", request.name)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = "SELECT * FROM public.tagsets WHERE name=%s"
-            data = (request.name,)                              # The comma is to make it a tuple with one element
-            cursor.execute(sql, data)
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")          
-            result = cursor.fetchall()[0]
-            return rpc_objects.TagSetResponse(
-                tagset=rpc_objects.TagSet(
-                    id= result['id'],
-                    name= result['name'],
-                    tagTypeId= result['tagtype_id']
-                ))
+            result = self.load_tagsets(cursor, name=request.name).get_by_name(request.name)
+            if result is None : raise NotFoundError("No results were fetched")
+            return tagset_from_row(result)
         
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TagSetResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
     
-    def createTagSet(self, request: rpc_objects.CreateTagSetRequest, context) -> rpc_objects.TagSetResponse:
+    def createTagSet(self, request: rpc_objects.CreateTagSetRequest, context) -> rpc_objects.TagSet:
     # Create of get Tagset: if a tagset with the same name and type exists, return the existent tagset.
     # If the name exists but with a different type, raise an error
     # Otherwise, create the new Tagset
     
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received createTagSet request with name=%s and tag_type=%d" % (thread_id, request.name, request.tagTypeId))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "createTagSet")
+        log.info("Received createTagSet request with name=%s and tag_type=%d", request.name, request.tagTypeId)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
             # Check if the name already exists
-            sql = "SELECT * FROM public.tagsets WHERE name = %s;"
-            data = (request.name,)
-            cursor.execute(sql, data)
-            if cursor.rowcount > 0 :
-                print("[%s] -> Tagset name '%s' already exists in database" % (thread_id, request.name))
-                existing_tagset = cursor.fetchall()[0]
+            cache = self.load_tagsets(cursor, name=request.name)
+            existing_tagset = cache.get_by_name(request.name)
+            if existing_tagset is not None :
+                log.info("-> Tagset name '%s' already exists in database", request.name)
 
                 # Check if the type matches
                 if existing_tagset['tagtype_id'] == request.tagTypeId:
-                    print("[%s] -> No type conflict, returning existing tagset" % thread_id)
-                    return rpc_objects.TagSetResponse(
-                        tagset=rpc_objects.TagSet(
-                            id= existing_tagset['id'],
-                            name= existing_tagset['name'],
-                            tagTypeId= existing_tagset['tagtype_id']
-                        ))
+                    log.info("-> No type conflict, returning existing tagset")
+                    return rpc_objects.TagSet(
+                        id= existing_tagset['id'],
+                        name= existing_tagset['name'],
+                        tagTypeId= existing_tagset['tagtype_id']
+                    )
                 else :
-                    print("[%s] -> Type conflict, returning error message" % thread_id)
-                    return rpc_objects.TagSetResponse(
-                        error_message="Error: Tagset name '%s' already exists with a different type" % request.name
-                        )
+                    log.info("-> Type conflict, returning error message")
+                    raise ConflictError("Tagset name '%s' already exists with a different type" % request.name)
                 
             # If name inexistent, create the new tagset
-            sql = "INSERT INTO public.tagsets (name, tagtype_id) VALUES (%s, %s) RETURNING *;"
+            if not cache.has_tag_type(request.tagTypeId):
+                raise InvalidArgumentError("Invalid tag type %d" % request.tagTypeId)
+            sql = "INSERT INTO public.tagsets (name, tagtype_id) VALUES (%s, %s) RETURNING id, name, tagtype_id;"
             data = (request.name, request.tagTypeId)
             cursor.execute(sql, data)
-            inserted_tagset = cursor.fetchall()[0] 
-            return rpc_objects.TagSetResponse(
-                tagset=rpc_objects.TagSet(
-                    id= inserted_tagset['id'],
-                    name= inserted_tagset['name'],
-                    tagTypeId= inserted_tagset['tagtype_id']
-                )
+            inserted_tagset = cursor.fetchall()[0]
+            cache.add(inserted_tagset)
+            return rpc_objects.TagSet(
+                id= inserted_tagset['id'],
+                name= inserted_tagset['name'],
+                tagTypeId= inserted_tagset['tagtype_id']
             )
         
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TagSetResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
         
 
     #!================ Tags ===============================================================================
     def getTags(self, request: rpc_objects.GetTagsRequest, context):
     # Get all the tags stored in DB, with optional tagtype and tagset filters
       
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getTags request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTags")
+        log.info("Received getTags request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTags", row_factory=tuple_row, binary=True)
         count = 0
         try:
-            sql = """SELECT
-    t.id,
-    t.tagtype_id,
-    t.tagset_id,
-    ant.name as text_value,
-	tst.name as timestamp_value,
-	tt.name as time_value,
-	dt.name as date_value,
-	nt.name as num_value
-FROM
-    public.tags t
-LEFT JOIN
-    public.alphanumerical_tags ant ON t.id = ant.id
-LEFT JOIN
-    public.timestamp_tags tst ON t.id = tst.id
-LEFT JOIN
-    public.time_tags tt ON t.id = tt.id
-LEFT JOIN
-    public.date_tags dt ON t.id = dt.id
-LEFT JOIN
-    public.numerical_tags nt ON t.id = nt.id
-            """
-            # Optional filters
-            if request.tagSetId > 0 or request.tagTypeId > 0:
-                sql += " WHERE "
-                if request.tagSetId > 0 and request.tagTypeId > 0:
-                    sql += "t.tagset_id = %d AND t.tagtype_id = %d" % (request.tagSetId, request.tagTypeId)
-                elif request.tagSetId > 0:
-                    sql += "t.tagset_id = %d" % request.tagSetId
-                else:
-                    sql += "t.tagtype_id = %d" % request.tagTypeId
-                    
-            cursor.execute(sql)
-            res = cursor.fetchall()
-            if len(res) == 0 : raise Exception("No results were fetched")
-            for row in res:
-                count += 1
-                match row['tagtype_id']:
-                    case 1:
-                        tag = rpc_objects.Tag(
-                            id=row['id'],
-                            tagSetId=row['tagset_id'],
-                            tagTypeId=row['tagtype_id'],
-                            alphanumerical = rpc_objects.AlphanumericalValue(value=row['text_value'])
-                        )
-                    case 2:
-                        tag = rpc_objects.Tag(
-                            id=row['id'],
-                            tagSetId=row['tagset_id'],
-                            tagTypeId=row['tagtype_id'],
-                            timestamp =  rpc_objects.TimeStampValue(value=str(row['timestamp_value']))
-                        )
-                    case 3:
-                        tag = rpc_objects.Tag(
-                            id=row['id'],
-                            tagSetId=row['tagset_id'],
-                            tagTypeId=row['tagtype_id'],
-                            time = rpc_objects.TimeValue(value=str(row['time_value']))
-                        )
-                    case 4:
-                        tag = rpc_objects.Tag(
-                            id=row['id'],
-                            tagSetId=row['tagset_id'],
-                            tagTypeId=row['tagtype_id'],
-                            date = rpc_objects.DateValue(value=str(row['date_value']))
-                        )
-                    case 5:
-                        tag = rpc_objects.Tag(
-                            id=row['id'],
-                            tagSetId=row['tagset_id'],
-                            tagTypeId=row['tagtype_id'],
-                            numerical = rpc_objects.NumericalValue(value=row['num_value'])
-                        )
-                    case _:
-                        tag = {}
-                yield rpc_objects.TagResponse(
-                    tag=tag
-                    )
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute(tags_sql(request))
+                fill = tag_converter(row_columns(cursor))
+                for row in cursor:
+                    count += 1
+                    response = rpc_objects.StreamingTagResponse()
+                    fill(response.tag, row)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTagResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def getTagsBatched(self, request: rpc_objects.GetTagsRequest, context):
+    # Same as getTags, with up to fetch_size tags per message
+
+        log = request_logger(context, "getTagsBatched")
+        log.info("Received getTagsBatched request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTagsBatched", row_factory=tuple_row, binary=True)
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(tags_sql(request))
+                fill = tag_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingTagBatchResponse()
+                    fill_batch(response.batch.tags, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            yield rpc_objects.TagResponse(error_message=repr(e))
-        # print("[%s] -> Fetched %d items from database" % (thread_id, count))
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTagBatchResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
-    def getTag(self, request: rpc_objects.IdRequest, context) -> rpc_objects.TagResponse:
+    def getTag(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Tag:
     # Get a single tag with the given ID
         
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received getTag request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTag")
+        log.debug("Received getTag request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = """SELECT
-    t.id,
-    t.tagtype_id,
-    t.tagset_id,
-    ant.name as text_value,
-	tst.name as timestamp_value,
-	tt.name as time_value,
-	dt.name as date_value,
-	nt.name as num_value
-FROM
-    (SELECT * FROM public.tags WHERE id = %d) t
-LEFT JOIN
-    public.alphanumerical_tags ant ON t.id = ant.id
-LEFT JOIN
-    public.timestamp_tags tst ON t.id = tst.id
-LEFT JOIN
-    public.time_tags tt ON t.id = tt.id
-LEFT JOIN
-    public.date_tags dt ON t.id = dt.id
-LEFT JOIN
-    public.numerical_tags nt ON t.id = nt.id""" % request.id
-            cursor.execute(sql)
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")
+            execute_prepared(cursor, "getTag", request.id)
+            if cursor.rowcount == 0 : raise NotFoundError("No results were fetched")
             result = cursor.fetchall()[0]
-            match result['tagtype_id']:
-                case 1:
-                    tag = rpc_objects.Tag(
-                        id=result['id'],
-                        tagSetId=result['tagset_id'],
-                        tagTypeId=result['tagtype_id'],
-                        alphanumerical = rpc_objects.AlphanumericalValue(value=result['text_value'])
-                    )
-                case 2:
-                    tag = rpc_objects.Tag(
-                        id=result['id'],
-                        tagSetId=result['tagset_id'],
-                        tagTypeId=result['tagtype_id'],
-                        timestamp =  rpc_objects.TimeStampValue(value=str(result['timestamp_value']))
-                    )
-                case 3:
-                    tag = rpc_objects.Tag(
-                        id=result['id'],
-                        tagSetId=result['tagset_id'],
-                        tagTypeId=result['tagtype_id'],
-                        time = rpc_objects.TimeValue(value=str(result['time_value']))
-                    )
-                case 4:
-                    tag = rpc_objects.Tag(
-                        id=result['id'],
-                        tagSetId=result['tagset_id'],
-                        tagTypeId=result['tagtype_id'],
-                        date = rpc_objects.DateValue(value=str(result['date_value']))
-                    )
-                case 5:
-                    tag = rpc_objects.Tag(
-                        id=result['id'],
-                        tagSetId=result['tagset_id'],
-                        tagTypeId=result['tagtype_id'],
-                        numerical = rpc_objects.NumericalValue(value=result['num_value'])
-                    )
-                case _:
-                    tag = {}
-            return rpc_objects.TagResponse(tag=tag)
-            # print("[%s] -> Fetched 1 tag from database" % thread_id)
+            log.debug("-> Fetched 1 tag from database")
+            return tag_from_row(result)
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TagResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
 
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
-    def createTag(self, request: rpc_objects.CreateTagRequest, context) -> rpc_objects.TagResponse:
-    # Create or get tag if already existent. This function is lengthy as it needs to send and receive different RPC objects
-    # depending on the type of the Tag.
+    def getTagsByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the tags with the given IDs with a single query, sent in batches of up to fetch_size tags.
+    # The IDs that do not exist are skipped
 
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received createTag request with tagset_id=%d and tagtype_id=%d" % (thread_id, request.tagSetId, request.tagTypeId))
-        tagset_id = request.tagSetId
-        tagtype_id = request.tagTypeId
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTagsByIds")
+        log.info("Received getTagsByIds request with %d IDs", len(request.ids))
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTagsByIds", row_factory=tuple_row, binary=True)
+        count = 0
         try:
-            # Check existence of the tag
-            sql = """SELECT t.id, t.tagtype_id, t.tagset_id, a.name as value FROM 
-(SELECT * FROM public.tags WHERE tagset_id = %d AND tagtype_id = %d) t
-LEFT JOIN """ % (tagset_id, tagtype_id)
-            data = ()
-            match request.tagTypeId:
-                case 1: 
-                    sql += "public.alphanumerical_tags a ON t.id = a.id WHERE a.name = %s" 
-                    data = (request.alphanumerical.value,)
-                case 2:                                                              
-                    sql += "public.timestamp_tags a ON t.id = a.id WHERE a.name = %s"
-                    data = (request.timestamp.value,)
-                case 3:                                                              
-                    sql += "public.time_tags a ON t.id = a.id WHERE a.name = %s" 
-                    data = (request.time.value,)
-                case 4:                                                              
-                    sql += "public.date_tags a ON t.id = a.id WHERE a.name = %s" 
-                    data = (request.date.value,)
-                case 5: 
-                    sql += "public.numerical_tags a ON t.id = a.id WHERE a.name = %s" 
-                    data = (request.numerical.value,)
-                case _:
-                    raise Exception("invalid tag type: range is 1-5")
-            cursor.execute(sql, data)
+            with conn.transaction():
+                cursor.execute(TAGS_BY_IDS_SQL, (list(request.ids),))
+                fill = tag_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingTagBatchResponse()
+                    fill_batch(response.batch.tags, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTagBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
 
-            # If cursor has result, i.e. the tag already exists, return it
-            if cursor.rowcount > 0:
-                # print("[%s] -> Tag already present in DB, returning tag info" % thread_id)
-                result = cursor.fetchall()[0]
-                match request.tagTypeId:
-                    case 1:
-                        return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=result['tagtype_id'],
-                                alphanumerical= rpc_objects.AlphanumericalValue(value=result['value'])
-                            ))
-                    case 2:
-                        return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=result['tagtype_id'],
-                                timestamp= rpc_objects.TimeStampValue(value=str(result['value']))
-                            ))
-                    case 3:
-                        return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=result['tagtype_id'],
-                                time = rpc_objects.TimeValue(value=str(result['value']))
-                            ))
-                    case 4:
-                        return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=result['tagtype_id'],
-                                date = rpc_objects.DateValue(value=str(result['value']))
-                            ))
-                    case 5:
-                        return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=result['tagtype_id'],
-                                numerical= rpc_objects.NumericalValue(value=result['value'])
-                            ))
 
+    def createTag(self, request: rpc_objects.CreateTagRequest, context) -> rpc_objects.Tag:
+    # Create or get tag if already existent, in a single call to the function get_or_create_tag of the database
 
-            # print("[%s] -> Tag valid and non-existent, creating tag.." % thread_id)
-            sql = "INSERT INTO public.tags (tagtype_id, tagset_id) VALUES (%d, %d) RETURNING id" % (tagtype_id, tagset_id)
-            cursor.execute(sql)
-            tag_id = cursor.fetchall()[0]['id']
-            sql = "INSERT INTO public."
-            match tagtype_id:
-                case 1:
-                    sql += "alphanumerical_tags (id, name, tagset_id) VALUES (%s, %s, %s) RETURNING *"
-                    data = (tag_id, request.alphanumerical.value, tagset_id)
-                    cursor.execute(sql, data)
-                    result = cursor.fetchall()[0]
-                    return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=tagtype_id,
-                                alphanumerical= rpc_objects.AlphanumericalValue(value=result['name'])
-                            ))
-                case 2:
-                    sql += "timestamp_tags (id, name, tagset_id) VALUES (%s, %s, %s) RETURNING *"
-                    data = (tag_id, request.timestamp.value, tagset_id)
-                    cursor.execute(sql, data)
-                    result = cursor.fetchall()[0]
-                    return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=tagtype_id,
-                                timestamp= rpc_objects.TimeStampValue(value=str(result['name']))
-                            ))
-                case 3:
-                    sql += "time_tags (id, name, tagset_id) VALUES (%s, %s, %s) RETURNING *"
-                    data = (tag_id, request.time.value, tagset_id)
-                    cursor.execute(sql, data)
-                    result = cursor.fetchall()[0]
-                    return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=tagtype_id,
-                                time= rpc_objects.TimeValue(value=str(result['name']))
-                            ))
-                case 4:
-                    sql += "date_tags (id, name, tagset_id) VALUES (%s, %s, %s) RETURNING *"
-                    data = (tag_id, request.date.value, tagset_id)
-                    cursor.execute(sql, data)
-                    result = cursor.fetchall()[0]
-                    return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=tagtype_id,
-                                date= rpc_objects.DateValue(value=str(result['name']))
-                            ))
-                case 5:
-                    sql += "numerical_tags (id, name, tagset_id) VALUES (%s, %s, %s) RETURNING *"
-                    data = (tag_id, request.numerical.value, tagset_id)
-                    cursor.execute(sql, data)
-                    result = cursor.fetchall()[0]
-                    return rpc_objects.TagResponse(
-                            tag = rpc_objects.Tag(
-                                id=result['id'],
-                                tagSetId=result['tagset_id'],
-                                tagTypeId=tagtype_id,
-                                numerical= rpc_objects.NumericalValue(value=result['name'])
-                            ))
-                case _:
-                    raise Exception("This should never happen")
+        log = request_logger(context, "createTag")
+        log.debug("Received createTag request with tagset_id=%d and tagtype_id=%d", request.tagSetId, request.tagTypeId)
+        tagset_id = request.tagSetId
+        tagtype_id = request.tagTypeId
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+        try:
+            check_tagsets(self.load_tagsets(cursor, (tagset_id,)), tagtype_id, (tagset_id,))
+
+            # Get or create the tag in one round trip, prepared on first use by each pooled connection
+            params = prepared_params((tagset_id, tagtype_id, tag_value(request)))
+            cursor.execute(GET_OR_CREATE_TAG_SQL, params, prepare=True)
+            return tag_from_row(cursor.fetchone())
 
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TagResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
     def createTagStream(self, request_iterator, context):
-    # Create multiple tags using batches of INSERT commands
-    # Returns a map of the given IDs to the created IDs (used for JSON imports)
-
-        print("createTagStream")
-        tag_counter = 0
-        tag_sql = "INSERT INTO public.tags (id, tagtype_id, tagset_id) VALUES (%s, %s, %s) RETURNING *;"
-        tag_data = []
-        tag_values = {}
-        rownum_to_tagid_map = {}
-
-        cursor = self.conn.cursor()
-        for req in request_iterator:
-            match req.tagTypeId:
-                case 1:
-                    tag_values[tag_counter] = req.alphanumerical.value
-                case 2:
-                    tag_values[tag_counter] = req.timestamp.value
-                case 3:
-                    tag_values[tag_counter] = req.time.value
-                case 4:
-                    tag_values[tag_counter] = req.date.value
-                case 5:
-                    tag_values[tag_counter] = req.numerical.value
-                    
-            rownum_to_tagid_map[tag_counter] = req.tagId
-            # tag_sql += "(%s, %s, %s)," 
-            tag_data.append([
-                req.tagId,
-                req.tagTypeId,
-                req.tagSetId
-            ])
-            tag_counter += 1
+    # Create multiple tags in batches of BATCH_SIZE, with one statement per tag type and batch (see CREATE_TAGS_SQL)
+    # Returns a map of the given IDs to the created or existing IDs (used for JSON imports)
+
+        log = request_logger(context, "createTagStream")
+        bulk_load = bulk_load_requested(context)
+        log.info("Received createTagStream request%s", " (bulk load)" if bulk_load else "")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+
+        def create_tags(reqs):
+            batch = {}
+            for req in reqs:
+                add_to_tag_batch(batch, req)
+            cache = self.load_tagsets(cursor, [i for params in batch.values() for i in params[1]])
+            for tagtype_id, params in batch.items():
+                check_tagsets(cache, tagtype_id, params[1])
+            id_map = {}
+            for tagtype_id, params in batch.items():
+                cursor.execute(CREATE_TAGS_SQLS[tagtype_id], params)
+                id_map.update((row['client_id'], row['id']) for row in cursor.fetchall())
+            if bulk_load:
+                cursor.execute(TAGS_BULK_CHECK_SQL, (list(id_map.values()),))
+                check_bulk_load(cursor.fetchone())
+            return id_map
 
-            # When we reach the max batch size, we execute the query and proceed to add to the 
-            # different sub-tables of tags.
-            if tag_counter == BATCH_SIZE :
-                # tag_sql = tag_sql[:-1] + " RETURNING *;"
-                id_to_realid_map = {}
-                try:
-                    cursor.executemany(tag_sql, tag_data, returning=True)
-                    i = 0
-                    sql = ""
-                    data = []
-                    while True:
-                        inserted_tag = cursor.fetchone()
-                        tag_id = inserted_tag['id']
-                        id_to_realid_map[rownum_to_tagid_map[i]] = tag_id
-                        match inserted_tag['tagtype_id']:
-                            case 1:
-                                sql += "INSERT INTO public.alphanumerical_tags (id, name, tagset_id) VALUES (%s,%s,%s);\n"
-                            case 2:
-                                sql += "INSERT INTO public.timestamp_tags (id, name, tagset_id) VALUES (%s,%s,%s);\n"
-                            case 3:
-                                sql += "INSERT INTO public.time_tags (id, name, tagset_id) VALUES (%s,%s,%s);\n"
-                            case 4:
-                                sql += "INSERT INTO public.date_tags (id, name, tagset_id) VALUES (%s,%s,%s);\n"
-                            case 5:
-                                sql += "INSERT INTO public.numerical_tags (id, name, tagset_id) VALUES (%s,%s,%s);\n"
-                        data.append([tag_id, tag_values[i], inserted_tag['tagset_id']])
-                        i += 1
-                        if not cursor.nextset():
-                            break
-
-                    cursor.executemany(sql, data)
-                    yield rpc_objects.CreateTagStreamResponse(
-                        id_map=id_to_realid_map
-                    )
+        try:
+            with stream_transaction(conn, context):
+                tag_counter = 0
+                requests = iter(request_iterator)
+                for req in requests:
+                    # The request that opens the batch is added first, then up to BATCH_SIZE - 1 more
+                    reqs = list(read_batch(req, requests, [], lambda req: req))
+                    try:
+                        id_maps = []
+                        rejected = []
+                        with conn.transaction():
+                            if bulk_load:
+                                cursor.execute(BULK_LOAD_SQL)
+                            insert_or_bisect(conn, create_tags, reqs, tag_counter, id_maps, rejected)
+                        if rejected:
+                            log.info("-> %d tags rejected", len(rejected))
+                        id_map = {}
+                        for m in id_maps:
+                            id_map.update(m)
+                        response = rpc_objects.CreateTagStreamResponse(id_map=id_map, rejected=rejected)
+                    except Exception as e:
+                        log.warning("-> %r", e)
+                        response = rpc_objects.CreateTagStreamResponse(
+                            error_message="Error adding batch of tags: %s" % repr(e)
+                        )
+                    tag_counter += len(reqs)
+                    yield response
 
-                except Exception as e:
-                    cursor.close()
-                    yield rpc_objects.CreateTagStreamResponse(
-                    error_message="Error adding batch of tags: %s" % repr(e)
-                    )     
-                finally:
-                    tag_counter = 0
-                    tag_sql = "INSERT INTO public.tags (tagtype_id, tagset_id) VALUES "
-                    tag_data = ()
-                    tag_values = {}
-                    rownum_to_tagid_map = {}
-
-        # Add the remaining tags
-        if tag_counter > 0:
-            # tag_sql = tag_sql[:-1] + " RETURNING *;"
-            id_to_realid_map = {}
-            try:
-                cursor.executemany(tag_sql, tag_data, returning=True)
-                i = 0
-                sql = ""
-                data = []
-                while True:
-                    inserted_tag = cursor.fetchone()
-                    tag_id = inserted_tag['id']
-                    id_to_realid_map[rownum_to_tagid_map[i]] = tag_id
-                    match inserted_tag['tagtype_id']:
-                        case 1:
-                            sql = "INSERT INTO public.alphanumerical_tags (id, name, tagset_id) VALUES (%s,%s,%s);"
-                        case 2:
-                            sql = "INSERT INTO public.timestamp_tags (id, name, tagset_id) VALUES (%s,%s,%s);"
-                        case 3:
-                            sql = "INSERT INTO public.time_tags (id, name, tagset_id) VALUES (%s,%s,%s);"
-                        case 4:
-                            sql = "INSERT INTO public.date_tags (id, name, tagset_id) VALUES (%s,%s,%s);"
-                        case 5:
-                            sql += "INSERT INTO public.numerical_tags (id, name, tagset_id) VALUES (%s,%s,%s);"
-                    data.append([tag_id, tag_values[i], inserted_tag['tagset_id']])
-                    i += 1
-                    if not cursor.nextset():
-                        break
-
-                cursor.executemany(sql, data)
-                yield rpc_objects.CreateTagStreamResponse(
-                        id_map=id_to_realid_map
-                    )
-            except Exception as e:
-                yield rpc_objects.CreateTagStreamResponse(
-                    error_message="Error adding batch of tags: %s" % repr(e)
-                )
-            
-            finally:    # Runs before the return of each section
-                cursor.close()      
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
 
 
     #!================ Taggings (ObjectTagRelations) ======================================================
-    def getTaggings(self, request: rpc_objects.EmptyRequest, context):
+    def getTaggings(self, request: rpc_objects.Empty, context):
     # Get all the taggings stored in DB.
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getTaggings request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getTaggings")
+        log.info("Received getTaggings request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTaggings")
+        count = 0
         try:
-            sql = "SELECT * FROM public.taggings"
-            cursor.execute(sql)
-            res = cursor.fetchall()
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
-            for row in res:
-                yield rpc_objects.TaggingResponse(
-                    tagging=rpc_objects.Tagging(
-                        mediaId=row['object_id'],
-                        tagId=row['tag_id']
-                    ))
-                
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute("SELECT * FROM public.taggings")
+                for row in cursor:
+                    count += 1
+                    yield rpc_objects.StreamingTaggingResponse(tagging=tagging_from_row(row))
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            yield rpc_objects.TaggingResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTaggingResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
 
+    def getTaggingsBatched(self, request: rpc_objects.Empty, context):
+    # Same as getTaggings, with up to fetch_size taggings per message
+
+        log = request_logger(context, "getTaggingsBatched")
+        log.info("Received getTaggingsBatched request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getTaggingsBatched")
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute("SELECT * FROM public.taggings")
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    yield rpc_objects.StreamingTaggingBatchResponse(batch=tagging_batch_from_rows(rows))
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingTaggingBatchResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
     def getMediasWithTag(self, request: rpc_objects.IdRequest, context) -> rpc_objects.RepeatedIdResponse :
     # Get IDs of all medias with a given tag (only providing the ID)
         
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getMediasWithTag request with tag_id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getMediasWithTag")
+        log.info("Received getMediasWithTag request with tag_id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = ("SELECT object_id FROM public.taggings WHERE tag_id = %d"
-                   % request.id)
-            cursor.execute(sql)
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
-            else: result = [item for item, in cursor]
+            execute_prepared(cursor, "getMediasWithTag", request.id)
+            if cursor.rowcount == 0: raise NotFoundError("No results were fetched")
+            else: result = [row['object_id'] for row in cursor]
             return rpc_objects.RepeatedIdResponse(ids=result)
 
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.RepeatedIdResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
 
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
     def getMediaTags(self, request: rpc_objects.IdRequest, context) -> rpc_objects.RepeatedIdResponse :
     # Get IDs of all tags of a given media (only providing the ID)
     
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received getMediaTags request with media_id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getMediaTags")
+        log.debug("Received getMediaTags request with media_id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = ("SELECT tag_id FROM public.taggings WHERE object_id = %d"
-                   % request.id)
-            cursor.execute(sql)
-            if cursor.rowcount == 0: raise Exception("No results were fetched")
-            result = [item for item, in cursor]
+            execute_prepared(cursor, "getMediaTags", request.id)
+            if cursor.rowcount == 0: raise NotFoundError("No results were fetched")
+            result = [row['tag_id'] for row in cursor]
             return rpc_objects.RepeatedIdResponse(ids=result)
 
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.RepeatedIdResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
 
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
+
+
+    def getMediaTagLists(self, request: rpc_objects.GetMediasRequest, context):
+    # Get all the medias with the IDs of their tags, with optional type filter, in batches of up to fetch_size medias.
+    # Replaces a getMediaTags request per media for exports
+
+        log = request_logger(context, "getMediaTagLists")
+        log.info("Received getMediaTagLists request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getMediaTagLists", row_factory=tuple_row, binary=True)
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(media_tag_lists_sql(request))
+                fill = media_tag_list_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingMediaTagListResponse()
+                    fill_batch(response.batch.medias, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingMediaTagListResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
 
 
-    def createTagging(self, request: rpc_objects.CreateTaggingRequest, context) -> rpc_objects.TaggingResponse:
+    def queryMedias(self, request: rpc_objects.QueryMediasRequest, context):
+    # Get the medias matching a boolean expression over tags, tagsets and nodes, with a single query.
+    # The medias are sent in ID order, in batches of up to fetch_size medias
+
+        log = request_logger(context, "queryMedias")
+        log.info("Received queryMedias request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="queryMedias", row_factory=tuple_row, binary=True)
+        count = 0
+        try:
+            params = []
+            sql = query_medias_sql(request, params)
+            with conn.transaction():
+                cursor.execute(sql, params)
+                fill = media_converter(row_columns(cursor))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    response = rpc_objects.StreamingMediaBatchResponse()
+                    fill_batch(response.batch.medias, fill, rows)
+                    yield response
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def createTagging(self, request: rpc_objects.CreateTaggingRequest, context) -> rpc_objects.Tagging:
     # Create a tagging, i.e. associate a given tag to a given media. Return the existing tagging if already present in DB
     
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received createTagging request with media_id=%d and tag_id=%d" % (thread_id, request.mediaId, request.tagId))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "createTagging")
+        log.debug("Received createTagging request with media_id=%d and tag_id=%d", request.mediaId, request.tagId)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            # Check for existence
-            sql = ("SELECT * FROM public.taggings WHERE object_id = %d AND tag_id = %d"
-                   % (request.mediaId, request.tagId))
-            cursor.execute(sql)
-            if cursor.rowcount == 0: 
-                sql = ("INSERT INTO public.taggings (object_id, tag_id) VALUES (%d, %d) RETURNING *;" 
-                % (request.mediaId, request.tagId))
-                cursor.execute(sql)
-            else:
-                pass
-                # print("[%s] -> Tagging already present in database, returning value to client" % thread_id)
-
-            tagging = cursor.fetchall()[0]
-            return rpc_objects.TaggingResponse(
-                tagging = rpc_objects.Tagging(
-                    mediaId=tagging['object_id'],
-                    tagId=tagging['tag_id']
-                ))
+            # No row is returned if the tagging already exists, it is then the same as the requested one
+            cursor.execute(CREATE_TAGGING_SQL, prepared_params((request.mediaId, request.tagId)), prepare=True)
+            if cursor.rowcount == 0: log.debug("-> Tagging already present in database, returning value to client")
+            return rpc_objects.Tagging(
+                mediaId=request.mediaId,
+                tagId=request.tagId
+            )
             
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.TaggingResponse(error_message=repr(e))
-        
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
+        finally:
             cursor.close()  
+            self.pool.putconn(conn)
 
     
     def createTaggingStream(self, request_iterator, context):
-    # Create multiple taggings in a row, using batches of INSERT queries
-    # Returns the amount added at each batch addition (similiar behaviour as in createMediaStream)
-
-        cursor = self.conn.cursor()
-        request_counter = 0
-        sql = "INSERT INTO public.taggings (object_id, tag_id) VALUES "
-        data = ()
-
-        for request in request_iterator:
-
-            request_counter += 1
-            sql += "(%s, %s)," 
-            data += (request.mediaId, request.tagId,)
-
-            if request_counter % BATCH_SIZE == 0:
-                sql = sql[:-1] + ";"
-                try:
-                    cursor.execute(sql, data)
-                    response = rpc_objects.CreateTaggingStreamResponse(count=request_counter)
-                except Exception as e:
-                    response = rpc_objects.CreateTaggingStreamResponse(error_message=repr(e))
-                yield response
+    # Create multiple taggings in a row, in batches of BATCH_SIZE copied to a staging table and merged in a transaction
+    # Returns the amount received, inserted and skipped (already existing) after each batch
+
+        log = request_logger(context, "createTaggingStream")
+        bulk_load = bulk_load_requested(context)
+        log.debug("Received createTaggingStream request%s", " (bulk load)" if bulk_load else "")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+
+        def copy_taggings(rows):
+            with cursor.copy(TAGGINGS_COPY_SQL) as copy:
+                copy.set_types(TAGGINGS_COPY_TYPES)
+                for row in rows:
+                    copy.write_row(row)
+            return merge_taggings(cursor, bulk_load)
 
-                sql = "INSERT INTO public.taggings (object_id, tag_id) VALUES "
-                data = ()
+        try:
+            cursor.execute(TAGGINGS_STAGING_SQL)
+            with stream_transaction(conn, context):
+                request_counter = 0
+                inserted_counter = 0
+                skipped_counter = 0
+                requests = iter(request_iterator)
+                for request in requests:
+                    # The request that opens the batch is written first, then up to BATCH_SIZE - 1 more
+                    rows = []
+                    batch = read_batch(request, requests, rows, tagging_copy_row)
+                    try:
+                        inserted = []
+                        rejected = []
+                        with conn.transaction():
+                            if bulk_load:
+                                cursor.execute(BULK_LOAD_SQL)
+                            try:
+                                with conn.transaction():
+                                    inserted.append(copy_taggings(batch))
+                            except ROW_ERRORS as e:
+                                for _ in batch:     # Reads the rest of the batch
+                                    pass
+                                insert_or_bisect(conn, copy_taggings, rows, request_counter, inserted, rejected, e)
+                        request_counter += len(rows)
+                        inserted_counter += sum(inserted)
+                        skipped_counter += len(rows) - sum(inserted) - len(rejected)
+                        response = rpc_objects.CreateTaggingStreamResponse(
+                            count=request_counter, inserted=inserted_counter, skipped=skipped_counter, rejected=rejected)
+                    except Exception as e:
+                        log.warning("-> %r", e)
+                        for _ in batch:
+                            pass
+                        request_counter += len(rows)
+                        response = rpc_objects.CreateTaggingStreamResponse(
+                            error=error_status(e), inserted=inserted_counter, skipped=skipped_counter)
+                    yield response
 
-        if request_counter % BATCH_SIZE > 0:
-            sql = sql[:-1] + ";"
-            try:
-                cursor.execute(sql, data)
-                response = rpc_objects.CreateTaggingStreamResponse(count=request_counter)
-            except Exception as e:
-                response = rpc_objects.CreateTaggingStreamResponse(error_message=repr(e))
-            yield response
-            
-        cursor.close()
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+            self.refresher.schedule()
 
     #!================ Hierarchies  =======================================================================
 
     def getHierarchies(self, request: rpc_objects.GetHierarchiesRequest, context) : 
     # Get all the hierarchies stored in DB, with optional tagset filter
         
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getHierarchies request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getHierarchies")
+        log.info("Received getHierarchies request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getHierarchies")
+        count = 0
         try:
-            sql = "SELECT * FROM public.hierarchies"
-            if request.tagSetId > 0:
-                sql += " WHERE tagset_id = %d" % request.tagSetId
-            cursor.execute(sql)
-            res = cursor.fetchall()
-            if len(res) == 0 : raise Exception("No results were fetched") 
-            for row in res:
-                yield rpc_objects.HierarchyResponse(
-                    hierarchy=rpc_objects.Hierarchy(
-                        id=row['id'],
-                        name=row['name'],
-                        tagSetId=row['tagset_id'],
-                        rootNodeId=row['rootnode_id']
-                    ))
-                
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute(hierarchies_sql(request))
+                for row in cursor:
+                    count += 1
+                    yield rpc_objects.StreamingHierarchyResponse(hierarchy=hierarchy_from_row(row))
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            yield rpc_objects.HierarchyResponse(error_message=repr(e))
-
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingHierarchyResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
-    def getHierarchy(self, request: rpc_objects.IdRequest, context) -> rpc_objects.HierarchyResponse:
+    def getHierarchy(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Hierarchy:
     # Get a single hierarchy with the given ID
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received getHierarchy request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getHierarchy")
+        log.info("Received getHierarchy request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = """SELECT * FROM public.hierarchies WHERE id=%d""" % request.id
-            cursor.execute(sql)
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")
+            execute_prepared(cursor, "getHierarchy", request.id)
+            if cursor.rowcount == 0 : raise NotFoundError("No results were fetched")
             result = cursor.fetchall()[0]
-            return rpc_objects.HierarchyResponse(
-                hierarchy=rpc_objects.Hierarchy(
-                    id=result['id'],
-                    name=result['name'],
-                    tagSetId=result['tagset_id'],
-                    rootNodeId=result['rootnode_id']
-                ))
+            return rpc_objects.Hierarchy(
+                id=result['id'],
+                name=result['name'],
+                tagSetId=result['tagset_id'],
+                rootNodeId=result['rootnode_id']
+            )
         
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.HierarchyResponse(error_message=repr(e)) 
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e)) 
         
         finally:    # Runs before the return of each section
             cursor.close()   
+            self.pool.putconn(conn)
 
 
-    def createHierarchy(self, request: rpc_objects.CreateHierarchyRequest, context) -> rpc_objects.HierarchyResponse:
+    def createHierarchy(self, request: rpc_objects.CreateHierarchyRequest, context) -> rpc_objects.Hierarchy:
     # Create hierarchy with the given name and tagset_id, or returns it if already existent
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received createHierarchy request with name = %s" % (thread_id, request.name))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "createHierarchy")
+        log.info("Received createHierarchy request with name = %s", request.name)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
             # Note: the pair (name, tagset_id) is unique
             sql = "SELECT * FROM public.hierarchies WHERE name = %s AND tagset_id = %s"
@@ -1052,96 +2411,156 @@ LEFT JOIN """ % (tagset_id, tagtype_id)
                 sql = """INSERT INTO public.hierarchies (name, tagset_id) VALUES (%s, %s) RETURNING *;"""
                 cursor.execute(sql, data)
             else:
-                print("[%s] -> Hierarchy already present in database, returning value to client" % thread_id)
+                log.info("-> Hierarchy already present in database, returning value to client")
 
             response = cursor.fetchall()[0]
-            return rpc_objects.HierarchyResponse(
-                hierarchy=rpc_objects.Hierarchy(
-                    id=response['id'],
-                    name=response['name'],
-                    tagSetId=response['tagset_id'],
-                    rootNodeId=response['rootnode_id']
-                )
+            return rpc_objects.Hierarchy(
+                id=response['id'],
+                name=response['name'],
+                tagSetId=response['tagset_id'],
+                rootNodeId=response['rootnode_id']
             )
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.HierarchyResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
 
 
     #!================ Nodes ==============================================================================
     def getNodes(self, request: rpc_objects.GetNodesRequest, context) :
     # Get all the nodes stored in DB, with optional hierarchy, tag or parent node filters
 
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received getNodes request" % (thread_id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getNodes")
+        log.debug("Received getNodes request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getNodes")
+        count = 0
         try:
-            sql = "SELECT * FROM public.nodes"
-            # Reflexion: a node is a tag reference in a hierarchy, 
-            # so if more than one filter is applied we'll get only one result
-            if request.hierarchyId > 0 or request.tagId > 0 or request.parentNodeId > 0:
-                sql += " WHERE"
-                if request.hierarchyId > 0:
-                    sql += " hierarchy_id = %d AND" % request.hierarchyId
-                if request.tagId > 0:
-                    sql += " tag_id = %d AND" % request.tagId
-                if request.parentNodeId > 0:
-                    sql += " parentnode_id = %d AND" % request.parentNodeId
-                sql = sql[:len(sql)-3]       
-            cursor.execute(sql)
-            results = cursor.fetchall()
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")
-            for result in results:
-                yield rpc_objects.NodeResponse(
-                    node=rpc_objects.Node(
-                        id=result['id'],
-                        tagId=result['tag_id'],
-                        hierarchyId=result['hierarchy_id'],
-                        parentNodeId=result['parentnode_id']
-                    )
-                )
+            # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+            with conn.transaction():
+                cursor.itersize = self.fetch_size
+                cursor.execute(nodes_sql(request))
+                for row in cursor:
+                    count += 1
+                    yield rpc_objects.StreamingNodeResponse(node=node_from_row(row))
+            if count == 0: raise NotFoundError("No results were fetched")
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            yield rpc_objects.NodeResponse(error_message=repr(e))
-        
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingNodeResponse(error=error_status(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
 
 
-    def getNode(self, request: rpc_objects.IdRequest, context) -> rpc_objects.NodeResponse:
+    def getNodesBatched(self, request: rpc_objects.GetNodesRequest, context):
+    # Same as getNodes, with up to fetch_size nodes per message
+
+        log = request_logger(context, "getNodesBatched")
+        log.info("Received getNodesBatched request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getNodesBatched")
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(nodes_sql(request))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    yield rpc_objects.StreamingNodeBatchResponse(batch=rpc_objects.NodeBatch(nodes=[node_from_row(row) for row in rows]))
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingNodeBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def getNode(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Node:
     # Get a single node with the given ID
 
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received getNode request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getNode")
+        log.debug("Received getNode request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            sql = """SELECT * FROM public.nodes WHERE id=%d""" % request.id
-            cursor.execute(sql)
-            if cursor.rowcount == 0 : raise Exception("No results were fetched")
+            execute_prepared(cursor, "getNode", request.id)
+            if cursor.rowcount == 0 : raise NotFoundError("No results were fetched")
             result = cursor.fetchall()[0]
-            return rpc_objects.NodeResponse(
-                node=rpc_objects.Node(
-                    id=result['id'],
-                    tagId=result['tag_id'],
-                    hierarchyId=result['hierarchy_id'],
-                    parentNodeId=result['parentnode_id']
-                )
+            return rpc_objects.Node(
+                id=result['id'],
+                tagId=result['tag_id'],
+                hierarchyId=result['hierarchy_id'],
+                parentNodeId=result['parentnode_id']
             )
         except Exception as e:
-            # print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.NodeResponse(error_message=repr(e))   
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))   
         
         finally:    # Runs before the return of each section
             cursor.close()  
+            self.pool.putconn(conn)
+
 
+    def getNodesByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the nodes with the given IDs with a single query, sent in batches of up to fetch_size nodes.
+    # The IDs that do not exist are skipped
 
-    def createNode(self, request: rpc_objects.CreateNodeRequest, context) -> rpc_objects.NodeResponse :
-        # thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        # print("[%s] Received creatNode request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "getNodesByIds")
+        log.info("Received getNodesByIds request with %d IDs", len(request.ids))
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getNodesByIds")
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(NODES_BY_IDS_SQL, (list(request.ids),))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    yield rpc_objects.StreamingNodeBatchResponse(
+                        batch=rpc_objects.NodeBatch(nodes=[node_from_row(row) for row in rows])
+                    )
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingNodeBatchResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def getSubtree(self, request: rpc_objects.GetSubtreeRequest, context):
+    # Get a node and all the nodes below it, with their depth and optionally their tag, in batches of up to fetch_size nodes
+    # Used to export a whole hierarchy with a single request, starting from its rootnode
+
+        log = request_logger(context, "getSubtree")
+        log.info("Received getSubtree request with root_node_id=%d", request.rootNodeId)
+        conn = self.pool.getconn()
+        cursor = conn.cursor(name="getSubtree")
+        count = 0
+        try:
+            with conn.transaction():
+                cursor.execute(SUBTREE_TAGS_SQL if request.withTags else SUBTREE_NODES_SQL, (request.rootNodeId,))
+                while rows := cursor.fetchmany(self.fetch_size):
+                    count += len(rows)
+                    yield rpc_objects.StreamingSubtreeResponse(
+                        batch=rpc_objects.SubtreeBatch(nodes=[subtree_node_from_row(row, request.withTags) for row in rows])
+                    )
+            if count == 0: raise NotFoundError("No results were fetched")
+        except Exception as e:
+            log.warning("-> %r", e)
+            yield rpc_objects.StreamingSubtreeResponse(error=error_status(e))
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+
+
+    def createNode(self, request: rpc_objects.CreateNodeRequest, context) -> rpc_objects.Node :
+        log = request_logger(context, "createNode")
+        log.debug("Received creatNode request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         
         if request.parentNodeId:
         # We're not trying to add a root node
@@ -1161,23 +2580,22 @@ LEFT JOIN """ % (tagset_id, tagtype_id)
                     )      
                     cursor.execute(sql)
                 else: 
-                    # print("[%s] -> Node already present in database, returning value to client" % thread_id)
+                    log.debug("-> Node already present in database, returning value to client")
                     pass
                 response = cursor.fetchall()[0]
-                return rpc_objects.NodeResponse(
-                    node=rpc_objects.Node(
-                        id=response['id'],
-                        tagId=response['tag_id'],
-                        hierarchyId=response['hierarchy_id'],
-                        parentNodeId=response['parentnode_id']
-                    )
+                return rpc_objects.Node(
+                    id=response['id'],
+                    tagId=response['tag_id'],
+                    hierarchyId=response['hierarchy_id'],
+                    parentNodeId=response['parentnode_id']
                 )
             except Exception as e:
-                # print("[%s] -> %s" % (thread_id, repr(e)))
-                return rpc_objects.NodeResponse(error_message=repr(e))
+                log.warning("-> %r", e)
+                context.abort(status_code(e), repr(e))
             
             finally:
                 cursor.close()
+                self.pool.putconn(conn)
         
         else: 
         # We are trying to add a root node to hierarchy. Can be done only if it doesn't have any
@@ -1199,26 +2617,71 @@ LEFT JOIN """ % (tagset_id, tagtype_id)
                     sql = ("UPDATE public.hierarchies SET rootnode_id = %d WHERE id = %d" 
                            % (node['id'], request.hierarchyId))
                     cursor.execute(sql)
-                    self.conn.commit()
+                    conn.commit()
                 else:
-                    # print("[%s] -> Node already present in database, returning value to client" % thread_id)
+                    log.debug("-> Node already present in database, returning value to client")
                     node = cursor.fetchall()[0]
-                return rpc_objects.NodeResponse(
-                        node=rpc_objects.Node(
-                            id=node['id'],
-                            tagId=node['tag_id'],
-                            hierarchyId=node['hierarchy_id']
-                        )
-                    )
+                return rpc_objects.Node(
+                    id=node['id'],
+                    tagId=node['tag_id'],
+                    hierarchyId=node['hierarchy_id']
+                )
 
             except Exception as e:
-                # print("[%s] -> %s" % (thread_id, repr(e)))
-                return rpc_objects.NodeResponse(error_message=repr(e))
+                log.warning("-> %r", e)
+                context.abort(status_code(e), repr(e))
             
             finally:
                 cursor.close()
+                self.pool.putconn(conn)
+
+    def createNodeStream(self, request_iterator, context):
+    # Create nodes in batches of BATCH_SIZE. Each node has a temporary ID given by the client and refers to its parent
+    # by its temporary ID (0 for a rootnode), so a parent has to be sent before its children.
+    # A batch is inserted level by level in a transaction, and the map of its temporary IDs to node IDs is returned
+
+        log = request_logger(context, "createNodeStream")
+        bulk_load = bulk_load_requested(context)
+        log.info("Received createNodeStream request%s", " (bulk load)" if bulk_load else "")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
+        try:
+            id_map = {}     # Temporary IDs -> node IDs of the previous batches
+            requests = iter(request_iterator)
+            for req in requests:
+                # The request that opens the batch is added first, then up to BATCH_SIZE - 1 more
+                node_counter = 0
+                levels = []
+                depths = {}
+                batch_map = {}
+                try:
+                    while req is not None:
+                        add_to_node_levels(levels, depths, req)
+                        node_counter += 1
+                        req = next(requests, None) if node_counter < BATCH_SIZE else None
+                    with conn.transaction():
+                        if bulk_load:
+                            cursor.execute(BULK_LOAD_SQL)
+                        for level in levels:
+                            cursor.execute(CREATE_NODES_SQL, node_level_params(level, id_map, batch_map))
+                            batch_map.update((row['temp_id'], row['id']) for row in cursor.fetchall())
+                        if bulk_load:
+                            cursor.execute(NODES_BULK_CHECK_SQL, (list(batch_map.values()),))
+                            check_bulk_load(cursor.fetchone())
+                    id_map.update(batch_map)
+                    response = rpc_objects.CreateNodeStreamResponse(id_map=batch_map)
+                except Exception as e:
+                    log.warning("-> %r", e)
+                    response = rpc_objects.CreateNodeStreamResponse(error=error_status(e))
+                yield response
+
+        finally:
+            cursor.close()
+            self.pool.putconn(conn)
+            self.refresher.schedule()
 
-    def deleteNode(self, request: rpc_objects.IdRequest, context) -> rpc_objects.StatusResponse:
+
+    def deleteNode(self, request: rpc_objects.IdRequest, context) -> rpc_objects.Empty:
     # Delete a single node with a given ID. The process is as follows:
     # 
     # RootNode ----- ParentNode ---- *NodeToRemove* ---- ChildNodes
@@ -1228,14 +2691,15 @@ LEFT JOIN """ % (tagset_id, tagtype_id)
     #     NO: NodeToRemove is RootNode. count(childNodes) = 1 ? YES: set new rootnode to ChildNode | NO: throw an error
     # Delete NodeToRemove
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received deleteNode request with id=%d" % (thread_id, request.id))
-        cursor = self.conn.cursor()
+        log = request_logger(context, "deleteNode")
+        log.info("Received deleteNode request with id=%d", request.id)
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
             sql = "SELECT parentnode_id FROM public.nodes WHERE id = %d" % request.id
             cursor.execute(sql)
             if cursor.rowcount == 0:
-                raise Exception("Element not found")
+                raise NotFoundError("Element not found")
             node_to_remove_parentnode_id = cursor.fetchall()[0]['parentnode_id']
             if node_to_remove_parentnode_id is not None:
                 sql = "UPDATE public.nodes SET parentnode_id = %d WHERE parentnode_id = %d" % (node_to_remove_parentnode_id, request.id)
@@ -1248,7 +2712,7 @@ LEFT JOIN """ % (tagset_id, tagtype_id)
                 if cursor.rowcount == 0:
                     sql = "UPDATE public.hierarchies SET rootnode_id = NULL WHERE rootnode_id = %d" % request.id
                     cursor.execute(sql)
-                if cursor.rowcount == 1:
+                elif cursor.rowcount == 1:
                     singlechild_id = cursor.fetchall()[0]['id']
                     sql = """UPDATE public.hierarchies SET rootnode_id = %d WHERE rootnode_id = %d;
 UPDATE public.nodes SET parentnode_id = NULL WHERE id = %d;""" % (singlechild_id, request.id, singlechild_id)
@@ -1256,43 +2720,849 @@ UPDATE public.nodes SET parentnode_id = NULL WHERE id = %d;""" % (singlechild_id
 
             sql = "DELETE FROM public.nodes WHERE id=%d;" % request.id
             cursor.execute(sql)
-            return rpc_objects.StatusResponse()
+            return rpc_objects.Empty()
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.StatusResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         
         finally:
             cursor.close()
+            self.pool.putconn(conn)
         
 
     #!================ DB Management ======================================================================
-    def resetDatabase(self, request: rpc_objects.EmptyRequest, context) -> rpc_objects.StatusResponse:
+    def resetDatabase(self, request: rpc_objects.Empty, context) -> rpc_objects.Empty:
     # Reads and executes the DDL, which does 2 things: drop the schemas, and recreate all the tables and rules
 
-        thread_id = "%s-%d" % (random.choice(WORDS), random.randint(1000,9999))
-        print("[%s] Received ResetDatabase request" % thread_id)
-        cursor = self.conn.cursor()
+        log = request_logger(context, "resetDatabase")
+        log.info("Received ResetDatabase request")
+        conn = self.pool.getconn()
+        cursor = conn.cursor()
         try:
-            cursor.execute(open("../ddl.sql", "r").read())
-            print("[%s] -> SUCCESS: DB has been reset" % thread_id)
-            return rpc_objects.StatusResponse()
+            cursor.execute(open(DDL_PATH, "r").read())
+            self.tagsets.invalidate()
+            log.info("-> SUCCESS: DB has been reset")
+            return rpc_objects.Empty()
         except Exception as e:
-            print("[%s] -> %s" % (thread_id, repr(e)))
-            return rpc_objects.StatusResponse(error_message=repr(e))
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
         finally:
             cursor.close()
+            self.pool.putconn(conn)
+
+
+    def refreshViews(self, request: rpc_objects.Empty, context) -> rpc_objects.RefreshViewsResponse:
+    # Refresh nodes_taggings and tagsets_taggings without blocking their readers, or create them if needed.
+    # The requests received during a refresh are served together by the next one
+
+        log = request_logger(context, "refreshViews")
+        log.info("Received refreshViews request")
+        try:
+            response = self.refresher.refresh()
+            log.info("-> Refreshed in %.3fs (%d rows inserted, %d deleted)",
+                     response.duration, response.inserted, response.deleted)
+            return response
+        except Exception as e:
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
+
+
+    def getServerStats(self, request: rpc_objects.Empty, context) -> rpc_objects.ServerStatsResponse:
+    # Calls, errors, latencies and rows of each RPC since the server started, also served on the metrics endpoint
+        return self.metrics.stats()
+
+
+    def profile(self, request: rpc_objects.ProfileRequest, context) -> rpc_objects.ProfileResponse:
+    # Sample the stacks of the server threads, or trace the memory allocations, for request.duration seconds.
+    # The profile is written in the profile directory of the server, and its top entries are returned
+
+        log = request_logger(context, "profile")
+        log.info("Received profile request for %.1fs%s", request.duration, " (memory)" if request.memory else "")
+        try:
+            response = self.profiler.profile(request)
+            log.info("-> Profile written to %s", response.path)
+            return response
+        except Exception as e:
+            log.warning("-> %r", e)
+            context.abort(status_code(e), repr(e))
+
+
+class AsyncDataLoader(DataLoader):
+# asyncio implementation of the DataLoader, served by grpc.aio when the server is started with --aio.
+# The streaming RPCs are coroutines running on the event loop with connections from an AsyncConnectionPool,
+# so a stream waiting on the client or on Postgres does not hold a thread. The unary RPCs are inherited
+# from DataLoader and run in the migration thread pool of the aio server, with the threaded pool.
+
+    def __init__(self, pool: ConnectionPool, apool: AsyncConnectionPool, fetch_size: int = FETCH_SIZE,
+                 refresh_delay: float = REFRESH_DELAY, profile_dir: str = PROFILE_DIR) -> None:
+        super().__init__(pool, fetch_size, refresh_delay, profile_dir)
+        self.apool = apool
+        self.metrics.pools["asyncio"] = apool
+
+
+    async def load_tagsets_async(self, cursor: psycopg.AsyncCursor, tagset_ids = (), name: str | None = None) -> TagSetCache:
+    # Same as DataLoader.load_tagsets, with an asyncio cursor
+        cache = self.tagsets
+        if cache.is_stale():
+            generation = cache.generation
+            await cursor.execute(TAGSETS_CACHE_SQL)
+            tagsets = await cursor.fetchall()
+            await cursor.execute(TAG_TYPES_CACHE_SQL)
+            cache.load(generation, tagsets, await cursor.fetchall())
+        missing = cache.missing(tagset_ids, name)
+        if missing is not None:
+            await cursor.execute(TAGSETS_MISSING_SQL, missing)
+            for row in await cursor.fetchall():
+                cache.add(row)
+        return cache
+
+
+    #!================ Medias =============================================================================
+    async def getMedias(self, request: rpc_objects.GetMediasRequest, context):
+    # Get all the medias stored in DB, with optional type filter
+
+        log = request_logger(context, "getMedias")
+        log.info("Received getMedias request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getMedias", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute(medias_sql(request))
+                    fill = media_converter(row_columns(cursor))
+                    async for row in cursor:
+                        count += 1
+                        response = rpc_objects.StreamingMediaResponse()
+                        fill(response.media, row)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingMediaResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getMediasBatched(self, request: rpc_objects.GetMediasRequest, context):
+    # Same as getMedias, with up to fetch_size medias per message
+
+        log = request_logger(context, "getMediasBatched")
+        log.info("Received getMediasBatched request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getMediasBatched", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(medias_sql(request))
+                    fill = media_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingMediaBatchResponse()
+                        fill_batch(response.batch.medias, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getMediasByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the medias with the given IDs with a single query, sent in batches of up to fetch_size medias.
+    # The IDs that do not exist are skipped
 
+        log = request_logger(context, "getMediasByIds")
+        log.info("Received getMediasByIds request with %d IDs", len(request.ids))
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getMediasByIds", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(MEDIAS_BY_IDS_SQL, (list(request.ids),))
+                    fill = media_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingMediaBatchResponse()
+                        fill_batch(response.batch.medias, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def createMediaStream(self, request_iterator, context):
+    # Create multiple medias at the same time in batches, 
+    # returns confirmation/error messages when a batch is added
+    # Each batch is a binary COPY into a staging table merged into public.medias, the rows are written as the requests
+    # arrive. The medias whose URI already exists are skipped, and a batch that fails is bisected: the medias that
+    # cannot be inserted are returned. Returns the amount received, inserted and skipped after each batch
+
+        log = request_logger(context, "createMediaStream")
+        log.debug("Received createMediaStream request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor()
+
+            async def copy_medias(rows):
+                async with cursor.copy(MEDIAS_COPY_SQL) as copy:
+                    copy.set_types(MEDIAS_COPY_TYPES)
+                    # rows is read_batch_async on the first attempt, and a list of rows when the batch is bisected
+                    if isinstance(rows, list):
+                        for row in rows:
+                            await copy.write_row(row)
+                    else:
+                        async for row in rows:
+                            await copy.write_row(row)
+                return await merge_medias_async(cursor)
+
+            try:
+                await cursor.execute(MEDIAS_STAGING_SQL)
+                async with stream_transaction(conn, context):
+                    request_counter = 0
+                    inserted_counter = 0
+                    skipped_counter = 0
+                    requests = aiter(request_iterator)
+                    async for request in requests:
+                        # The request that opens the batch is written first, then up to BATCH_SIZE - 1 more
+                        rows = []
+                        batch = read_batch_async(request, requests, rows, media_copy_row)
+                        try:
+                            inserted = []
+                            rejected = []
+                            async with conn.transaction():
+                                try:
+                                    async with conn.transaction():
+                                        inserted.append(await copy_medias(batch))
+                                except ROW_ERRORS as e:
+                                    async for _ in batch:   # Reads the rest of the batch
+                                        pass
+                                    await insert_or_bisect_async(conn, copy_medias, rows, request_counter, inserted, rejected, e)
+                            request_counter += len(rows)
+                            inserted_counter += sum(inserted)
+                            skipped_counter += len(rows) - sum(inserted) - len(rejected)
+                            response = rpc_objects.CreateMediaStreamResponse(
+                                count=request_counter, inserted=inserted_counter, skipped=skipped_counter, rejected=rejected)
+                        except Exception as e:
+                            log.warning("-> Error: packet addition failed: %r", e)
+                            async for _ in batch:
+                                pass
+                            request_counter += len(rows)
+                            response = rpc_objects.CreateMediaStreamResponse(
+                                error=error_status(e), inserted=inserted_counter, skipped=skipped_counter)
+                        yield response
+
+            finally:
+                await cursor.close()
+
+
+    #!================ TagSets ============================================================================
+    async def getTagSets(self, request: rpc_objects.GetTagSetsRequest, context):
+    # Get all the tagsets stored in DB, with optional tagtype filter
+
+        log = request_logger(context, "getTagSets")
+        log.info("Received getTagSets request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTagSets")
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute(tagsets_sql(request))
+                    async for row in cursor:
+                        count += 1
+                        yield rpc_objects.StreamingTagSetResponse(tagset=tagset_from_row(row))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTagSetResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    #!================ Tags ===============================================================================
+    async def getTags(self, request: rpc_objects.GetTagsRequest, context):
+    # Get all the tags stored in DB, with optional tagtype and tagset filters
+
+        log = request_logger(context, "getTags")
+        log.info("Received getTags request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTags", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute(tags_sql(request))
+                    fill = tag_converter(row_columns(cursor))
+                    async for row in cursor:
+                        count += 1
+                        response = rpc_objects.StreamingTagResponse()
+                        fill(response.tag, row)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTagResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getTagsBatched(self, request: rpc_objects.GetTagsRequest, context):
+    # Same as getTags, with up to fetch_size tags per message
+
+        log = request_logger(context, "getTagsBatched")
+        log.info("Received getTagsBatched request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTagsBatched", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(tags_sql(request))
+                    fill = tag_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingTagBatchResponse()
+                        fill_batch(response.batch.tags, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTagBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getTagsByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the tags with the given IDs with a single query, sent in batches of up to fetch_size tags.
+    # The IDs that do not exist are skipped
+
+        log = request_logger(context, "getTagsByIds")
+        log.info("Received getTagsByIds request with %d IDs", len(request.ids))
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTagsByIds", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(TAGS_BY_IDS_SQL, (list(request.ids),))
+                    fill = tag_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingTagBatchResponse()
+                        fill_batch(response.batch.tags, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTagBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def createTagStream(self, request_iterator, context):
+    # Create multiple tags in batches of BATCH_SIZE, with one statement per tag type and batch (see CREATE_TAGS_SQL)
+    # Returns a map of the given IDs to the created or existing IDs (used for JSON imports)
+
+        log = request_logger(context, "createTagStream")
+        bulk_load = bulk_load_requested(context)
+        log.info("Received createTagStream request%s", " (bulk load)" if bulk_load else "")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor()
+
+            async def create_tags(reqs):
+                batch = {}
+                for req in reqs:
+                    add_to_tag_batch(batch, req)
+                cache = await self.load_tagsets_async(cursor, [i for params in batch.values() for i in params[1]])
+                for tagtype_id, params in batch.items():
+                    check_tagsets(cache, tagtype_id, params[1])
+                id_map = {}
+                for tagtype_id, params in batch.items():
+                    await cursor.execute(CREATE_TAGS_SQLS[tagtype_id], params)
+                    id_map.update((row['client_id'], row['id']) for row in await cursor.fetchall())
+                if bulk_load:
+                    await cursor.execute(TAGS_BULK_CHECK_SQL, (list(id_map.values()),))
+                    check_bulk_load(await cursor.fetchone())
+                return id_map
+
+            try:
+                async with stream_transaction(conn, context):
+                    tag_counter = 0
+                    requests = aiter(request_iterator)
+                    async for req in requests:
+                        # The request that opens the batch is added first, then up to BATCH_SIZE - 1 more
+                        reqs = [r async for r in read_batch_async(req, requests, [], lambda req: req)]
+                        try:
+                            id_maps = []
+                            rejected = []
+                            async with conn.transaction():
+                                if bulk_load:
+                                    await cursor.execute(BULK_LOAD_SQL)
+                                await insert_or_bisect_async(conn, create_tags, reqs, tag_counter, id_maps, rejected)
+                            if rejected:
+                                log.info("-> %d tags rejected", len(rejected))
+                            id_map = {}
+                            for m in id_maps:
+                                id_map.update(m)
+                            response = rpc_objects.CreateTagStreamResponse(id_map=id_map, rejected=rejected)
+                        except Exception as e:
+                            log.warning("-> %r", e)
+                            response = rpc_objects.CreateTagStreamResponse(
+                                error_message="Error adding batch of tags: %s" % repr(e)
+                            )
+                        tag_counter += len(reqs)
+                        yield response
+
+            finally:
+                await cursor.close()
+
+
+    #!================ Taggings (ObjectTagRelations) ======================================================
+    async def getTaggings(self, request: rpc_objects.Empty, context):
+    # Get all the taggings stored in DB.
+
+        log = request_logger(context, "getTaggings")
+        log.info("Received getTaggings request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTaggings")
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute("SELECT * FROM public.taggings")
+                    async for row in cursor:
+                        count += 1
+                        yield rpc_objects.StreamingTaggingResponse(tagging=tagging_from_row(row))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTaggingResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getTaggingsBatched(self, request: rpc_objects.Empty, context):
+    # Same as getTaggings, with up to fetch_size taggings per message
+
+        log = request_logger(context, "getTaggingsBatched")
+        log.info("Received getTaggingsBatched request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getTaggingsBatched")
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute("SELECT * FROM public.taggings")
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        yield rpc_objects.StreamingTaggingBatchResponse(batch=tagging_batch_from_rows(rows))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingTaggingBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
 
-def serve() -> None:
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
-    add_DataLoaderServicer_to_server(DataLoader(), server)
-    listen_addr = "[::]:50051"
-    server.add_insecure_port(listen_addr)
+
+    async def getMediaTagLists(self, request: rpc_objects.GetMediasRequest, context):
+    # Get all the medias with the IDs of their tags, with optional type filter, in batches of up to fetch_size medias.
+    # Replaces a getMediaTags request per media for exports
+
+        log = request_logger(context, "getMediaTagLists")
+        log.info("Received getMediaTagLists request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getMediaTagLists", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(media_tag_lists_sql(request))
+                    fill = media_tag_list_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingMediaTagListResponse()
+                        fill_batch(response.batch.medias, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingMediaTagListResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def queryMedias(self, request: rpc_objects.QueryMediasRequest, context):
+    # Get the medias matching a boolean expression over tags, tagsets and nodes, with a single query.
+    # The medias are sent in ID order, in batches of up to fetch_size medias
+
+        log = request_logger(context, "queryMedias")
+        log.info("Received queryMedias request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="queryMedias", row_factory=tuple_row, binary=True)
+            count = 0
+            try:
+                params = []
+                sql = query_medias_sql(request, params)
+                async with conn.transaction():
+                    await cursor.execute(sql, params)
+                    fill = media_converter(row_columns(cursor))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        response = rpc_objects.StreamingMediaBatchResponse()
+                        fill_batch(response.batch.medias, fill, rows)
+                        yield response
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingMediaBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def createTaggingStream(self, request_iterator, context):
+    # Create multiple taggings in a row, in batches of BATCH_SIZE copied to a staging table and merged in a transaction
+    # Returns the amount received, inserted and skipped (already existing) after each batch
+
+        log = request_logger(context, "createTaggingStream")
+        bulk_load = bulk_load_requested(context)
+        log.debug("Received createTaggingStream request%s", " (bulk load)" if bulk_load else "")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor()
+
+            async def copy_taggings(rows):
+                async with cursor.copy(TAGGINGS_COPY_SQL) as copy:
+                    copy.set_types(TAGGINGS_COPY_TYPES)
+                    # rows is read_batch_async on the first attempt, and a list of rows when the batch is bisected
+                    if isinstance(rows, list):
+                        for row in rows:
+                            await copy.write_row(row)
+                    else:
+                        async for row in rows:
+                            await copy.write_row(row)
+                return await merge_taggings_async(cursor, bulk_load)
+
+            try:
+                await cursor.execute(TAGGINGS_STAGING_SQL)
+                async with stream_transaction(conn, context):
+                    request_counter = 0
+                    inserted_counter = 0
+                    skipped_counter = 0
+                    requests = aiter(request_iterator)
+                    async for request in requests:
+                        # The request that opens the batch is written first, then up to BATCH_SIZE - 1 more
+                        rows = []
+                        batch = read_batch_async(request, requests, rows, tagging_copy_row)
+                        try:
+                            inserted = []
+                            rejected = []
+                            async with conn.transaction():
+                                if bulk_load:
+                                    await cursor.execute(BULK_LOAD_SQL)
+                                try:
+                                    async with conn.transaction():
+                                        inserted.append(await copy_taggings(batch))
+                                except ROW_ERRORS as e:
+                                    async for _ in batch:   # Reads the rest of the batch
+                                        pass
+                                    await insert_or_bisect_async(conn, copy_taggings, rows, request_counter, inserted, rejected, e)
+                            request_counter += len(rows)
+                            inserted_counter += sum(inserted)
+                            skipped_counter += len(rows) - sum(inserted) - len(rejected)
+                            response = rpc_objects.CreateTaggingStreamResponse(
+                                count=request_counter, inserted=inserted_counter, skipped=skipped_counter, rejected=rejected)
+                        except Exception as e:
+                            log.warning("-> %r", e)
+                            async for _ in batch:
+                                pass
+                            request_counter += len(rows)
+                            response = rpc_objects.CreateTaggingStreamResponse(
+                                error=error_status(e), inserted=inserted_counter, skipped=skipped_counter)
+                        yield response
+
+            finally:
+                await cursor.close()
+                self.refresher.schedule()
+
+
+    #!================ Hierarchies  =======================================================================
+    async def getHierarchies(self, request: rpc_objects.GetHierarchiesRequest, context):
+    # Get all the hierarchies stored in DB, with optional tagset filter
+
+        log = request_logger(context, "getHierarchies")
+        log.info("Received getHierarchies request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getHierarchies")
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute(hierarchies_sql(request))
+                    async for row in cursor:
+                        count += 1
+                        yield rpc_objects.StreamingHierarchyResponse(hierarchy=hierarchy_from_row(row))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingHierarchyResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    #!================ Nodes ==============================================================================
+    async def getNodes(self, request: rpc_objects.GetNodesRequest, context):
+    # Get all the nodes stored in DB, with optional hierarchy, tag or parent node filters
+
+        log = request_logger(context, "getNodes")
+        log.debug("Received getNodes request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getNodes")
+            count = 0
+            try:
+                # Server-side cursor: the rows are fetched by chunks of fetch_size while the responses are sent
+                async with conn.transaction():
+                    cursor.itersize = self.fetch_size
+                    await cursor.execute(nodes_sql(request))
+                    async for row in cursor:
+                        count += 1
+                        yield rpc_objects.StreamingNodeResponse(node=node_from_row(row))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingNodeResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getNodesBatched(self, request: rpc_objects.GetNodesRequest, context):
+    # Same as getNodes, with up to fetch_size nodes per message
+
+        log = request_logger(context, "getNodesBatched")
+        log.info("Received getNodesBatched request")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getNodesBatched")
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(nodes_sql(request))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        yield rpc_objects.StreamingNodeBatchResponse(batch=rpc_objects.NodeBatch(nodes=[node_from_row(row) for row in rows]))
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingNodeBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getNodesByIds(self, request: rpc_objects.RepeatedIdRequest, context):
+    # Get the nodes with the given IDs with a single query, sent in batches of up to fetch_size nodes.
+    # The IDs that do not exist are skipped
+
+        log = request_logger(context, "getNodesByIds")
+        log.info("Received getNodesByIds request with %d IDs", len(request.ids))
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getNodesByIds")
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(NODES_BY_IDS_SQL, (list(request.ids),))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        yield rpc_objects.StreamingNodeBatchResponse(
+                            batch=rpc_objects.NodeBatch(nodes=[node_from_row(row) for row in rows])
+                        )
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingNodeBatchResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def getSubtree(self, request: rpc_objects.GetSubtreeRequest, context):
+    # Get a node and all the nodes below it, with their depth and optionally their tag, in batches of up to fetch_size nodes
+    # Used to export a whole hierarchy with a single request, starting from its rootnode
+
+        log = request_logger(context, "getSubtree")
+        log.info("Received getSubtree request with root_node_id=%d", request.rootNodeId)
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor(name="getSubtree")
+            count = 0
+            try:
+                async with conn.transaction():
+                    await cursor.execute(SUBTREE_TAGS_SQL if request.withTags else SUBTREE_NODES_SQL, (request.rootNodeId,))
+                    while rows := await cursor.fetchmany(self.fetch_size):
+                        count += len(rows)
+                        yield rpc_objects.StreamingSubtreeResponse(
+                            batch=rpc_objects.SubtreeBatch(nodes=[subtree_node_from_row(row, request.withTags) for row in rows])
+                        )
+                if count == 0: raise NotFoundError("No results were fetched")
+            except Exception as e:
+                log.warning("-> %r", e)
+                yield rpc_objects.StreamingSubtreeResponse(error=error_status(e))
+            finally:
+                await cursor.close()
+
+
+    async def createNodeStream(self, request_iterator, context):
+    # Create nodes in batches of BATCH_SIZE. Each node has a temporary ID given by the client and refers to its parent
+    # by its temporary ID (0 for a rootnode), so a parent has to be sent before its children.
+    # A batch is inserted level by level in a transaction, and the map of its temporary IDs to node IDs is returned
+
+        log = request_logger(context, "createNodeStream")
+        bulk_load = bulk_load_requested(context)
+        log.info("Received createNodeStream request%s", " (bulk load)" if bulk_load else "")
+        async with self.apool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                id_map = {}     # Temporary IDs -> node IDs of the previous batches
+                requests = aiter(request_iterator)
+                async for req in requests:
+                    # The request that opens the batch is added first, then up to BATCH_SIZE - 1 more
+                    node_counter = 0
+                    levels = []
+                    depths = {}
+                    batch_map = {}
+                    try:
+                        while req is not None:
+                            add_to_node_levels(levels, depths, req)
+                            node_counter += 1
+                            req = await anext(requests, None) if node_counter < BATCH_SIZE else None
+                        async with conn.transaction():
+                            if bulk_load:
+                                await cursor.execute(BULK_LOAD_SQL)
+                            for level in levels:
+                                await cursor.execute(CREATE_NODES_SQL, node_level_params(level, id_map, batch_map))
+                                batch_map.update((row['temp_id'], row['id']) for row in await cursor.fetchall())
+                            if bulk_load:
+                                await cursor.execute(NODES_BULK_CHECK_SQL, (list(batch_map.values()),))
+                                check_bulk_load(await cursor.fetchone())
+                        id_map.update(batch_map)
+                        response = rpc_objects.CreateNodeStreamResponse(id_map=batch_map)
+                    except Exception as e:
+                        log.warning("-> %r", e)
+                        response = rpc_objects.CreateNodeStreamResponse(error=error_status(e))
+                    yield response
+
+            finally:
+                await cursor.close()
+                self.refresher.schedule()
+
+
+def serve(max_workers: int = MAX_WORKERS, pool_min_size: int = POOL_MIN_SIZE,
+          pool_max_size: int = POOL_MAX_SIZE, pool_timeout: float = POOL_TIMEOUT,
+          pool_max_lifetime: float = POOL_MAX_LIFETIME, fetch_size: int = FETCH_SIZE,
+          refresh_delay: float = REFRESH_DELAY, metrics_port: int = METRICS_PORT,
+          profile_dir: str = PROFILE_DIR) -> None:
+# Start the gRPC server: each worker thread borrows a connection from the shared pool
+# for the duration of a single RPC and gives it back when the handler returns
+
+    pool = create_pool(pool_min_size, pool_max_size, pool_timeout, pool_max_lifetime)
+    loader = DataLoader(pool, fetch_size, refresh_delay, profile_dir)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers),
+                         interceptors=[MetricsInterceptor(loader.metrics)])
+    add_DataLoaderServicer_to_server(loader, server)
+    server.add_insecure_port(SERVER_ADDRESS)
     server.start()
-    print("Server listening at %s" % listen_addr)
-    server.wait_for_termination()
+    LOG.info("Server listening at %s (%d workers, pool size %d-%d)",
+             SERVER_ADDRESS, max_workers, pool_min_size, pool_max_size)
+    metrics_server = start_metrics_server(loader.metrics, metrics_port)
+    try:
+        server.wait_for_termination()
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        pool.close()
+
+
+async def serve_async(max_workers: int = MAX_WORKERS, pool_min_size: int = POOL_MIN_SIZE,
+                      pool_max_size: int = POOL_MAX_SIZE, pool_timeout: float = POOL_TIMEOUT,
+                      pool_max_lifetime: float = POOL_MAX_LIFETIME, fetch_size: int = FETCH_SIZE,
+                      refresh_delay: float = REFRESH_DELAY, metrics_port: int = METRICS_PORT,
+                      profile_dir: str = PROFILE_DIR) -> None:
+# Start the grpc.aio server: streams are served on the event loop from the asyncio pool,
+# unary RPCs in a pool of max_workers threads from the threaded pool. Both pools have the same size limits.
+
+    pool = create_pool(pool_min_size, pool_max_size, pool_timeout, pool_max_lifetime)
+    apool = await create_async_pool(pool_min_size, pool_max_size, pool_timeout, pool_max_lifetime)
+    loader = AsyncDataLoader(pool, apool, fetch_size, refresh_delay, profile_dir)
+    server = grpc.aio.server(migration_thread_pool=futures.ThreadPoolExecutor(max_workers=max_workers),
+                             interceptors=[AsyncMetricsInterceptor(loader.metrics)])
+    add_DataLoaderServicer_to_server(loader, server)
+    server.add_insecure_port(SERVER_ADDRESS)
+    await server.start()
+    LOG.info("Async server listening at %s (%d workers for unary RPCs, pool size %d-%d)",
+             SERVER_ADDRESS, max_workers, pool_min_size, pool_max_size)
+    metrics_server = start_metrics_server(loader.metrics, metrics_port)
+    try:
+        await server.wait_for_termination()
+    finally:
+        if metrics_server is not None:
+            metrics_server.shutdown()
+        await server.stop(None)
+        await apool.close()
+        pool.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="ObjectCube data loader gRPC server")
+    parser.add_argument("--aio", action="store_true",
+                        help="serve with grpc.aio and an asyncio connection pool instead of a thread per RPC")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS,
+                        help="number of worker threads serving RPCs (default: %(default)s)")
+    parser.add_argument("--pool-min-size", type=int, default=POOL_MIN_SIZE,
+                        help="connections kept open in the pool (default: %(default)s)")
+    parser.add_argument("--pool-max-size", type=int, default=POOL_MAX_SIZE,
+                        help="maximum number of pooled connections (default: %(default)s)")
+    parser.add_argument("--pool-timeout", type=float, default=POOL_TIMEOUT,
+                        help="seconds to wait for a free connection (default: %(default)s)")
+    parser.add_argument("--pool-max-lifetime", type=float, default=POOL_MAX_LIFETIME,
+                        help="seconds before a pooled connection is recycled (default: %(default)s)")
+    parser.add_argument("--fetch-size", type=int, default=FETCH_SIZE,
+                        help="rows fetched at a time by the list RPCs (default: %(default)s)")
+    parser.add_argument("--refresh-delay", type=float, default=REFRESH_DELAY,
+                        help="refresh the materialisations once no tagging or node import has finished for this "
+                             "many seconds, 0 to disable (default: %(default)s)")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT,
+                        help="port of the Prometheus metrics endpoint on %s, 0 to disable (default: %%(default)s)"
+                             % METRICS_ADDRESS)
+    parser.add_argument("--profile-dir", default=PROFILE_DIR,
+                        help="directory where the profile RPC writes the profiles (default: %(default)s)")
+    parser.add_argument("--log-level", default=LOG_LEVEL,
+                        help="level of the logs, e.g. DEBUG to log every request (default: %(default)s)")
+    parser.add_argument("--rpc-log-level", action="append", default=[], metavar="RPC=LEVEL",
+                        help="level of the logs of a single RPC, e.g. getMedias=WARNING, can be repeated")
+    parser.add_argument("--log-sample", action="append", default=[], metavar="RPC=N",
+                        help="log only 1 call in N of an RPC below WARNING, e.g. createTagging=1000, can be repeated")
+    return parser.parse_args()
+
+
+def key_values(pairs: list, convert) -> dict:
+# Parses the NAME=VALUE pairs of a repeated command line option
+    return {name: convert(value) for name, value in (pair.split("=", 1) for pair in pairs)}
 
 
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO)
-    serve()
\ No newline at end of file
+    args = parse_args()
+    listener = start_logging(args.log_level.upper(), key_values(args.rpc_log_level, str.upper),
+                             key_values(args.log_sample, int))
+    try:
+        if args.aio:
+            if sys.platform == "win32":
+                # psycopg's asyncio connections do not work with the default Proactor event loop of Windows
+                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            asyncio.run(serve_async(args.workers, args.pool_min_size, args.pool_max_size, args.pool_timeout,
+                                    args.pool_max_lifetime, args.fetch_size, args.refresh_delay, args.metrics_port,
+                                    args.profile_dir))
+        else:
+            serve(args.workers, args.pool_min_size, args.pool_max_size, args.pool_timeout,
+                  args.pool_max_lifetime, args.fetch_size, args.refresh_delay, args.metrics_port,
+                  args.profile_dir)
+    finally:
+        listener.stop()
@@ -0,0 +1,83 @@
+# Micro-benchmark of the reads of getTags and getMedias, without gRPC: the rows of their queries are read with a
+# server-side cursor and converted to the messages of the batched RPCs, as dicts in text format with the *_from_row
+# functions, and as tuples in binary format with the converters of the RPCs. The rows/s of the query alone are shown
+# for both formats, and of the query and the conversion. Runs against the database of DB_CONNINFO, e.g.
+#
+#   python benchmark.py --repeat 5
+import argparse
+import time
+
+import psycopg
+from psycopg.rows import dict_row, tuple_row
+
+import dataloader_pb2 as rpc_objects
+from app import (DB_CONNINFO, FETCH_SIZE, fill_batch, media_converter, media_from_row, medias_sql, row_columns,
+                 tag_converter, tag_from_row, tags_sql)
+
+
+def read_rows(conn: psycopg.Connection, sql: str, fetch_size: int, convert=None, **cursor_options) -> int:
+# Reads all the rows of a query by chunks of fetch_size, converting each chunk if convert is given
+    count = 0
+    with conn.transaction(), conn.cursor(name="benchmark", **cursor_options) as cursor:
+        cursor.execute(sql)
+        convert_rows = convert(cursor) if convert is not None else None
+        while rows := cursor.fetchmany(fetch_size):
+            count += len(rows)
+            if convert_rows is not None:
+                convert_rows(rows)
+    return count
+
+
+def dict_converter(from_row, batch, field: str):
+# Conversion of the list RPCs before the converters: a message per dict row, copied into the batch
+    return lambda cursor: lambda rows: batch(**{field: [from_row(row) for row in rows]})
+
+
+def tuple_converter(converter, response, field: str):
+# Conversion of the list RPCs: the messages filled in place in the batch of the response
+    def convert(cursor):
+        fill = converter(row_columns(cursor))
+
+        def convert_rows(rows):
+            message = response()
+            fill_batch(getattr(message.batch, field), fill, rows)
+        return convert_rows
+    return convert
+
+
+def benchmark(conn: psycopg.Connection, sql: str, fetch_size: int, repeat: int, dict_convert, tuple_convert) -> None:
+    cases = [
+        ("dict rows, text", {"row_factory": dict_row}, None),
+        ("tuple rows, binary", {"row_factory": tuple_row, "binary": True}, None),
+        ("dict rows, text + *_from_row", {"row_factory": dict_row}, dict_convert),
+        ("tuple rows, binary + converter", {"row_factory": tuple_row, "binary": True}, tuple_convert),
+    ]
+    for name, cursor_options, convert in cases:
+        best = 0.0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = read_rows(conn, sql, fetch_size, convert, **cursor_options)
+            best = max(best, count / (time.perf_counter() - start))
+        print("  %-32s %8d rows %10.0f rows/s" % (name, count, best))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rows/s of the reads of getTags and getMedias")
+    parser.add_argument("--conninfo", default=DB_CONNINFO, help="database connection string")
+    parser.add_argument("--fetch-size", type=int, default=FETCH_SIZE, help="rows fetched per round trip")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the best one is shown")
+    args = parser.parse_args()
+
+    with psycopg.connect(args.conninfo, autocommit=True) as conn:
+        print("getTags")
+        benchmark(conn, tags_sql(rpc_objects.GetTagsRequest()), args.fetch_size, args.repeat,
+                  dict_converter(tag_from_row, rpc_objects.TagBatch, "tags"),
+                  tuple_converter(tag_converter, rpc_objects.StreamingTagBatchResponse, "tags"))
+        print("getMedias")
+        benchmark(conn, medias_sql(rpc_objects.GetMediasRequest()), args.fetch_size, args.repeat,
+                  dict_converter(media_from_row, rpc_objects.MediaBatch, "medias"),
+                  tuple_converter(media_converter, rpc_objects.StreamingMediaBatchResponse, "medias"))
+
+
+if __name__ == "__main__":
+    main()
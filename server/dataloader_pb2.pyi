@@ -1,3 +1,4 @@
+from google.rpc import status_pb2 as _status_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
@@ -5,61 +6,123 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
-class AlphanumericalValue(_message.Message):
-    __slots__ = ["value"]
-    VALUE_FIELD_NUMBER: _ClassVar[int]
-    value: str
-    def __init__(self, value: _Optional[str] = ...) -> None: ...
+class Empty(_message.Message):
+    __slots__ = []
+    def __init__(self) -> None: ...
 
-class CreateHierarchyRequest(_message.Message):
-    __slots__ = ["name", "tagSetId"]
-    NAME_FIELD_NUMBER: _ClassVar[int]
-    TAGSETID_FIELD_NUMBER: _ClassVar[int]
-    name: str
-    tagSetId: int
-    def __init__(self, name: _Optional[str] = ..., tagSetId: _Optional[int] = ...) -> None: ...
+class IdRequest(_message.Message):
+    __slots__ = ["id"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    def __init__(self, id: _Optional[int] = ...) -> None: ...
+
+class IdResponse(_message.Message):
+    __slots__ = ["id"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    def __init__(self, id: _Optional[int] = ...) -> None: ...
+
+class RepeatedIdRequest(_message.Message):
+    __slots__ = ["ids"]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class RepeatedIdResponse(_message.Message):
+    __slots__ = ["ids"]
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class RejectedRequest(_message.Message):
+    __slots__ = ["index", "error"]
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    error: _status_pb2.Status
+    def __init__(self, index: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class Media(_message.Message):
+    __slots__ = ["id", "file_uri", "file_type", "thumbnail_uri"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    FILE_URI_FIELD_NUMBER: _ClassVar[int]
+    FILE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    THUMBNAIL_URI_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    file_uri: str
+    file_type: int
+    thumbnail_uri: str
+    def __init__(self, id: _Optional[int] = ..., file_uri: _Optional[str] = ..., file_type: _Optional[int] = ..., thumbnail_uri: _Optional[str] = ...) -> None: ...
+
+class GetMediasRequest(_message.Message):
+    __slots__ = ["file_type"]
+    FILE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    file_type: int
+    def __init__(self, file_type: _Optional[int] = ...) -> None: ...
+
+class GetMediaByURIRequest(_message.Message):
+    __slots__ = ["file_uri"]
+    FILE_URI_FIELD_NUMBER: _ClassVar[int]
+    file_uri: str
+    def __init__(self, file_uri: _Optional[str] = ...) -> None: ...
 
-class CreateMediaRequest(_message.Message):
-    __slots__ = ["media"]
+class StreamingMediaResponse(_message.Message):
+    __slots__ = ["media", "error"]
     MEDIA_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
     media: Media
-    def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ...) -> None: ...
+    error: _status_pb2.Status
+    def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class MediaBatch(_message.Message):
+    __slots__ = ["medias"]
+    MEDIAS_FIELD_NUMBER: _ClassVar[int]
+    medias: _containers.RepeatedCompositeFieldContainer[Media]
+    def __init__(self, medias: _Optional[_Iterable[_Union[Media, _Mapping]]] = ...) -> None: ...
+
+class StreamingMediaBatchResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: MediaBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[MediaBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
 class CreateMediaStreamResponse(_message.Message):
-    __slots__ = ["count", "error_message"]
+    __slots__ = ["count", "error", "rejected", "inserted", "skipped"]
     COUNT_FIELD_NUMBER: _ClassVar[int]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_FIELD_NUMBER: _ClassVar[int]
     count: int
-    error_message: str
-    def __init__(self, count: _Optional[int] = ..., error_message: _Optional[str] = ...) -> None: ...
+    error: _status_pb2.Status
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    inserted: int
+    skipped: int
+    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ..., inserted: _Optional[int] = ..., skipped: _Optional[int] = ...) -> None: ...
 
-class CreateNodeRequest(_message.Message):
-    __slots__ = ["hierarchyId", "parentNodeId", "tagId"]
-    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
-    PARENTNODEID_FIELD_NUMBER: _ClassVar[int]
-    TAGID_FIELD_NUMBER: _ClassVar[int]
-    hierarchyId: int
-    parentNodeId: int
-    tagId: int
-    def __init__(self, tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
+class TagSet(_message.Message):
+    __slots__ = ["id", "name", "tagTypeId"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    tagTypeId: int
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., tagTypeId: _Optional[int] = ...) -> None: ...
 
-class CreateTagRequest(_message.Message):
-    __slots__ = ["alphanumerical", "date", "numerical", "tagSetId", "tagTypeId", "time", "timestamp"]
-    ALPHANUMERICAL_FIELD_NUMBER: _ClassVar[int]
-    DATE_FIELD_NUMBER: _ClassVar[int]
-    NUMERICAL_FIELD_NUMBER: _ClassVar[int]
-    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+class GetTagSetsRequest(_message.Message):
+    __slots__ = ["tagTypeId"]
     TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
-    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
-    TIME_FIELD_NUMBER: _ClassVar[int]
-    alphanumerical: AlphanumericalValue
-    date: DateValue
-    numerical: NumericalValue
-    tagSetId: int
     tagTypeId: int
-    time: TimeValue
-    timestamp: TimeStampValue
-    def __init__(self, tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
+    def __init__(self, tagTypeId: _Optional[int] = ...) -> None: ...
+
+class GetTagSetRequestByName(_message.Message):
+    __slots__ = ["name"]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    name: str
+    def __init__(self, name: _Optional[str] = ...) -> None: ...
 
 class CreateTagSetRequest(_message.Message):
     __slots__ = ["name", "tagTypeId"]
@@ -69,28 +132,134 @@ class CreateTagSetRequest(_message.Message):
     tagTypeId: int
     def __init__(self, name: _Optional[str] = ..., tagTypeId: _Optional[int] = ...) -> None: ...
 
-class CreateTagStreamRequest(_message.Message):
-    __slots__ = ["alphanumerical", "date", "numerical", "tagId", "tagSetId", "tagTypeId", "time", "timestamp"]
+class StreamingTagSetResponse(_message.Message):
+    __slots__ = ["tagset", "error"]
+    TAGSET_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    tagset: TagSet
+    error: _status_pb2.Status
+    def __init__(self, tagset: _Optional[_Union[TagSet, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class Tag(_message.Message):
+    __slots__ = ["id", "tagSetId", "tagTypeId", "alphanumerical", "timestamp", "time", "date", "numerical"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
     ALPHANUMERICAL_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    TIME_FIELD_NUMBER: _ClassVar[int]
     DATE_FIELD_NUMBER: _ClassVar[int]
     NUMERICAL_FIELD_NUMBER: _ClassVar[int]
-    TAGID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    tagSetId: int
+    tagTypeId: int
+    alphanumerical: AlphanumericalValue
+    timestamp: TimeStampValue
+    time: TimeValue
+    date: DateValue
+    numerical: NumericalValue
+    def __init__(self, id: _Optional[int] = ..., tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
+
+class AlphanumericalValue(_message.Message):
+    __slots__ = ["value"]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    value: str
+    def __init__(self, value: _Optional[str] = ...) -> None: ...
+
+class NumericalValue(_message.Message):
+    __slots__ = ["value"]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    value: int
+    def __init__(self, value: _Optional[int] = ...) -> None: ...
+
+class DateValue(_message.Message):
+    __slots__ = ["value"]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    value: str
+    def __init__(self, value: _Optional[str] = ...) -> None: ...
+
+class TimeValue(_message.Message):
+    __slots__ = ["value"]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    value: str
+    def __init__(self, value: _Optional[str] = ...) -> None: ...
+
+class TimeStampValue(_message.Message):
+    __slots__ = ["value"]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    value: str
+    def __init__(self, value: _Optional[str] = ...) -> None: ...
+
+class GetTagsRequest(_message.Message):
+    __slots__ = ["tagSetId", "tagTypeId"]
     TAGSETID_FIELD_NUMBER: _ClassVar[int]
     TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
+    tagSetId: int
+    tagTypeId: int
+    def __init__(self, tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ...) -> None: ...
+
+class CreateTagRequest(_message.Message):
+    __slots__ = ["tagSetId", "tagTypeId", "alphanumerical", "timestamp", "time", "date", "numerical"]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
+    ALPHANUMERICAL_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
     TIME_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    NUMERICAL_FIELD_NUMBER: _ClassVar[int]
+    tagSetId: int
+    tagTypeId: int
     alphanumerical: AlphanumericalValue
+    timestamp: TimeStampValue
+    time: TimeValue
     date: DateValue
     numerical: NumericalValue
+    def __init__(self, tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
+
+class StreamingTagResponse(_message.Message):
+    __slots__ = ["tag", "error"]
+    TAG_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    tag: Tag
+    error: _status_pb2.Status
+    def __init__(self, tag: _Optional[_Union[Tag, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class TagBatch(_message.Message):
+    __slots__ = ["tags"]
+    TAGS_FIELD_NUMBER: _ClassVar[int]
+    tags: _containers.RepeatedCompositeFieldContainer[Tag]
+    def __init__(self, tags: _Optional[_Iterable[_Union[Tag, _Mapping]]] = ...) -> None: ...
+
+class StreamingTagBatchResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: TagBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[TagBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class CreateTagStreamRequest(_message.Message):
+    __slots__ = ["tagId", "tagSetId", "tagTypeId", "alphanumerical", "timestamp", "time", "date", "numerical"]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
+    ALPHANUMERICAL_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    TIME_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    NUMERICAL_FIELD_NUMBER: _ClassVar[int]
     tagId: int
     tagSetId: int
     tagTypeId: int
-    time: TimeValue
+    alphanumerical: AlphanumericalValue
     timestamp: TimeStampValue
+    time: TimeValue
+    date: DateValue
+    numerical: NumericalValue
     def __init__(self, tagId: _Optional[int] = ..., tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
 
 class CreateTagStreamResponse(_message.Message):
-    __slots__ = ["error_message", "id_map"]
+    __slots__ = ["id_map", "error_message", "rejected"]
     class IdMapEntry(_message.Message):
         __slots__ = ["key", "value"]
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -98,11 +267,21 @@ class CreateTagStreamResponse(_message.Message):
         key: int
         value: int
         def __init__(self, key: _Optional[int] = ..., value: _Optional[int] = ...) -> None: ...
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
     ID_MAP_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
     id_map: _containers.ScalarMap[int, int]
-    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error_message: _Optional[str] = ...) -> None: ...
+    error_message: str
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error_message: _Optional[str] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ...) -> None: ...
+
+class Tagging(_message.Message):
+    __slots__ = ["mediaId", "tagId"]
+    MEDIAID_FIELD_NUMBER: _ClassVar[int]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    mediaId: int
+    tagId: int
+    def __init__(self, mediaId: _Optional[int] = ..., tagId: _Optional[int] = ...) -> None: ...
 
 class CreateTaggingRequest(_message.Message):
     __slots__ = ["mediaId", "tagId"]
@@ -112,23 +291,107 @@ class CreateTaggingRequest(_message.Message):
     tagId: int
     def __init__(self, mediaId: _Optional[int] = ..., tagId: _Optional[int] = ...) -> None: ...
 
+class StreamingTaggingResponse(_message.Message):
+    __slots__ = ["tagging", "error"]
+    TAGGING_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    tagging: Tagging
+    error: _status_pb2.Status
+    def __init__(self, tagging: _Optional[_Union[Tagging, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class TaggingBatch(_message.Message):
+    __slots__ = ["mediaIds", "tagIds"]
+    MEDIAIDS_FIELD_NUMBER: _ClassVar[int]
+    TAGIDS_FIELD_NUMBER: _ClassVar[int]
+    mediaIds: _containers.RepeatedScalarFieldContainer[int]
+    tagIds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, mediaIds: _Optional[_Iterable[int]] = ..., tagIds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class StreamingTaggingBatchResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: TaggingBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[TaggingBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class MediaTagList(_message.Message):
+    __slots__ = ["media", "tagIds"]
+    MEDIA_FIELD_NUMBER: _ClassVar[int]
+    TAGIDS_FIELD_NUMBER: _ClassVar[int]
+    media: Media
+    tagIds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ..., tagIds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class MediaTagListBatch(_message.Message):
+    __slots__ = ["medias"]
+    MEDIAS_FIELD_NUMBER: _ClassVar[int]
+    medias: _containers.RepeatedCompositeFieldContainer[MediaTagList]
+    def __init__(self, medias: _Optional[_Iterable[_Union[MediaTagList, _Mapping]]] = ...) -> None: ...
+
+class StreamingMediaTagListResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: MediaTagListBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[MediaTagListBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class MediaQuery(_message.Message):
+    __slots__ = ["tagId", "tagSetId", "nodeId", "allOf", "anyOf", "negation"]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    NODEID_FIELD_NUMBER: _ClassVar[int]
+    ALLOF_FIELD_NUMBER: _ClassVar[int]
+    ANYOF_FIELD_NUMBER: _ClassVar[int]
+    NEGATION_FIELD_NUMBER: _ClassVar[int]
+    tagId: int
+    tagSetId: int
+    nodeId: int
+    allOf: MediaQueryList
+    anyOf: MediaQueryList
+    negation: MediaQuery
+    def __init__(self, tagId: _Optional[int] = ..., tagSetId: _Optional[int] = ..., nodeId: _Optional[int] = ..., allOf: _Optional[_Union[MediaQueryList, _Mapping]] = ..., anyOf: _Optional[_Union[MediaQueryList, _Mapping]] = ..., negation: _Optional[_Union[MediaQuery, _Mapping]] = ...) -> None: ...
+
+class MediaQueryList(_message.Message):
+    __slots__ = ["operands"]
+    OPERANDS_FIELD_NUMBER: _ClassVar[int]
+    operands: _containers.RepeatedCompositeFieldContainer[MediaQuery]
+    def __init__(self, operands: _Optional[_Iterable[_Union[MediaQuery, _Mapping]]] = ...) -> None: ...
+
+class QueryMediasRequest(_message.Message):
+    __slots__ = ["query", "limit"]
+    QUERY_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    query: MediaQuery
+    limit: int
+    def __init__(self, query: _Optional[_Union[MediaQuery, _Mapping]] = ..., limit: _Optional[int] = ...) -> None: ...
+
 class CreateTaggingStreamResponse(_message.Message):
-    __slots__ = ["count", "error_message"]
+    __slots__ = ["count", "error", "inserted", "skipped", "rejected"]
     COUNT_FIELD_NUMBER: _ClassVar[int]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_FIELD_NUMBER: _ClassVar[int]
+    REJECTED_FIELD_NUMBER: _ClassVar[int]
     count: int
-    error_message: str
-    def __init__(self, count: _Optional[int] = ..., error_message: _Optional[str] = ...) -> None: ...
+    error: _status_pb2.Status
+    inserted: int
+    skipped: int
+    rejected: _containers.RepeatedCompositeFieldContainer[RejectedRequest]
+    def __init__(self, count: _Optional[int] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ..., inserted: _Optional[int] = ..., skipped: _Optional[int] = ..., rejected: _Optional[_Iterable[_Union[RejectedRequest, _Mapping]]] = ...) -> None: ...
 
-class DateValue(_message.Message):
-    __slots__ = ["value"]
-    VALUE_FIELD_NUMBER: _ClassVar[int]
-    value: str
-    def __init__(self, value: _Optional[str] = ...) -> None: ...
-
-class EmptyRequest(_message.Message):
-    __slots__ = []
-    def __init__(self) -> None: ...
+class Hierarchy(_message.Message):
+    __slots__ = ["id", "name", "tagSetId", "rootNodeId"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    TAGSETID_FIELD_NUMBER: _ClassVar[int]
+    ROOTNODEID_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    tagSetId: int
+    rootNodeId: int
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., tagSetId: _Optional[int] = ..., rootNodeId: _Optional[int] = ...) -> None: ...
 
 class GetHierarchiesRequest(_message.Message):
     __slots__ = ["tagSetId"]
@@ -136,212 +399,209 @@ class GetHierarchiesRequest(_message.Message):
     tagSetId: int
     def __init__(self, tagSetId: _Optional[int] = ...) -> None: ...
 
-class GetMediaByURIRequest(_message.Message):
-    __slots__ = ["file_uri"]
-    FILE_URI_FIELD_NUMBER: _ClassVar[int]
-    file_uri: str
-    def __init__(self, file_uri: _Optional[str] = ...) -> None: ...
-
-class GetMediasRequest(_message.Message):
-    __slots__ = ["file_type"]
-    FILE_TYPE_FIELD_NUMBER: _ClassVar[int]
-    file_type: int
-    def __init__(self, file_type: _Optional[int] = ...) -> None: ...
-
-class GetNodesRequest(_message.Message):
-    __slots__ = ["hierarchyId", "parentNodeId", "tagId"]
-    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
-    PARENTNODEID_FIELD_NUMBER: _ClassVar[int]
-    TAGID_FIELD_NUMBER: _ClassVar[int]
-    hierarchyId: int
-    parentNodeId: int
-    tagId: int
-    def __init__(self, tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
-
-class GetTagSetRequestByName(_message.Message):
-    __slots__ = ["name"]
-    NAME_FIELD_NUMBER: _ClassVar[int]
-    name: str
-    def __init__(self, name: _Optional[str] = ...) -> None: ...
-
-class GetTagSetsRequest(_message.Message):
-    __slots__ = ["tagTypeId"]
-    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
-    tagTypeId: int
-    def __init__(self, tagTypeId: _Optional[int] = ...) -> None: ...
-
-class GetTagsRequest(_message.Message):
-    __slots__ = ["tagSetId", "tagTypeId"]
-    TAGSETID_FIELD_NUMBER: _ClassVar[int]
-    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
-    tagSetId: int
-    tagTypeId: int
-    def __init__(self, tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ...) -> None: ...
-
-class Hierarchy(_message.Message):
-    __slots__ = ["id", "name", "rootNodeId", "tagSetId"]
-    ID_FIELD_NUMBER: _ClassVar[int]
+class CreateHierarchyRequest(_message.Message):
+    __slots__ = ["name", "tagSetId"]
     NAME_FIELD_NUMBER: _ClassVar[int]
-    ROOTNODEID_FIELD_NUMBER: _ClassVar[int]
     TAGSETID_FIELD_NUMBER: _ClassVar[int]
-    id: int
     name: str
-    rootNodeId: int
     tagSetId: int
-    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., tagSetId: _Optional[int] = ..., rootNodeId: _Optional[int] = ...) -> None: ...
+    def __init__(self, name: _Optional[str] = ..., tagSetId: _Optional[int] = ...) -> None: ...
 
-class HierarchyResponse(_message.Message):
-    __slots__ = ["error_message", "hierarchy"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+class StreamingHierarchyResponse(_message.Message):
+    __slots__ = ["hierarchy", "error"]
     HIERARCHY_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
+    ERROR_FIELD_NUMBER: _ClassVar[int]
     hierarchy: Hierarchy
-    def __init__(self, hierarchy: _Optional[_Union[Hierarchy, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
+    error: _status_pb2.Status
+    def __init__(self, hierarchy: _Optional[_Union[Hierarchy, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
-class IdRequest(_message.Message):
-    __slots__ = ["id"]
+class Node(_message.Message):
+    __slots__ = ["id", "tagId", "hierarchyId", "parentNodeId"]
     ID_FIELD_NUMBER: _ClassVar[int]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
+    PARENTNODEID_FIELD_NUMBER: _ClassVar[int]
     id: int
-    def __init__(self, id: _Optional[int] = ...) -> None: ...
+    tagId: int
+    hierarchyId: int
+    parentNodeId: int
+    def __init__(self, id: _Optional[int] = ..., tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
 
-class IdResponse(_message.Message):
-    __slots__ = ["error_message", "id"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    ID_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    id: int
-    def __init__(self, id: _Optional[int] = ..., error_message: _Optional[str] = ...) -> None: ...
+class CreateNodeRequest(_message.Message):
+    __slots__ = ["tagId", "hierarchyId", "parentNodeId"]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
+    PARENTNODEID_FIELD_NUMBER: _ClassVar[int]
+    tagId: int
+    hierarchyId: int
+    parentNodeId: int
+    def __init__(self, tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
 
-class Media(_message.Message):
-    __slots__ = ["file_type", "file_uri", "id", "thumbnail_uri"]
-    FILE_TYPE_FIELD_NUMBER: _ClassVar[int]
-    FILE_URI_FIELD_NUMBER: _ClassVar[int]
-    ID_FIELD_NUMBER: _ClassVar[int]
-    THUMBNAIL_URI_FIELD_NUMBER: _ClassVar[int]
-    file_type: int
-    file_uri: str
-    id: int
-    thumbnail_uri: str
-    def __init__(self, id: _Optional[int] = ..., file_uri: _Optional[str] = ..., file_type: _Optional[int] = ..., thumbnail_uri: _Optional[str] = ...) -> None: ...
+class CreateNodeStreamRequest(_message.Message):
+    __slots__ = ["tempId", "tagId", "hierarchyId", "parentTempId"]
+    TEMPID_FIELD_NUMBER: _ClassVar[int]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
+    HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
+    PARENTTEMPID_FIELD_NUMBER: _ClassVar[int]
+    tempId: int
+    tagId: int
+    hierarchyId: int
+    parentTempId: int
+    def __init__(self, tempId: _Optional[int] = ..., tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentTempId: _Optional[int] = ...) -> None: ...
 
-class MediaResponse(_message.Message):
-    __slots__ = ["error_message", "media"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    MEDIA_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    media: Media
-    def __init__(self, media: _Optional[_Union[Media, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
+class CreateNodeStreamResponse(_message.Message):
+    __slots__ = ["id_map", "error"]
+    class IdMapEntry(_message.Message):
+        __slots__ = ["key", "value"]
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: int
+        value: int
+        def __init__(self, key: _Optional[int] = ..., value: _Optional[int] = ...) -> None: ...
+    ID_MAP_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    id_map: _containers.ScalarMap[int, int]
+    error: _status_pb2.Status
+    def __init__(self, id_map: _Optional[_Mapping[int, int]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
 
-class Node(_message.Message):
-    __slots__ = ["hierarchyId", "id", "parentNodeId", "tagId"]
+class GetNodesRequest(_message.Message):
+    __slots__ = ["tagId", "hierarchyId", "parentNodeId"]
+    TAGID_FIELD_NUMBER: _ClassVar[int]
     HIERARCHYID_FIELD_NUMBER: _ClassVar[int]
-    ID_FIELD_NUMBER: _ClassVar[int]
     PARENTNODEID_FIELD_NUMBER: _ClassVar[int]
-    TAGID_FIELD_NUMBER: _ClassVar[int]
+    tagId: int
     hierarchyId: int
-    id: int
     parentNodeId: int
-    tagId: int
-    def __init__(self, id: _Optional[int] = ..., tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
+    def __init__(self, tagId: _Optional[int] = ..., hierarchyId: _Optional[int] = ..., parentNodeId: _Optional[int] = ...) -> None: ...
 
-class NodeResponse(_message.Message):
-    __slots__ = ["error_message", "node"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+class StreamingNodeResponse(_message.Message):
+    __slots__ = ["node", "error"]
     NODE_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
+    ERROR_FIELD_NUMBER: _ClassVar[int]
     node: Node
-    def __init__(self, node: _Optional[_Union[Node, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
-
-class NumericalValue(_message.Message):
-    __slots__ = ["value"]
-    VALUE_FIELD_NUMBER: _ClassVar[int]
-    value: int
-    def __init__(self, value: _Optional[int] = ...) -> None: ...
-
-class RepeatedIdResponse(_message.Message):
-    __slots__ = ["error_message", "ids"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    IDS_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    ids: _containers.RepeatedScalarFieldContainer[int]
-    def __init__(self, ids: _Optional[_Iterable[int]] = ..., error_message: _Optional[str] = ...) -> None: ...
-
-class StatusResponse(_message.Message):
-    __slots__ = ["error_message"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    def __init__(self, error_message: _Optional[str] = ...) -> None: ...
-
-class Tag(_message.Message):
-    __slots__ = ["alphanumerical", "date", "id", "numerical", "tagSetId", "tagTypeId", "time", "timestamp"]
-    ALPHANUMERICAL_FIELD_NUMBER: _ClassVar[int]
-    DATE_FIELD_NUMBER: _ClassVar[int]
-    ID_FIELD_NUMBER: _ClassVar[int]
-    NUMERICAL_FIELD_NUMBER: _ClassVar[int]
-    TAGSETID_FIELD_NUMBER: _ClassVar[int]
-    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
-    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
-    TIME_FIELD_NUMBER: _ClassVar[int]
-    alphanumerical: AlphanumericalValue
-    date: DateValue
-    id: int
-    numerical: NumericalValue
-    tagSetId: int
-    tagTypeId: int
-    time: TimeValue
-    timestamp: TimeStampValue
-    def __init__(self, id: _Optional[int] = ..., tagSetId: _Optional[int] = ..., tagTypeId: _Optional[int] = ..., alphanumerical: _Optional[_Union[AlphanumericalValue, _Mapping]] = ..., timestamp: _Optional[_Union[TimeStampValue, _Mapping]] = ..., time: _Optional[_Union[TimeValue, _Mapping]] = ..., date: _Optional[_Union[DateValue, _Mapping]] = ..., numerical: _Optional[_Union[NumericalValue, _Mapping]] = ...) -> None: ...
+    error: _status_pb2.Status
+    def __init__(self, node: _Optional[_Union[Node, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class NodeBatch(_message.Message):
+    __slots__ = ["nodes"]
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[Node]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[Node, _Mapping]]] = ...) -> None: ...
+
+class StreamingNodeBatchResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: NodeBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[NodeBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class GetSubtreeRequest(_message.Message):
+    __slots__ = ["rootNodeId", "withTags"]
+    ROOTNODEID_FIELD_NUMBER: _ClassVar[int]
+    WITHTAGS_FIELD_NUMBER: _ClassVar[int]
+    rootNodeId: int
+    withTags: bool
+    def __init__(self, rootNodeId: _Optional[int] = ..., withTags: bool = ...) -> None: ...
 
-class TagResponse(_message.Message):
-    __slots__ = ["error_message", "tag"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+class SubtreeNode(_message.Message):
+    __slots__ = ["node", "depth", "tag"]
+    NODE_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
     TAG_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
+    node: Node
+    depth: int
     tag: Tag
-    def __init__(self, tag: _Optional[_Union[Tag, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
-
-class TagSet(_message.Message):
-    __slots__ = ["id", "name", "tagTypeId"]
-    ID_FIELD_NUMBER: _ClassVar[int]
-    NAME_FIELD_NUMBER: _ClassVar[int]
-    TAGTYPEID_FIELD_NUMBER: _ClassVar[int]
-    id: int
-    name: str
-    tagTypeId: int
-    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., tagTypeId: _Optional[int] = ...) -> None: ...
-
-class TagSetResponse(_message.Message):
-    __slots__ = ["error_message", "tagset"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    TAGSET_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    tagset: TagSet
-    def __init__(self, tagset: _Optional[_Union[TagSet, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
-
-class Tagging(_message.Message):
-    __slots__ = ["mediaId", "tagId"]
-    MEDIAID_FIELD_NUMBER: _ClassVar[int]
-    TAGID_FIELD_NUMBER: _ClassVar[int]
-    mediaId: int
-    tagId: int
-    def __init__(self, mediaId: _Optional[int] = ..., tagId: _Optional[int] = ...) -> None: ...
-
-class TaggingResponse(_message.Message):
-    __slots__ = ["error_message", "tagging"]
-    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
-    TAGGING_FIELD_NUMBER: _ClassVar[int]
-    error_message: str
-    tagging: Tagging
-    def __init__(self, tagging: _Optional[_Union[Tagging, _Mapping]] = ..., error_message: _Optional[str] = ...) -> None: ...
-
-class TimeStampValue(_message.Message):
-    __slots__ = ["value"]
-    VALUE_FIELD_NUMBER: _ClassVar[int]
-    value: str
-    def __init__(self, value: _Optional[str] = ...) -> None: ...
-
-class TimeValue(_message.Message):
-    __slots__ = ["value"]
-    VALUE_FIELD_NUMBER: _ClassVar[int]
-    value: str
-    def __init__(self, value: _Optional[str] = ...) -> None: ...
\ No newline at end of file
+    def __init__(self, node: _Optional[_Union[Node, _Mapping]] = ..., depth: _Optional[int] = ..., tag: _Optional[_Union[Tag, _Mapping]] = ...) -> None: ...
+
+class SubtreeBatch(_message.Message):
+    __slots__ = ["nodes"]
+    NODES_FIELD_NUMBER: _ClassVar[int]
+    nodes: _containers.RepeatedCompositeFieldContainer[SubtreeNode]
+    def __init__(self, nodes: _Optional[_Iterable[_Union[SubtreeNode, _Mapping]]] = ...) -> None: ...
+
+class StreamingSubtreeResponse(_message.Message):
+    __slots__ = ["batch", "error"]
+    BATCH_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    batch: SubtreeBatch
+    error: _status_pb2.Status
+    def __init__(self, batch: _Optional[_Union[SubtreeBatch, _Mapping]] = ..., error: _Optional[_Union[_status_pb2.Status, _Mapping]] = ...) -> None: ...
+
+class RefreshViewsResponse(_message.Message):
+    __slots__ = ["inserted", "deleted", "duration", "requests"]
+    INSERTED_FIELD_NUMBER: _ClassVar[int]
+    DELETED_FIELD_NUMBER: _ClassVar[int]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    inserted: int
+    deleted: int
+    duration: float
+    requests: int
+    def __init__(self, inserted: _Optional[int] = ..., deleted: _Optional[int] = ..., duration: _Optional[float] = ..., requests: _Optional[int] = ...) -> None: ...
+
+class RpcStats(_message.Message):
+    __slots__ = ["method", "calls", "errors", "inFlight", "p50", "p95", "p99", "totalSeconds", "rowsReceived", "rowsSent", "rowsRejected"]
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    ERRORS_FIELD_NUMBER: _ClassVar[int]
+    INFLIGHT_FIELD_NUMBER: _ClassVar[int]
+    P50_FIELD_NUMBER: _ClassVar[int]
+    P95_FIELD_NUMBER: _ClassVar[int]
+    P99_FIELD_NUMBER: _ClassVar[int]
+    TOTALSECONDS_FIELD_NUMBER: _ClassVar[int]
+    ROWSRECEIVED_FIELD_NUMBER: _ClassVar[int]
+    ROWSSENT_FIELD_NUMBER: _ClassVar[int]
+    ROWSREJECTED_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    calls: int
+    errors: int
+    inFlight: int
+    p50: float
+    p95: float
+    p99: float
+    totalSeconds: float
+    rowsReceived: int
+    rowsSent: int
+    rowsRejected: int
+    def __init__(self, method: _Optional[str] = ..., calls: _Optional[int] = ..., errors: _Optional[int] = ..., inFlight: _Optional[int] = ..., p50: _Optional[float] = ..., p95: _Optional[float] = ..., p99: _Optional[float] = ..., totalSeconds: _Optional[float] = ..., rowsReceived: _Optional[int] = ..., rowsSent: _Optional[int] = ..., rowsRejected: _Optional[int] = ...) -> None: ...
+
+class ServerStatsResponse(_message.Message):
+    __slots__ = ["uptime", "rpcs"]
+    UPTIME_FIELD_NUMBER: _ClassVar[int]
+    RPCS_FIELD_NUMBER: _ClassVar[int]
+    uptime: float
+    rpcs: _containers.RepeatedCompositeFieldContainer[RpcStats]
+    def __init__(self, uptime: _Optional[float] = ..., rpcs: _Optional[_Iterable[_Union[RpcStats, _Mapping]]] = ...) -> None: ...
+
+class ProfileRequest(_message.Message):
+    __slots__ = ["duration", "memory", "interval", "top"]
+    DURATION_FIELD_NUMBER: _ClassVar[int]
+    MEMORY_FIELD_NUMBER: _ClassVar[int]
+    INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    TOP_FIELD_NUMBER: _ClassVar[int]
+    duration: float
+    memory: bool
+    interval: float
+    top: int
+    def __init__(self, duration: _Optional[float] = ..., memory: bool = ..., interval: _Optional[float] = ..., top: _Optional[int] = ...) -> None: ...
+
+class ProfileEntry(_message.Message):
+    __slots__ = ["location", "count", "total"]
+    LOCATION_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    location: str
+    count: int
+    total: int
+    def __init__(self, location: _Optional[str] = ..., count: _Optional[int] = ..., total: _Optional[int] = ...) -> None: ...
+
+class ProfileResponse(_message.Message):
+    __slots__ = ["path", "samples", "entries"]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    SAMPLES_FIELD_NUMBER: _ClassVar[int]
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    samples: int
+    entries: _containers.RepeatedCompositeFieldContainer[ProfileEntry]
+    def __init__(self, path: _Optional[str] = ..., samples: _Optional[int] = ..., entries: _Optional[_Iterable[_Union[ProfileEntry, _Mapping]]] = ...) -> None: ...
@@ -17,67 +17,87 @@ class DataLoaderStub(object):
         self.getMedias = channel.unary_stream(
                 '/dataloader.DataLoader/getMedias',
                 request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.MediaResponse.FromString,
+                response_deserializer=dataloader__pb2.StreamingMediaResponse.FromString,
+                )
+        self.getMediasBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getMediasBatched',
+                request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
                 )
         self.getMediaById = channel.unary_unary(
                 '/dataloader.DataLoader/getMediaById',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.MediaResponse.FromString,
+                response_deserializer=dataloader__pb2.Media.FromString,
                 )
         self.getMediaByURI = channel.unary_unary(
                 '/dataloader.DataLoader/getMediaByURI',
                 request_serializer=dataloader__pb2.GetMediaByURIRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.MediaResponse.FromString,
+                response_deserializer=dataloader__pb2.Media.FromString,
+                )
+        self.getMediasByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getMediasByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
                 )
         self.createMedia = channel.unary_unary(
                 '/dataloader.DataLoader/createMedia',
-                request_serializer=dataloader__pb2.CreateMediaRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.MediaResponse.FromString,
+                request_serializer=dataloader__pb2.Media.SerializeToString,
+                response_deserializer=dataloader__pb2.Media.FromString,
                 )
         self.createMediaStream = channel.stream_stream(
                 '/dataloader.DataLoader/createMediaStream',
-                request_serializer=dataloader__pb2.CreateMediaRequest.SerializeToString,
+                request_serializer=dataloader__pb2.Media.SerializeToString,
                 response_deserializer=dataloader__pb2.CreateMediaStreamResponse.FromString,
                 )
         self.deleteMedia = channel.unary_unary(
                 '/dataloader.DataLoader/deleteMedia',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.StatusResponse.FromString,
+                response_deserializer=dataloader__pb2.Empty.FromString,
                 )
         self.getTagSets = channel.unary_stream(
                 '/dataloader.DataLoader/getTagSets',
                 request_serializer=dataloader__pb2.GetTagSetsRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagSetResponse.FromString,
+                response_deserializer=dataloader__pb2.StreamingTagSetResponse.FromString,
                 )
         self.getTagSetById = channel.unary_unary(
                 '/dataloader.DataLoader/getTagSetById',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagSetResponse.FromString,
+                response_deserializer=dataloader__pb2.TagSet.FromString,
                 )
         self.getTagSetByName = channel.unary_unary(
                 '/dataloader.DataLoader/getTagSetByName',
                 request_serializer=dataloader__pb2.GetTagSetRequestByName.SerializeToString,
-                response_deserializer=dataloader__pb2.TagSetResponse.FromString,
+                response_deserializer=dataloader__pb2.TagSet.FromString,
                 )
         self.createTagSet = channel.unary_unary(
                 '/dataloader.DataLoader/createTagSet',
                 request_serializer=dataloader__pb2.CreateTagSetRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagSetResponse.FromString,
+                response_deserializer=dataloader__pb2.TagSet.FromString,
                 )
         self.getTags = channel.unary_stream(
                 '/dataloader.DataLoader/getTags',
                 request_serializer=dataloader__pb2.GetTagsRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagResponse.FromString,
+                response_deserializer=dataloader__pb2.StreamingTagResponse.FromString,
+                )
+        self.getTagsBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getTagsBatched',
+                request_serializer=dataloader__pb2.GetTagsRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTagBatchResponse.FromString,
                 )
         self.getTag = channel.unary_unary(
                 '/dataloader.DataLoader/getTag',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagResponse.FromString,
+                response_deserializer=dataloader__pb2.Tag.FromString,
+                )
+        self.getTagsByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getTagsByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTagBatchResponse.FromString,
                 )
         self.createTag = channel.unary_unary(
                 '/dataloader.DataLoader/createTag',
                 request_serializer=dataloader__pb2.CreateTagRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TagResponse.FromString,
+                response_deserializer=dataloader__pb2.Tag.FromString,
                 )
         self.createTagStream = channel.stream_stream(
                 '/dataloader.DataLoader/createTagStream',
@@ -86,8 +106,13 @@ class DataLoaderStub(object):
                 )
         self.getTaggings = channel.unary_stream(
                 '/dataloader.DataLoader/getTaggings',
-                request_serializer=dataloader__pb2.EmptyRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TaggingResponse.FromString,
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTaggingResponse.FromString,
+                )
+        self.getTaggingsBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getTaggingsBatched',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingTaggingBatchResponse.FromString,
                 )
         self.getMediasWithTag = channel.unary_unary(
                 '/dataloader.DataLoader/getMediasWithTag',
@@ -99,10 +124,20 @@ class DataLoaderStub(object):
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
                 response_deserializer=dataloader__pb2.RepeatedIdResponse.FromString,
                 )
+        self.getMediaTagLists = channel.unary_stream(
+                '/dataloader.DataLoader/getMediaTagLists',
+                request_serializer=dataloader__pb2.GetMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaTagListResponse.FromString,
+                )
+        self.queryMedias = channel.unary_stream(
+                '/dataloader.DataLoader/queryMedias',
+                request_serializer=dataloader__pb2.QueryMediasRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingMediaBatchResponse.FromString,
+                )
         self.createTagging = channel.unary_unary(
                 '/dataloader.DataLoader/createTagging',
                 request_serializer=dataloader__pb2.CreateTaggingRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.TaggingResponse.FromString,
+                response_deserializer=dataloader__pb2.Tagging.FromString,
                 )
         self.createTaggingStream = channel.stream_stream(
                 '/dataloader.DataLoader/createTaggingStream',
@@ -112,47 +147,77 @@ class DataLoaderStub(object):
         self.getHierarchies = channel.unary_stream(
                 '/dataloader.DataLoader/getHierarchies',
                 request_serializer=dataloader__pb2.GetHierarchiesRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.HierarchyResponse.FromString,
+                response_deserializer=dataloader__pb2.StreamingHierarchyResponse.FromString,
                 )
         self.getHierarchy = channel.unary_unary(
                 '/dataloader.DataLoader/getHierarchy',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.HierarchyResponse.FromString,
+                response_deserializer=dataloader__pb2.Hierarchy.FromString,
                 )
         self.createHierarchy = channel.unary_unary(
                 '/dataloader.DataLoader/createHierarchy',
                 request_serializer=dataloader__pb2.CreateHierarchyRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.HierarchyResponse.FromString,
+                response_deserializer=dataloader__pb2.Hierarchy.FromString,
                 )
         self.getNodes = channel.unary_stream(
                 '/dataloader.DataLoader/getNodes',
                 request_serializer=dataloader__pb2.GetNodesRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.NodeResponse.FromString,
+                response_deserializer=dataloader__pb2.StreamingNodeResponse.FromString,
+                )
+        self.getNodesBatched = channel.unary_stream(
+                '/dataloader.DataLoader/getNodesBatched',
+                request_serializer=dataloader__pb2.GetNodesRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingNodeBatchResponse.FromString,
                 )
         self.getNode = channel.unary_unary(
                 '/dataloader.DataLoader/getNode',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.NodeResponse.FromString,
+                response_deserializer=dataloader__pb2.Node.FromString,
+                )
+        self.getNodesByIds = channel.unary_stream(
+                '/dataloader.DataLoader/getNodesByIds',
+                request_serializer=dataloader__pb2.RepeatedIdRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingNodeBatchResponse.FromString,
+                )
+        self.getSubtree = channel.unary_stream(
+                '/dataloader.DataLoader/getSubtree',
+                request_serializer=dataloader__pb2.GetSubtreeRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.StreamingSubtreeResponse.FromString,
                 )
         self.createNode = channel.unary_unary(
                 '/dataloader.DataLoader/createNode',
                 request_serializer=dataloader__pb2.CreateNodeRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.NodeResponse.FromString,
+                response_deserializer=dataloader__pb2.Node.FromString,
                 )
         self.createNodeStream = channel.stream_stream(
                 '/dataloader.DataLoader/createNodeStream',
-                request_serializer=dataloader__pb2.CreateNodeRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.NodeResponse.FromString,
+                request_serializer=dataloader__pb2.CreateNodeStreamRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.CreateNodeStreamResponse.FromString,
                 )
         self.deleteNode = channel.unary_unary(
                 '/dataloader.DataLoader/deleteNode',
                 request_serializer=dataloader__pb2.IdRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.StatusResponse.FromString,
+                response_deserializer=dataloader__pb2.Empty.FromString,
                 )
         self.resetDatabase = channel.unary_unary(
                 '/dataloader.DataLoader/resetDatabase',
-                request_serializer=dataloader__pb2.EmptyRequest.SerializeToString,
-                response_deserializer=dataloader__pb2.StatusResponse.FromString,
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.Empty.FromString,
+                )
+        self.refreshViews = channel.unary_unary(
+                '/dataloader.DataLoader/refreshViews',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.RefreshViewsResponse.FromString,
+                )
+        self.getServerStats = channel.unary_unary(
+                '/dataloader.DataLoader/getServerStats',
+                request_serializer=dataloader__pb2.Empty.SerializeToString,
+                response_deserializer=dataloader__pb2.ServerStatsResponse.FromString,
+                )
+        self.profile = channel.unary_unary(
+                '/dataloader.DataLoader/profile',
+                request_serializer=dataloader__pb2.ProfileRequest.SerializeToString,
+                response_deserializer=dataloader__pb2.ProfileResponse.FromString,
                 )
 
 
@@ -166,6 +231,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getMediasBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getMediaById(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -178,6 +249,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getMediasByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createMedia(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -229,12 +306,24 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTagsBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTagsByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -254,6 +343,12 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getTaggingsBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getMediasWithTag(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -266,12 +361,26 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
-    def createTagging(self, request, context):
+    def getMediaTagLists(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def queryMedias(self, request, context):
+        """Get all the medias with the IDs of their tags, in batches, with optional type filter (used for exports)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def createTagging(self, request, context):
+        """Get the medias matching a boolean expression over tags, tagsets and hierarchy nodes, in batches ordered by ID
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createTaggingStream(self, request_iterator, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -306,12 +415,30 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getNodesBatched(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def getNode(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def getNodesByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def getSubtree(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def createNode(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -337,73 +464,114 @@ class DataLoaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def refreshViews(self, request, context):
+        """Reads and executes the DDL, which does 2 things: drop the schemas, and recreate all the tables and rules
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def getServerStats(self, request, context):
+        """Recompute nodes_taggings and tagsets_taggings without blocking their readers, or create them (views.sql)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def profile(self, request, context):
+        """Calls, errors, latencies and rows of each RPC since the server started (also served in the Prometheus format)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DataLoaderServicer_to_server(servicer, server):
     rpc_method_handlers = {
             'getMedias': grpc.unary_stream_rpc_method_handler(
                     servicer.getMedias,
                     request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
-                    response_serializer=dataloader__pb2.MediaResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.StreamingMediaResponse.SerializeToString,
+            ),
+            'getMediasBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediasBatched,
+                    request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
             ),
             'getMediaById': grpc.unary_unary_rpc_method_handler(
                     servicer.getMediaById,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.MediaResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Media.SerializeToString,
             ),
             'getMediaByURI': grpc.unary_unary_rpc_method_handler(
                     servicer.getMediaByURI,
                     request_deserializer=dataloader__pb2.GetMediaByURIRequest.FromString,
-                    response_serializer=dataloader__pb2.MediaResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Media.SerializeToString,
+            ),
+            'getMediasByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediasByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
             ),
             'createMedia': grpc.unary_unary_rpc_method_handler(
                     servicer.createMedia,
-                    request_deserializer=dataloader__pb2.CreateMediaRequest.FromString,
-                    response_serializer=dataloader__pb2.MediaResponse.SerializeToString,
+                    request_deserializer=dataloader__pb2.Media.FromString,
+                    response_serializer=dataloader__pb2.Media.SerializeToString,
             ),
             'createMediaStream': grpc.stream_stream_rpc_method_handler(
                     servicer.createMediaStream,
-                    request_deserializer=dataloader__pb2.CreateMediaRequest.FromString,
+                    request_deserializer=dataloader__pb2.Media.FromString,
                     response_serializer=dataloader__pb2.CreateMediaStreamResponse.SerializeToString,
             ),
             'deleteMedia': grpc.unary_unary_rpc_method_handler(
                     servicer.deleteMedia,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.StatusResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Empty.SerializeToString,
             ),
             'getTagSets': grpc.unary_stream_rpc_method_handler(
                     servicer.getTagSets,
                     request_deserializer=dataloader__pb2.GetTagSetsRequest.FromString,
-                    response_serializer=dataloader__pb2.TagSetResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.StreamingTagSetResponse.SerializeToString,
             ),
             'getTagSetById': grpc.unary_unary_rpc_method_handler(
                     servicer.getTagSetById,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.TagSetResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.TagSet.SerializeToString,
             ),
             'getTagSetByName': grpc.unary_unary_rpc_method_handler(
                     servicer.getTagSetByName,
                     request_deserializer=dataloader__pb2.GetTagSetRequestByName.FromString,
-                    response_serializer=dataloader__pb2.TagSetResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.TagSet.SerializeToString,
             ),
             'createTagSet': grpc.unary_unary_rpc_method_handler(
                     servicer.createTagSet,
                     request_deserializer=dataloader__pb2.CreateTagSetRequest.FromString,
-                    response_serializer=dataloader__pb2.TagSetResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.TagSet.SerializeToString,
             ),
             'getTags': grpc.unary_stream_rpc_method_handler(
                     servicer.getTags,
                     request_deserializer=dataloader__pb2.GetTagsRequest.FromString,
-                    response_serializer=dataloader__pb2.TagResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.StreamingTagResponse.SerializeToString,
+            ),
+            'getTagsBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTagsBatched,
+                    request_deserializer=dataloader__pb2.GetTagsRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingTagBatchResponse.SerializeToString,
             ),
             'getTag': grpc.unary_unary_rpc_method_handler(
                     servicer.getTag,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.TagResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Tag.SerializeToString,
+            ),
+            'getTagsByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTagsByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingTagBatchResponse.SerializeToString,
             ),
             'createTag': grpc.unary_unary_rpc_method_handler(
                     servicer.createTag,
                     request_deserializer=dataloader__pb2.CreateTagRequest.FromString,
-                    response_serializer=dataloader__pb2.TagResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Tag.SerializeToString,
             ),
             'createTagStream': grpc.stream_stream_rpc_method_handler(
                     servicer.createTagStream,
@@ -412,8 +580,13 @@ def add_DataLoaderServicer_to_server(servicer, server):
             ),
             'getTaggings': grpc.unary_stream_rpc_method_handler(
                     servicer.getTaggings,
-                    request_deserializer=dataloader__pb2.EmptyRequest.FromString,
-                    response_serializer=dataloader__pb2.TaggingResponse.SerializeToString,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.StreamingTaggingResponse.SerializeToString,
+            ),
+            'getTaggingsBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getTaggingsBatched,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.StreamingTaggingBatchResponse.SerializeToString,
             ),
             'getMediasWithTag': grpc.unary_unary_rpc_method_handler(
                     servicer.getMediasWithTag,
@@ -425,10 +598,20 @@ def add_DataLoaderServicer_to_server(servicer, server):
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
                     response_serializer=dataloader__pb2.RepeatedIdResponse.SerializeToString,
             ),
+            'getMediaTagLists': grpc.unary_stream_rpc_method_handler(
+                    servicer.getMediaTagLists,
+                    request_deserializer=dataloader__pb2.GetMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaTagListResponse.SerializeToString,
+            ),
+            'queryMedias': grpc.unary_stream_rpc_method_handler(
+                    servicer.queryMedias,
+                    request_deserializer=dataloader__pb2.QueryMediasRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingMediaBatchResponse.SerializeToString,
+            ),
             'createTagging': grpc.unary_unary_rpc_method_handler(
                     servicer.createTagging,
                     request_deserializer=dataloader__pb2.CreateTaggingRequest.FromString,
-                    response_serializer=dataloader__pb2.TaggingResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Tagging.SerializeToString,
             ),
             'createTaggingStream': grpc.stream_stream_rpc_method_handler(
                     servicer.createTaggingStream,
@@ -438,47 +621,77 @@ def add_DataLoaderServicer_to_server(servicer, server):
             'getHierarchies': grpc.unary_stream_rpc_method_handler(
                     servicer.getHierarchies,
                     request_deserializer=dataloader__pb2.GetHierarchiesRequest.FromString,
-                    response_serializer=dataloader__pb2.HierarchyResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.StreamingHierarchyResponse.SerializeToString,
             ),
             'getHierarchy': grpc.unary_unary_rpc_method_handler(
                     servicer.getHierarchy,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.HierarchyResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Hierarchy.SerializeToString,
             ),
             'createHierarchy': grpc.unary_unary_rpc_method_handler(
                     servicer.createHierarchy,
                     request_deserializer=dataloader__pb2.CreateHierarchyRequest.FromString,
-                    response_serializer=dataloader__pb2.HierarchyResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Hierarchy.SerializeToString,
             ),
             'getNodes': grpc.unary_stream_rpc_method_handler(
                     servicer.getNodes,
                     request_deserializer=dataloader__pb2.GetNodesRequest.FromString,
-                    response_serializer=dataloader__pb2.NodeResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.StreamingNodeResponse.SerializeToString,
+            ),
+            'getNodesBatched': grpc.unary_stream_rpc_method_handler(
+                    servicer.getNodesBatched,
+                    request_deserializer=dataloader__pb2.GetNodesRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingNodeBatchResponse.SerializeToString,
             ),
             'getNode': grpc.unary_unary_rpc_method_handler(
                     servicer.getNode,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.NodeResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Node.SerializeToString,
+            ),
+            'getNodesByIds': grpc.unary_stream_rpc_method_handler(
+                    servicer.getNodesByIds,
+                    request_deserializer=dataloader__pb2.RepeatedIdRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingNodeBatchResponse.SerializeToString,
+            ),
+            'getSubtree': grpc.unary_stream_rpc_method_handler(
+                    servicer.getSubtree,
+                    request_deserializer=dataloader__pb2.GetSubtreeRequest.FromString,
+                    response_serializer=dataloader__pb2.StreamingSubtreeResponse.SerializeToString,
             ),
             'createNode': grpc.unary_unary_rpc_method_handler(
                     servicer.createNode,
                     request_deserializer=dataloader__pb2.CreateNodeRequest.FromString,
-                    response_serializer=dataloader__pb2.NodeResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Node.SerializeToString,
             ),
             'createNodeStream': grpc.stream_stream_rpc_method_handler(
                     servicer.createNodeStream,
-                    request_deserializer=dataloader__pb2.CreateNodeRequest.FromString,
-                    response_serializer=dataloader__pb2.NodeResponse.SerializeToString,
+                    request_deserializer=dataloader__pb2.CreateNodeStreamRequest.FromString,
+                    response_serializer=dataloader__pb2.CreateNodeStreamResponse.SerializeToString,
             ),
             'deleteNode': grpc.unary_unary_rpc_method_handler(
                     servicer.deleteNode,
                     request_deserializer=dataloader__pb2.IdRequest.FromString,
-                    response_serializer=dataloader__pb2.StatusResponse.SerializeToString,
+                    response_serializer=dataloader__pb2.Empty.SerializeToString,
             ),
             'resetDatabase': grpc.unary_unary_rpc_method_handler(
                     servicer.resetDatabase,
-                    request_deserializer=dataloader__pb2.EmptyRequest.FromString,
-                    response_serializer=dataloader__pb2.StatusResponse.SerializeToString,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.Empty.SerializeToString,
+            ),
+            'refreshViews': grpc.unary_unary_rpc_method_handler(
+                    servicer.refreshViews,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.RefreshViewsResponse.SerializeToString,
+            ),
+            'getServerStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.getServerStats,
+                    request_deserializer=dataloader__pb2.Empty.FromString,
+                    response_serializer=dataloader__pb2.ServerStatsResponse.SerializeToString,
+            ),
+            'profile': grpc.unary_unary_rpc_method_handler(
+                    servicer.profile,
+                    request_deserializer=dataloader__pb2.ProfileRequest.FromString,
+                    response_serializer=dataloader__pb2.ProfileResponse.SerializeToString,
             ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
@@ -503,7 +716,24 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getMedias',
             dataloader__pb2.GetMediasRequest.SerializeToString,
-            dataloader__pb2.MediaResponse.FromString,
+            dataloader__pb2.StreamingMediaResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getMediasBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getMediasBatched',
+            dataloader__pb2.GetMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -520,7 +750,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getMediaById',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.MediaResponse.FromString,
+            dataloader__pb2.Media.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -537,7 +767,24 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getMediaByURI',
             dataloader__pb2.GetMediaByURIRequest.SerializeToString,
-            dataloader__pb2.MediaResponse.FromString,
+            dataloader__pb2.Media.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getMediasByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getMediasByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -553,8 +800,8 @@ class DataLoader(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createMedia',
-            dataloader__pb2.CreateMediaRequest.SerializeToString,
-            dataloader__pb2.MediaResponse.FromString,
+            dataloader__pb2.Media.SerializeToString,
+            dataloader__pb2.Media.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -570,7 +817,7 @@ class DataLoader(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.stream_stream(request_iterator, target, '/dataloader.DataLoader/createMediaStream',
-            dataloader__pb2.CreateMediaRequest.SerializeToString,
+            dataloader__pb2.Media.SerializeToString,
             dataloader__pb2.CreateMediaStreamResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -588,7 +835,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/deleteMedia',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.StatusResponse.FromString,
+            dataloader__pb2.Empty.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -605,7 +852,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTagSets',
             dataloader__pb2.GetTagSetsRequest.SerializeToString,
-            dataloader__pb2.TagSetResponse.FromString,
+            dataloader__pb2.StreamingTagSetResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -622,7 +869,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getTagSetById',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.TagSetResponse.FromString,
+            dataloader__pb2.TagSet.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -639,7 +886,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getTagSetByName',
             dataloader__pb2.GetTagSetRequestByName.SerializeToString,
-            dataloader__pb2.TagSetResponse.FromString,
+            dataloader__pb2.TagSet.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -656,7 +903,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createTagSet',
             dataloader__pb2.CreateTagSetRequest.SerializeToString,
-            dataloader__pb2.TagSetResponse.FromString,
+            dataloader__pb2.TagSet.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -673,7 +920,24 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTags',
             dataloader__pb2.GetTagsRequest.SerializeToString,
-            dataloader__pb2.TagResponse.FromString,
+            dataloader__pb2.StreamingTagResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getTagsBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTagsBatched',
+            dataloader__pb2.GetTagsRequest.SerializeToString,
+            dataloader__pb2.StreamingTagBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -690,7 +954,24 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getTag',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.TagResponse.FromString,
+            dataloader__pb2.Tag.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getTagsByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTagsByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingTagBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -707,7 +988,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createTag',
             dataloader__pb2.CreateTagRequest.SerializeToString,
-            dataloader__pb2.TagResponse.FromString,
+            dataloader__pb2.Tag.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -740,8 +1021,25 @@ class DataLoader(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTaggings',
-            dataloader__pb2.EmptyRequest.SerializeToString,
-            dataloader__pb2.TaggingResponse.FromString,
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.StreamingTaggingResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getTaggingsBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getTaggingsBatched',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.StreamingTaggingBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -779,6 +1077,40 @@ class DataLoader(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def getMediaTagLists(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getMediaTagLists',
+            dataloader__pb2.GetMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaTagListResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def queryMedias(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/queryMedias',
+            dataloader__pb2.QueryMediasRequest.SerializeToString,
+            dataloader__pb2.StreamingMediaBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def createTagging(request,
             target,
@@ -792,7 +1124,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createTagging',
             dataloader__pb2.CreateTaggingRequest.SerializeToString,
-            dataloader__pb2.TaggingResponse.FromString,
+            dataloader__pb2.Tagging.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -826,7 +1158,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getHierarchies',
             dataloader__pb2.GetHierarchiesRequest.SerializeToString,
-            dataloader__pb2.HierarchyResponse.FromString,
+            dataloader__pb2.StreamingHierarchyResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -843,7 +1175,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getHierarchy',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.HierarchyResponse.FromString,
+            dataloader__pb2.Hierarchy.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -860,7 +1192,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createHierarchy',
             dataloader__pb2.CreateHierarchyRequest.SerializeToString,
-            dataloader__pb2.HierarchyResponse.FromString,
+            dataloader__pb2.Hierarchy.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -877,7 +1209,24 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getNodes',
             dataloader__pb2.GetNodesRequest.SerializeToString,
-            dataloader__pb2.NodeResponse.FromString,
+            dataloader__pb2.StreamingNodeResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getNodesBatched(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getNodesBatched',
+            dataloader__pb2.GetNodesRequest.SerializeToString,
+            dataloader__pb2.StreamingNodeBatchResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -894,7 +1243,41 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getNode',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.NodeResponse.FromString,
+            dataloader__pb2.Node.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getNodesByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getNodesByIds',
+            dataloader__pb2.RepeatedIdRequest.SerializeToString,
+            dataloader__pb2.StreamingNodeBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getSubtree(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataloader.DataLoader/getSubtree',
+            dataloader__pb2.GetSubtreeRequest.SerializeToString,
+            dataloader__pb2.StreamingSubtreeResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -911,7 +1294,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/createNode',
             dataloader__pb2.CreateNodeRequest.SerializeToString,
-            dataloader__pb2.NodeResponse.FromString,
+            dataloader__pb2.Node.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -927,8 +1310,8 @@ class DataLoader(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.stream_stream(request_iterator, target, '/dataloader.DataLoader/createNodeStream',
-            dataloader__pb2.CreateNodeRequest.SerializeToString,
-            dataloader__pb2.NodeResponse.FromString,
+            dataloader__pb2.CreateNodeStreamRequest.SerializeToString,
+            dataloader__pb2.CreateNodeStreamResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -945,7 +1328,7 @@ class DataLoader(object):
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/deleteNode',
             dataloader__pb2.IdRequest.SerializeToString,
-            dataloader__pb2.StatusResponse.FromString,
+            dataloader__pb2.Empty.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
@@ -961,7 +1344,58 @@ class DataLoader(object):
             timeout=None,
             metadata=None):
         return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/resetDatabase',
-            dataloader__pb2.EmptyRequest.SerializeToString,
-            dataloader__pb2.StatusResponse.FromString,
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.Empty.FromString,
             options, channel_credentials,
-            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
\ No newline at end of file
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def refreshViews(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/refreshViews',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.RefreshViewsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def getServerStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/getServerStats',
+            dataloader__pb2.Empty.SerializeToString,
+            dataloader__pb2.ServerStatsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def profile(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/dataloader.DataLoader/profile',
+            dataloader__pb2.ProfileRequest.SerializeToString,
+            dataloader__pb2.ProfileResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -0,0 +1,78 @@
+-- Migration of an existing database to the statement-level triggers of ddl.sql:
+-- check_tagtype_matching (tags) and trigger_check_nodes_tagset (nodes) used to run one lookup per written row,
+-- they now check all the rows of a statement with one join on its transition table.
+-- Run once with: psql -U postgres -f migrate_statement_triggers.sql <database_name>
+-- It can be run again safely. update_db_tables.sql, for older schemas, includes the same changes.
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS check_tagtype_matching ON public.tags;
+DROP TRIGGER IF EXISTS check_tagtype_matching_update ON public.tags;
+DROP TRIGGER IF EXISTS trigger_check_nodes_tagset ON public.nodes;
+DROP TRIGGER IF EXISTS trigger_check_nodes_tagset_update ON public.nodes;
+
+-- Check that the type of tags correspond to the type of the tagset.
+-- Statement-level: the tags written by a statement are checked at once, with a single join on the tagsets
+CREATE OR REPLACE FUNCTION public.check_matching_tagtype()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF EXISTS (
+        SELECT 1
+        FROM new_tags t
+        LEFT JOIN public.tagsets s ON s.id = t.tagset_id
+        WHERE t.tagtype_id IS DISTINCT FROM s.tagtype_id
+    ) THEN
+        RAISE EXCEPTION 'Tagtype_id does not match the corresponding tagset''s tagtype_id';
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A trigger with transition tables handles a single event, hence one trigger for the inserts and one for the updates
+CREATE TRIGGER check_tagtype_matching
+AFTER INSERT ON public.tags
+REFERENCING NEW TABLE AS new_tags
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_matching_tagtype();
+
+CREATE TRIGGER check_tagtype_matching_update
+AFTER UPDATE ON public.tags
+REFERENCING NEW TABLE AS new_tags
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_matching_tagtype();
+
+-- Check that the tag belongs the the tagset of the hierachy, for all the nodes written by a statement at once
+CREATE OR REPLACE FUNCTION public.check_nodes_tagset()
+RETURNS TRIGGER AS
+$$
+BEGIN
+  IF EXISTS (
+    SELECT 1
+    FROM new_nodes n
+    WHERE NOT EXISTS (
+      SELECT 1
+      FROM public.tags t
+      JOIN public.hierarchies h ON t.tagset_id = h.tagset_id
+      WHERE t.id = n.tag_id AND h.id = n.hierarchy_id
+    )
+  ) THEN
+    RAISE EXCEPTION 'The tag_id does not belong to the correct tagset_id for this hierarchy.';
+  END IF;
+  RETURN NULL;
+END;
+$$
+LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_check_nodes_tagset
+AFTER INSERT ON public.nodes
+REFERENCING NEW TABLE AS new_nodes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_nodes_tagset();
+
+CREATE TRIGGER trigger_check_nodes_tagset_update
+AFTER UPDATE ON public.nodes
+REFERENCING NEW TABLE AS new_nodes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_nodes_tagset();
+
+COMMIT;
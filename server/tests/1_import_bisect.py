@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+import pytest
+import psycopg
+import app
+
+# These tests do not need the database: the connection only provides the savepoints, which do nothing here,
+# and the insert fails with an IntegrityError when the rows hold a bad value
+
+class FakeConnection:
+    def __init__(self):
+        self.transactions = 0
+
+    def transaction(self):
+        self.transactions += 1
+        return contextlib.nullcontext()
+
+class FakeAsyncConnection(FakeConnection):
+    def transaction(self):
+        self.transactions += 1
+        return contextlib.AsyncExitStack()
+
+def failing_insert(bad_rows):
+    def insert(rows):
+        if any(row in bad_rows for row in rows):
+            raise psycopg.IntegrityError("duplicate row %d" % next(row for row in rows if row in bad_rows))
+        return len(rows)
+    return insert
+
+def test_bisect():
+    # Without bad rows, the batch is inserted at once
+    conn, results, rejected = FakeConnection(), [], []
+    app.insert_or_bisect(conn, failing_insert(set()), list(range(100)), 0, results, rejected)
+    assert results == [100] and rejected == [] and conn.transactions == 1
+
+    # The bad rows are rejected with their index in the stream (offset + index in the batch), the others inserted
+    conn, results, rejected = FakeConnection(), [], []
+    app.insert_or_bisect(conn, failing_insert({3, 50, 99}), list(range(100)), 1000, results, rejected)
+    assert sum(results) == 97
+    assert [r.index for r in rejected] == [1003, 1050, 1099]
+    assert rejected[0].error.message == "IntegrityError('duplicate row 3')"
+    # k bad rows in a batch of n cost about 2 * k * log2(n) savepoints
+    assert conn.transactions <= 1 + 2 * 3 * 7
+
+    # Every row of the batch is bad
+    results, rejected = [], []
+    app.insert_or_bisect(FakeConnection(), failing_insert(set(range(8))), list(range(8)), 0, results, rejected)
+    assert results == [] and [r.index for r in rejected] == list(range(8))
+
+def test_previous_error():
+    # With the error of a previous attempt, the rows are split right away
+    conn, results, rejected = FakeConnection(), [], []
+    error = psycopg.IntegrityError("duplicate row 1")
+    app.insert_or_bisect(conn, failing_insert({1}), [0, 1], 0, results, rejected, error)
+    assert results == [1] and [r.index for r in rejected] == [1] and conn.transactions == 2
+
+def test_other_errors():
+    # The errors which are not caused by the rows fail the whole batch
+    def insert(rows):
+        raise psycopg.OperationalError("connection lost")
+    with pytest.raises(psycopg.OperationalError):
+        app.insert_or_bisect(FakeConnection(), insert, list(range(10)), 0, [], [])
+
+def test_bisect_async():
+    async def run():
+        insert = failing_insert({0, 7})
+        async def insert_async(rows):
+            return insert(rows)
+        results, rejected = [], []
+        await app.insert_or_bisect_async(FakeAsyncConnection(), insert_async, list(range(10)), 5, results, rejected)
+        return results, rejected
+    results, rejected = asyncio.run(run())
+    assert sum(results) == 8 and [r.index for r in rejected] == [5, 12]
+
+def test_read_batch():
+    # A batch holds the request that opens it and up to BATCH_SIZE - 1 more, the rest is left for the next batch
+    requests = iter(range(1, app.BATCH_SIZE + 10))
+    rows = []
+    assert list(app.read_batch(0, requests, rows, lambda request: request * 2)) == rows
+    assert rows == [request * 2 for request in range(app.BATCH_SIZE)]
+    assert next(requests) == app.BATCH_SIZE
@@ -0,0 +1,72 @@
+import pytest
+import grpc
+from google.rpc import status_pb2
+import dataloader_pb2 as rpc_objects
+import app
+
+def rpc_metrics(counts):
+    # RpcMetrics with the given number of calls in some of the latency buckets, by bucket index
+    rpc = app.RpcMetrics()
+    for i, n in counts.items():
+        rpc.buckets[i] = n
+    return rpc
+
+def test_quantile():
+    # Without calls
+    assert app.RpcMetrics().quantile(0.5) == 0.0
+
+    # Linear interpolation inside a bucket, the first one starting at 0
+    rpc = rpc_metrics({0: 10})
+    assert rpc.quantile(0.5) == pytest.approx(0.0005)
+    assert rpc.quantile(1.0) == pytest.approx(0.001)
+
+    # Half of the calls in (0.0025, 0.005], half in (0.01, 0.025]
+    rpc = rpc_metrics({2: 50, 4: 50})
+    assert rpc.quantile(0.5) == pytest.approx(0.005)
+    assert rpc.quantile(0.95) == pytest.approx(0.01 + 0.015 * 45 / 50)
+    assert rpc.quantile(0.01) == pytest.approx(0.0025 + 0.0025 * 1 / 50)
+
+    # The calls slower than the last bound are estimated at the last bound
+    rpc = rpc_metrics({len(app.LATENCY_BUCKETS): 3})
+    assert rpc.quantile(0.99) == app.LATENCY_BUCKETS[-1]
+
+def test_finished():
+    # Each call is counted once, in the bucket of its duration, with its error
+    metrics = app.Metrics()
+    start = metrics.started("getTag")
+    assert metrics.rpcs["getTag"].in_flight == 1
+    metrics.finished("getTag", start - 0.003, grpc.StatusCode.NOT_FOUND.name)
+    rpc = metrics.rpcs["getTag"]
+    assert rpc.calls == 1 and rpc.in_flight == 0
+    assert rpc.buckets[2] == 1 and sum(rpc.buckets) == 1
+    assert rpc.errors == {"NOT_FOUND": 1}
+
+def test_response_rows():
+    # A batch counts the rows of its repeated field, whatever the batch message
+    for response in (
+        rpc_objects.StreamingMediaBatchResponse(batch=rpc_objects.MediaBatch(medias=[rpc_objects.Media()] * 3)),
+        rpc_objects.StreamingTagBatchResponse(batch=rpc_objects.TagBatch(tags=[rpc_objects.Tag()] * 3)),
+        rpc_objects.StreamingTaggingBatchResponse(batch=rpc_objects.TaggingBatch(mediaIds=[1, 2, 3], tagIds=[4, 5, 6])),
+        rpc_objects.StreamingNodeBatchResponse(batch=rpc_objects.NodeBatch(nodes=[rpc_objects.Node()] * 3)),
+    ):
+        assert app.response_rows(response) == (3, 0, None)
+    assert set(app.BATCH_ROWS_FIELDS) <= set(rpc_objects.DESCRIPTOR.message_types_by_name)
+
+    # A single element counts one row
+    assert app.response_rows(rpc_objects.StreamingTagResponse(tag=rpc_objects.Tag())) == (1, 0, None)
+
+    # The errors are counted by status code, and the rejected requests of the import streams
+    error = status_pb2.Status(code=grpc.StatusCode.NOT_FOUND.value[0], message="NotFoundError()")
+    assert app.response_rows(rpc_objects.StreamingMediaBatchResponse(error=error)) == (0, 0, "NOT_FOUND")
+    response = rpc_objects.CreateMediaStreamResponse(count=10, rejected=[rpc_objects.RejectedRequest(index=4)])
+    assert app.response_rows(response) == (0, 1, None)
+
+def test_prometheus():
+    # The buckets of the histogram are cumulative, and their count is the number of calls
+    metrics = app.Metrics()
+    metrics.rpcs["getMedias"] = rpc_metrics({2: 50, 4: 50})
+    lines = metrics.prometheus().splitlines()
+    assert 'dataloader_rpc_duration_seconds_bucket{method="getMedias",le="0.005"} 50' in lines
+    assert 'dataloader_rpc_duration_seconds_bucket{method="getMedias",le="0.025"} 100' in lines
+    assert 'dataloader_rpc_duration_seconds_bucket{method="getMedias",le="+Inf"} 100' in lines
+    assert 'dataloader_rpc_duration_seconds_count{method="getMedias"} 100' in lines
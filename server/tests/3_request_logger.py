@@ -0,0 +1,60 @@
+import logging
+import app
+
+class FakeContext:
+    def __init__(self, request_id=None):
+        self.metadata = (("request-id", request_id),) if request_id is not None else ()
+        self.lookups = 0
+
+    def invocation_metadata(self):
+        self.lookups += 1
+        return self.metadata
+
+def test_request_id(caplog):
+    caplog.set_level(logging.DEBUG)
+
+    # The records are prefixed with the request ID sent by the client, looked up once and only when logging
+    context = FakeContext("0123456789ab")
+    log = app.request_logger(context, "testRequestId")
+    assert context.lookups == 0
+    log.info("Received %s request", "test")
+    log.debug("-> done")
+    assert [record.getMessage() for record in caplog.records] == ["[0123456789ab] Received test request", "[0123456789ab] -> done"]
+    assert caplog.records[0].name == "dataloader.testRequestId"
+    assert context.lookups == 1
+
+    # Without one, a random ID is used for all the records of the call
+    caplog.clear()
+    log = app.request_logger(FakeContext(), "testRequestId")
+    log.info("first")
+    log.info("second")
+    first, second = [record.getMessage() for record in caplog.records]
+    assert first.endswith("] first") and second == first.replace("first", "second")
+
+def test_sampling(caplog, monkeypatch):
+    caplog.set_level(logging.DEBUG)
+    monkeypatch.setitem(app.LOG_SAMPLING, "testSampling", 3)
+
+    # Only 1 call in 3 logs below WARNING
+    for i in range(9):
+        app.request_logger(FakeContext("call-%d" % i), "testSampling").info("Received request")
+    assert [record.getMessage() for record in caplog.records] == [
+        "[call-0] Received request", "[call-3] Received request", "[call-6] Received request"
+    ]
+
+    # The warnings and errors of every call are logged
+    caplog.clear()
+    for i in range(3):
+        app.request_logger(FakeContext("call-%d" % i), "testSampling").warning("-> %r", ValueError(i))
+    assert len(caplog.records) == 3
+
+def test_rpc_level(caplog):
+    caplog.set_level(logging.DEBUG)
+
+    # The level of a single RPC, as set by --rpc-log-level
+    caplog.set_level(logging.WARNING, logger="dataloader.testLevel")
+    log = app.request_logger(FakeContext("abc"), "testLevel")
+    log.info("hidden")
+    log.warning("shown")
+    assert [record.getMessage() for record in caplog.records] == ["[abc] shown"]
+    assert not log.isEnabledFor(logging.INFO)
@@ -0,0 +1,76 @@
+import os
+import threading
+from concurrent import futures
+import pytest
+import dataloader_pb2 as rpc_objects
+import app
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+def wait_for_connection(condition, stop):
+    # Stands for a worker waiting for a connection of the pool
+    with condition:
+        while not stop.is_set():
+            condition.wait(0.01)
+
+def test_sample_stacks(tmp_path):
+    stop = threading.Event()
+    condition = threading.Condition()
+    threads = [threading.Thread(target=busy_loop, args=(stop,)),
+               threading.Thread(target=wait_for_connection, args=(condition, stop))]
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    executor.submit(lambda: None).result()     # An idle worker
+    for thread in threads:
+        thread.start()
+    try:
+        response = app.Profiler(str(tmp_path)).profile(rpc_objects.ProfileRequest(duration=0.3, interval=0.002))
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        executor.shutdown()
+
+    assert response.samples > 10
+    with open(response.path) as file:
+        stacks = [line.rsplit(" ", 1)[0].split(";") for line in file]
+    # The busy thread and the lock wait are sampled, the idle worker is not
+    assert any("busy_loop" in frame for stack in stacks for frame in stack)
+    assert any("wait_for_connection" in frame for stack in stacks for frame in stack)
+    assert not any(stack[-1].startswith("_worker ") for stack in stacks)
+    # The entries count the samples of each function, itself (count) or with its callees (total)
+    assert all(entry.total >= entry.count > 0 for entry in response.entries)
+    assert len(response.entries) <= app.PROFILE_TOP
+
+def test_trace_allocations(tmp_path):
+    kept = []
+    def allocate():
+        kept.extend(bytearray(1024) for _ in range(1000))
+    thread = threading.Timer(0.05, allocate)
+    thread.start()
+    response = app.Profiler(str(tmp_path)).profile(rpc_objects.ProfileRequest(duration=0.3, memory=True, top=5))
+    thread.join()
+    assert response.path.endswith(".snapshot")
+    assert len(response.entries) <= 5
+    # The line of allocate holds the largest allocation, about 1 MB in 1000 blocks
+    assert response.entries[0].location.startswith(__file__)
+    assert response.entries[0].total >= 1000 * 1024
+
+def test_unique_paths(tmp_path):
+    # Profiles started in the same second are written in different files
+    profiler = app.Profiler(str(tmp_path))
+    paths = [profiler.profile(rpc_objects.ProfileRequest(duration=0.01)).path for _ in range(3)]
+    assert len(set(paths)) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in paths)
+
+def test_invalid_requests(tmp_path):
+    profiler = app.Profiler(str(tmp_path))
+    for duration in (0, -1, app.MAX_PROFILE_DURATION + 1):
+        with pytest.raises(app.InvalidArgumentError):
+            profiler.profile(rpc_objects.ProfileRequest(duration=duration))
+
+    # A single profile runs at a time
+    with profiler.lock:
+        with pytest.raises(app.ConflictError):
+            profiler.profile(rpc_objects.ProfileRequest(duration=0.1))
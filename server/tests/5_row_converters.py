@@ -0,0 +1,77 @@
+import datetime
+import pytest
+import dataloader_pb2 as rpc_objects
+import app
+
+# Rows as returned by TAGS_SQL, one per tag type, with the Python values psycopg loads
+TAG_COLUMNS = ("id", "tagtype_id", "tagset_id", "text_value", "timestamp_value", "time_value", "date_value", "num_value")
+TAG_ROWS = [
+    (1, 1, 10, "Paris", None, None, None, None),
+    (2, 2, 20, None, datetime.datetime(2019, 3, 16, 13, 17, 38), None, None),
+    (3, 3, 30, None, None, datetime.time(13, 17, 38), None),
+    (4, 4, 40, None, None, None, datetime.date(2019, 3, 16), None),
+    (5, 5, 50, None, None, None, None, 1080),
+]
+MEDIA_COLUMNS = ("id", "file_uri", "file_type", "thumbnail_uri")
+MEDIA_ROWS = [(1, "/lsc/20190316_131738_000.jpg", 1, "/thumbs/20190316_131738_000.jpg"), (2, "/lsc/a.mp3", 2, "")]
+
+def convert(converter, columns, message, row):
+    result = message()
+    converter(columns)(result, row)
+    return result
+
+def test_tags():
+    # Each tag is the same as the one of tag_from_row, used with dict rows
+    for row in TAG_ROWS:
+        tag = convert(app.tag_converter, TAG_COLUMNS, rpc_objects.Tag, row)
+        assert tag == app.tag_from_row(dict(zip(TAG_COLUMNS, row)))
+        assert tag.WhichOneof("value") == app.TAG_VALUE_FIELDS[row[1]][0]
+
+    tags = [convert(app.tag_converter, TAG_COLUMNS, rpc_objects.Tag, row) for row in TAG_ROWS]
+    assert tags[0].alphanumerical.value == "Paris"
+    assert tags[1].timestamp.value == "2019-03-16 13:17:38"
+    assert tags[2].time.value == "13:17:38"
+    assert tags[3].date.value == "2019-03-16"
+    assert tags[4].numerical.value == 1080
+    assert (tags[4].id, tags[4].tagSetId, tags[4].tagTypeId) == (5, 50, 5)
+
+    # A tag of an unknown type is left empty
+    assert convert(app.tag_converter, TAG_COLUMNS, rpc_objects.Tag, (6, 9, 60, None, None, None, None, None)) == rpc_objects.Tag()
+    assert app.tag_from_row({"id": 6, "tagtype_id": 9, "tagset_id": 60}) == rpc_objects.Tag()
+
+def test_tag_value_fields():
+    # The lookup table covers the value fields of the Tag message
+    fields = {field.name for field in rpc_objects.Tag.DESCRIPTOR.oneofs_by_name["value"].fields}
+    assert {field for field, _, _ in app.TAG_VALUE_FIELDS.values()} == fields
+
+def test_medias():
+    for row in MEDIA_ROWS:
+        assert convert(app.media_converter, MEDIA_COLUMNS, rpc_objects.Media, row) == app.media_from_row(dict(zip(MEDIA_COLUMNS, row)))
+
+    # The columns are found by name, whatever their order in the query
+    columns = ("file_type", "thumbnail_uri", "id", "file_uri")
+    row = (1, "/thumbs/a.jpg", 7, "/a.jpg")
+    assert convert(app.media_converter, columns, rpc_objects.Media, row) == rpc_objects.Media(
+        id=7, file_uri="/a.jpg", file_type=1, thumbnail_uri="/thumbs/a.jpg")
+
+    # A converter is built once per query shape
+    assert app.media_converter(MEDIA_COLUMNS) is app.media_converter(tuple(MEDIA_COLUMNS))
+    assert app.media_converter(MEDIA_COLUMNS) is not app.media_converter(columns)
+
+    # A query without one of the columns cannot be converted
+    with pytest.raises(ValueError):
+        app.media_converter(("id", "file_uri"))
+
+def test_media_tag_lists():
+    columns = MEDIA_COLUMNS + ("tag_ids",)
+    media_tag_list = convert(app.media_tag_list_converter, columns, rpc_objects.MediaTagList, MEDIA_ROWS[0] + ([3, 5],))
+    assert media_tag_list == rpc_objects.MediaTagList(media=app.media_from_row(dict(zip(MEDIA_COLUMNS, MEDIA_ROWS[0]))), tagIds=[3, 5])
+    assert list(convert(app.media_tag_list_converter, columns, rpc_objects.MediaTagList, MEDIA_ROWS[1] + ([],)).tagIds) == []
+
+def test_fill_batch():
+    # The messages are added to the batch of the response in the order of the rows
+    response = rpc_objects.StreamingTagBatchResponse()
+    app.fill_batch(response.batch.tags, app.tag_converter(TAG_COLUMNS), TAG_ROWS)
+    assert response.WhichOneof("message") == "batch"
+    assert [tag.id for tag in response.batch.tags] == [1, 2, 3, 4, 5]
+    assert app.response_rows(response) == (5, 0, None)
@@ -0,0 +1,5 @@
+# The tests import app.py and the generated modules of the server directory
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
@@ -33,44 +33,121 @@ SET tagtype_id = (
 );
 
 
--- Trigger to check that the type of tags correspond to the type of the tagset
+-- Triggers checking the tags and nodes, see also migrate_statement_triggers.sql.
+-- The row-level triggers of older schemas are dropped and replaced by statement-level triggers
+DROP TRIGGER IF EXISTS check_tagtype_matching ON public.tags;
+DROP TRIGGER IF EXISTS check_tagtype_matching_update ON public.tags;
+DROP TRIGGER IF EXISTS trigger_check_nodes_tagset ON public.nodes;
+DROP TRIGGER IF EXISTS trigger_check_nodes_tagset_update ON public.nodes;
+
+-- Check that the type of tags correspond to the type of the tagset.
+-- Statement-level: the tags written by a statement are checked at once, with a single join on the tagsets
 CREATE OR REPLACE FUNCTION public.check_matching_tagtype()
 RETURNS TRIGGER AS $$
 BEGIN
-    IF (NEW.tagtype_id IS DISTINCT FROM (SELECT tagtype_id FROM public.tagsets WHERE id = NEW.tagset_id)) THEN
+    IF EXISTS (
+        SELECT 1
+        FROM new_tags t
+        LEFT JOIN public.tagsets s ON s.id = t.tagset_id
+        WHERE t.tagtype_id IS DISTINCT FROM s.tagtype_id
+    ) THEN
         RAISE EXCEPTION 'Tagtype_id does not match the corresponding tagset''s tagtype_id';
     END IF;
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE OR REPLACE TRIGGER check_tagtype_matching
-BEFORE INSERT OR UPDATE ON public.tags
-FOR EACH ROW
+-- A trigger with transition tables handles a single event, hence one trigger for the inserts and one for the updates
+CREATE TRIGGER check_tagtype_matching
+AFTER INSERT ON public.tags
+REFERENCING NEW TABLE AS new_tags
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_matching_tagtype();
+
+CREATE TRIGGER check_tagtype_matching_update
+AFTER UPDATE ON public.tags
+REFERENCING NEW TABLE AS new_tags
+FOR EACH STATEMENT
 EXECUTE FUNCTION public.check_matching_tagtype();
 
--- Trigger to check, when creating a node, that the associated tag belongs to the tagset of the hierachy
+-- Check that the tag belongs the the tagset of the hierachy, for all the nodes written by a statement at once
 CREATE OR REPLACE FUNCTION public.check_nodes_tagset()
 RETURNS TRIGGER AS
 $$
-DECLARE
-  tagset_id_for_hierarchy INTEGER;
 BEGIN
-  IF NOT EXISTS (
+  IF EXISTS (
     SELECT 1
-    FROM public.tags t 
-    JOIN (SELECT tagset_id FROM public.hierarchies WHERE id = NEW.hierarchy_id) h
-    ON t.tagset_id = h.tagset_id
-    WHERE t.id = NEW.tag_id
+    FROM new_nodes n
+    WHERE NOT EXISTS (
+      SELECT 1
+      FROM public.tags t
+      JOIN public.hierarchies h ON t.tagset_id = h.tagset_id
+      WHERE t.id = n.tag_id AND h.id = n.hierarchy_id
+    )
   ) THEN
     RAISE EXCEPTION 'The tag_id does not belong to the correct tagset_id for this hierarchy.';
   END IF;
-  RETURN NEW;
+  RETURN NULL;
 END;
 $$
 LANGUAGE plpgsql;
 
-CREATE OR REPLACE TRIGGER trigger_check_nodes_tagset
-BEFORE INSERT OR UPDATE ON public.nodes
-FOR EACH ROW
-EXECUTE FUNCTION public.check_nodes_tagset();
\ No newline at end of file
+CREATE TRIGGER trigger_check_nodes_tagset
+AFTER INSERT ON public.nodes
+REFERENCING NEW TABLE AS new_nodes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_nodes_tagset();
+
+CREATE TRIGGER trigger_check_nodes_tagset_update
+AFTER UPDATE ON public.nodes
+REFERENCING NEW TABLE AS new_nodes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.check_nodes_tagset();
+
+-- Get or create a tag from its tagset, type and value (given as text and cast to the type of the typed table)
+-- Returns the tag with the value columns of the tag queries of the server, in a single call.
+-- A tag created concurrently by another transaction raises a unique violation and is read on the next iteration.
+CREATE OR REPLACE FUNCTION public.get_or_create_tag(p_tagset_id integer, p_tagtype_id integer, p_value text)
+RETURNS TABLE (
+    id integer,
+    tagtype_id integer,
+    tagset_id integer,
+    text_value text,
+    timestamp_value timestamp,
+    time_value time,
+    date_value date,
+    num_value integer
+) AS $$
+#variable_conflict use_column
+DECLARE
+    value_table text := (ARRAY['alphanumerical_tags', 'timestamp_tags', 'time_tags', 'date_tags', 'numerical_tags'])[p_tagtype_id];
+    value_type text := (ARRAY['text', 'timestamp', 'time', 'date', 'integer'])[p_tagtype_id];
+    tag_id integer;
+BEGIN
+    IF value_table IS NULL THEN
+        RAISE EXCEPTION 'Invalid tag type %', p_tagtype_id;
+    END IF;
+    LOOP
+        EXECUTE format('SELECT id FROM public.%I WHERE tagset_id = $1 AND name = $2::%s', value_table, value_type)
+            INTO tag_id USING p_tagset_id, p_value;
+        EXIT WHEN tag_id IS NOT NULL;
+        BEGIN
+            INSERT INTO public.tags (tagtype_id, tagset_id) VALUES (p_tagtype_id, p_tagset_id) RETURNING id INTO tag_id;
+            EXECUTE format('INSERT INTO public.%I (id, name, tagset_id) VALUES ($1, $2::%s, $3)', value_table, value_type)
+                USING tag_id, p_value, p_tagset_id;
+            EXIT;
+        EXCEPTION WHEN unique_violation THEN
+            tag_id := NULL;
+        END;
+    END LOOP;
+    RETURN QUERY SELECT
+        tag_id,
+        p_tagtype_id,
+        p_tagset_id,
+        CASE WHEN p_tagtype_id = 1 THEN p_value END,
+        CASE WHEN p_tagtype_id = 2 THEN p_value::timestamp END,
+        CASE WHEN p_tagtype_id = 3 THEN p_value::time END,
+        CASE WHEN p_tagtype_id = 4 THEN p_value::date END,
+        CASE WHEN p_tagtype_id = 5 THEN p_value::integer END;
+END;
+$$ LANGUAGE plpgsql;
@@ -20,11 +20,11 @@ returns setof nodes
 as '
 WITH RECURSIVE allsubtags AS(
     select N.id, N.tag_id, N.hierarchy_id, N.parentnode_id
-	from nodes N 
+	from public.nodes N 
 	where N.id = $1
     UNION ALL
     select N.id, N.tag_id, N.hierarchy_id, N.parentnode_id
-	from nodes N
+	from public.nodes N
 		join allsubtags A on A.id = N.parentnode_id
 )  select * from allsubtags
 ' language SQL;
@@ -50,17 +50,30 @@ as '
 	where N1.id = $1 and N1.hierarchy_id = $2
 ' language SQL;
 
+-- The materialisations used to be materialized views, rebuilt from scratch after each import.
+-- They are now tables maintained incrementally by the triggers below, so drop the old views if present
+do $$
+begin
+    if exists (select 1 from pg_matviews where schemaname = 'public' and matviewname = 'nodes_taggings') then
+        drop materialized view public.nodes_taggings cascade;
+    end if;
+    if exists (select 1 from pg_matviews where schemaname = 'public' and matviewname = 'tagsets_taggings') then
+        drop materialized view public.tagsets_taggings cascade;
+    end if;
+end$$;
+
 -- Full materialisation of parent_nodes --> nodes --> tags --> objects
-drop materialized view if exists nodes_taggings cascade;
-create materialized view nodes_taggings 
+-- A (node, tag, object) is stored once, even when the tag is on several nodes of the subtree
+drop table if exists nodes_taggings cascade;
+create table nodes_taggings
 as
-select H.parentnode_id, H.id as node_id, H.tag_id, R.object_id
+select distinct H.parentnode_id, H.id as node_id, H.tag_id, R.object_id
 from (select N.parentnode_id, N.id, (get_subtree_from_parent_node(N.id)).tag_id from nodes N) H
 	join taggings R on R.tag_id = H.tag_id;
 
 -- Full materialisation of tagsets --> tags --> objects
-drop materialized view if exists tagsets_taggings cascade;
-create materialized view tagsets_taggings
+drop table if exists tagsets_taggings cascade;
+create table tagsets_taggings
 as
 select T.tagset_id as tagset_id, R.tag_id, R.object_id
 from tags T 
@@ -68,12 +81,230 @@ from tags T
 
 -- Index on parent_nodes --> objects --> nodes (for grouping by child nodes)
 create index nodes_taggings_pid_oid_nid on nodes_taggings(parentnode_id, object_id, node_id);
--- Index on nodes --> objects (for retrieving cells)
-create index nodes_taggings_nid_oid on nodes_taggings(node_id, object_id);
--- Index on tagsets --> objects --> tags (tags matter here)
-create index tagsets_taggings_sid_oid_tid on tagsets_taggings(tagset_id, object_id, tag_id);
--- Index on tags --> objects
--- Currently, queries are run against taggings which has the same information
--- create index tagsets_taggings_tid_oid on tagsets_taggings(tag_id, object_id);
+-- Index on nodes --> objects (for retrieving cells), unique as it identifies the rows
+create unique index nodes_taggings_nid_oid_tid on nodes_taggings(node_id, object_id, tag_id);
+-- Index on tags --> objects (for the maintenance of the deleted taggings)
+create index nodes_taggings_tid_oid on nodes_taggings(tag_id, object_id);
+-- Index on tagsets --> objects --> tags (tags matter here), unique as it identifies the rows
+create unique index tagsets_taggings_sid_oid_tid on tagsets_taggings(tagset_id, object_id, tag_id);
+-- Index on tags --> objects (for the maintenance of the deleted taggings and of the tags moved to another tagset)
+create index tagsets_taggings_tid_oid on tagsets_taggings(tag_id, object_id);
+
+
+-- ==================================== INCREMENTAL MAINTENANCE ====================================
+-- Statement-level triggers: each INSERT, UPDATE or DELETE (e.g. a batch of createTaggingStream) updates the
+-- materialisations once, from its transition table, with work proportional to the rows it changed.
+-- Inserted tags need no maintenance, as a new tag has neither taggings nor nodes yet.
+
+-- New taggings: add them to the tagset of their tag, and to every node (and its ancestors) having their tag
+create or replace function public.nodes_taggings_insert_taggings()
+returns trigger
+as $$
+begin
+    insert into public.tagsets_taggings (tagset_id, tag_id, object_id)
+    select T.tagset_id, R.tag_id, R.object_id
+    from new_taggings R
+        join public.tags T on T.id = R.tag_id
+    on conflict do nothing;
+
+    with recursive ancestors as (
+        select N.id, N.parentnode_id, N.tag_id
+        from public.nodes N
+        where N.tag_id in (select tag_id from new_taggings)
+        union
+        select P.id, P.parentnode_id, A.tag_id
+        from ancestors A
+            join public.nodes P on P.id = A.parentnode_id
+    )
+    insert into public.nodes_taggings (parentnode_id, node_id, tag_id, object_id)
+    select A.parentnode_id, A.id, R.tag_id, R.object_id
+    from ancestors A
+        join new_taggings R on R.tag_id = A.tag_id
+    on conflict do nothing;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_insert_taggings on public.taggings;
+create trigger nodes_taggings_insert_taggings
+after insert on public.taggings
+referencing new table as new_taggings
+for each statement
+execute function public.nodes_taggings_insert_taggings();
+
+-- Deleted taggings (also when cascading from a deleted media or tag): a tagging is unique, so all its rows go
+create or replace function public.nodes_taggings_delete_taggings()
+returns trigger
+as $$
+begin
+    delete from public.tagsets_taggings S
+    using old_taggings R
+    where S.tag_id = R.tag_id and S.object_id = R.object_id;
+
+    delete from public.nodes_taggings S
+    using old_taggings R
+    where S.tag_id = R.tag_id and S.object_id = R.object_id;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_delete_taggings on public.taggings;
+create trigger nodes_taggings_delete_taggings
+after delete on public.taggings
+referencing old table as old_taggings
+for each statement
+execute function public.nodes_taggings_delete_taggings();
+
+-- Tags moved to another tagset
+create or replace function public.nodes_taggings_update_tags()
+returns trigger
+as $$
+begin
+    update public.tagsets_taggings S
+    set tagset_id = T.tagset_id
+    from new_tags T
+    where S.tag_id = T.id and S.tagset_id <> T.tagset_id;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_update_tags on public.tags;
+create trigger nodes_taggings_update_tags
+after update on public.tags
+referencing new table as new_tags
+for each statement
+execute function public.nodes_taggings_update_tags();
+
+-- New nodes: add the objects of their tag to them and to their ancestors
+create or replace function public.nodes_taggings_insert_nodes()
+returns trigger
+as $$
+begin
+    with recursive ancestors as (
+        select N.id, N.parentnode_id, N.tag_id
+        from new_nodes N
+        union
+        select P.id, P.parentnode_id, A.tag_id
+        from ancestors A
+            join public.nodes P on P.id = A.parentnode_id
+    )
+    insert into public.nodes_taggings (parentnode_id, node_id, tag_id, object_id)
+    select A.parentnode_id, A.id, A.tag_id, R.object_id
+    from ancestors A
+        join public.taggings R on R.tag_id = A.tag_id
+    on conflict do nothing;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_insert_nodes on public.nodes;
+create trigger nodes_taggings_insert_nodes
+after insert on public.nodes
+referencing new table as new_nodes
+for each statement
+execute function public.nodes_taggings_insert_nodes();
+
+-- Recomputes the rows of the given tags for the given nodes and their ancestors, after nodes were moved or deleted.
+-- A (node, tag) pair is kept only if the tag is still in the subtree of the node; only the nodes are traversed,
+-- the taggings are read for the given tags only
+drop function if exists public.nodes_taggings_recompute(int[], int[]) cascade;
+create function public.nodes_taggings_recompute(node_ids int[], tag_ids int[])
+returns void
+as $$
+declare
+    affected_ids int[];
+begin
+    with recursive ancestors as (
+        select N.id, N.parentnode_id
+        from public.nodes N
+        where N.id = any(node_ids)
+        union
+        select P.id, P.parentnode_id
+        from ancestors A
+            join public.nodes P on P.id = A.parentnode_id
+    )
+    select array_agg(id) into affected_ids from ancestors;
+
+    delete from public.nodes_taggings S
+    where S.node_id = any(affected_ids) and S.tag_id = any(tag_ids);
+
+    with recursive subtrees as (
+        select N.id as root_id, N.parentnode_id as root_parentnode_id, N.id, N.tag_id
+        from public.nodes N
+        where N.id = any(affected_ids)
+        union all
+        select S.root_id, S.root_parentnode_id, C.id, C.tag_id
+        from subtrees S
+            join public.nodes C on C.parentnode_id = S.id
+    )
+    insert into public.nodes_taggings (parentnode_id, node_id, tag_id, object_id)
+    select S.root_parentnode_id, S.root_id, S.tag_id, R.object_id
+    from subtrees S
+        join public.taggings R on R.tag_id = S.tag_id
+    where S.tag_id = any(tag_ids)
+    on conflict do nothing;
+end;
+$$ language plpgsql;
+
+-- Updated nodes (moved to another parent, or with another tag, e.g. by deleteNode): the moved nodes keep their
+-- rows with their new parent, and the tags of their subtrees are recomputed for their old and new ancestors
+create or replace function public.nodes_taggings_update_nodes()
+returns trigger
+as $$
+begin
+    update public.nodes_taggings S
+    set parentnode_id = N.parentnode_id
+    from new_nodes N
+    where S.node_id = N.id and S.parentnode_id is distinct from N.parentnode_id;
+
+    perform public.nodes_taggings_recompute(
+        array(select id from new_nodes union select parentnode_id from old_nodes where parentnode_id is not null),
+        array(select tag_id from old_nodes
+              union
+              select (public.get_subtree_from_parent_node(N.id)).tag_id from new_nodes N)
+    );
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_update_nodes on public.nodes;
+create trigger nodes_taggings_update_nodes
+after update on public.nodes
+referencing old table as old_nodes new table as new_nodes
+for each statement
+execute function public.nodes_taggings_update_nodes();
+
+-- Deleted nodes: their rows go, and their tags are recomputed for their ancestors
+create or replace function public.nodes_taggings_delete_nodes()
+returns trigger
+as $$
+begin
+    delete from public.nodes_taggings S
+    using old_nodes N
+    where S.node_id = N.id;
+
+    perform public.nodes_taggings_recompute(
+        array(select parentnode_id from old_nodes where parentnode_id is not null),
+        array(select tag_id from old_nodes)
+    );
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists nodes_taggings_delete_nodes on public.nodes;
+create trigger nodes_taggings_delete_nodes
+after delete on public.nodes
+referencing old table as old_nodes
+for each statement
+execute function public.nodes_taggings_delete_nodes();
+
+-- The bulk-load mode of the server sets session_replication_role to replica to skip the validation triggers and the
+-- foreign keys of ddl.sql, the maintenance triggers have to keep running in this mode
+alter table public.taggings enable always trigger nodes_taggings_insert_taggings;
+alter table public.taggings enable always trigger nodes_taggings_delete_taggings;
+alter table public.tags enable always trigger nodes_taggings_update_tags;
+alter table public.nodes enable always trigger nodes_taggings_insert_nodes;
+alter table public.nodes enable always trigger nodes_taggings_update_nodes;
+alter table public.nodes enable always trigger nodes_taggings_delete_nodes;
 
 SELECT NOW();